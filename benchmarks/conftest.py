@@ -0,0 +1,17 @@
+import pytest
+
+from .stubs import StubClient
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--aws-latency-ms",
+        type=float,
+        default=0.0,
+        help="Artificial latency of each stub AWS call, in milliseconds.",
+    )
+
+
+@pytest.fixture
+def stub_client(request: pytest.FixtureRequest) -> StubClient:
+    return StubClient(latency=request.config.getoption("--aws-latency-ms") / 1000)
@@ -0,0 +1,109 @@
+import json
+import threading
+import time
+from collections import Counter
+from typing import Annotated, Any
+
+from pydantic import create_model
+from pydantic_settings import BaseSettings
+
+from pydantic_settings_aws import (
+    SSM,
+    AWSBaseSettings,
+    AWSSettingsConfigDict,
+    ParameterStoreBaseSettings,
+    Secrets,
+    SecretsManagerBaseSettings,
+)
+
+
+class StubClient:
+    """boto3-like SSM and Secrets Manager client that sleeps ``latency`` seconds per call."""
+
+    def __init__(self, latency: float = 0.0, secret: dict[str, Any] | None = None) -> None:
+        self.latency = latency
+        self.secret_string = json.dumps(secret or {})
+        self.calls: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def get_parameter(self, Name: str, WithDecryption: bool | None = None) -> dict[str, Any]:
+        self._call("get_parameter")
+        return {"Parameter": {"Name": Name, "Value": "value", "Version": 1}}
+
+    def get_parameters(
+        self, Names: list[str], WithDecryption: bool | None = None
+    ) -> dict[str, Any]:
+        self._call("get_parameters")
+        return {
+            "Parameters": [
+                {"Name": name, "Value": "value", "Version": 1} for name in Names
+            ],
+            "InvalidParameters": [],
+        }
+
+    def get_secret_value(self, **kwargs: Any) -> dict[str, Any]:
+        self._call("get_secret_value")
+        return {"SecretString": self.secret_string, "VersionId": "v1"}
+
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset(self) -> None:
+        self.calls.clear()
+
+    def _call(self, method: str) -> None:
+        with self._lock:
+            self.calls[method] += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+
+def make_parameter_store_settings(
+    n_fields: int, client: StubClient
+) -> type[BaseSettings]:
+    fields: dict[str, Any] = {
+        f"field_{i}": (Annotated[str, f"/bench/param/{i}"], ...) for i in range(n_fields)
+    }
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=client)
+
+    return create_model(f"ParameterStore{n_fields}", __base__=Settings, **fields)
+
+
+def make_secrets_manager_settings(
+    n_fields: int, client: StubClient
+) -> type[BaseSettings]:
+    client.secret_string = json.dumps({f"field_{i}": "value" for i in range(n_fields)})
+    fields: dict[str, Any] = {f"field_{i}": (str, ...) for i in range(n_fields)}
+
+    class Settings(SecretsManagerBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            secrets_name="bench/secret", secrets_client=client
+        )
+
+    return create_model(f"SecretsManager{n_fields}", __base__=Settings, **fields)
+
+
+def make_aws_settings(n_fields: int, client: StubClient) -> type[BaseSettings]:
+    """Half of the fields are read from SSM, the other half from a single secret."""
+    client.secret_string = json.dumps({f"field_{i}": "value" for i in range(n_fields)})
+    fields: dict[str, Any] = {
+        f"field_{i}": (
+            Annotated[str, SSM(name=f"/bench/param/{i}")]
+            if i % 2
+            else Annotated[str, Secrets()],
+            ...,
+        )
+        for i in range(n_fields)
+    }
+
+    class Settings(AWSBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            ssm_client=client,
+            secrets_client=client,
+            secrets_name="bench/secret",
+        )
+
+    return create_model(f"AWS{n_fields}", __base__=Settings, **fields)
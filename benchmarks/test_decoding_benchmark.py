@@ -0,0 +1,42 @@
+import importlib.util
+import json
+from typing import Any
+
+import pytest
+
+from pydantic_settings_aws import decoding
+
+# about 60 KB of JSON: a large certificate bundle next to a few credentials
+SECRET = json.dumps(
+    {
+        "username": "admin",
+        "password": "password",
+        **{f"certificate_{i}": "x" * 590 for i in range(100)},
+    }
+).encode("utf-8")
+
+FIELD_KEYS = {"few keys": ["username", "password"], "whole document": None}
+
+BACKENDS = [
+    pytest.param(
+        name,
+        marks=pytest.mark.skipif(
+            name != "json" and importlib.util.find_spec(name) is None,
+            reason=f"{name} is not installed",
+        ),
+    )
+    for name in decoding.JSON_BACKENDS
+]
+
+
+@pytest.mark.parametrize("keys", list(FIELD_KEYS))
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_secret_decoding(benchmark: Any, backend: str, keys: str) -> None:
+    json_backend = decoding.get_json_backend(backend)  # type: ignore[arg-type]
+    benchmark.extra_info["secret_bytes"] = len(SECRET)
+
+    content = benchmark(
+        decoding.decode_json_object, SECRET, FIELD_KEYS[keys], json_backend
+    )
+
+    assert content["username"] == "admin"
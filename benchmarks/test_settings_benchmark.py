@@ -0,0 +1,77 @@
+import math
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from pydantic_settings import BaseSettings
+
+from pydantic_settings_aws.aws import GET_PARAMETERS_MAX_NAMES
+
+from .stubs import (
+    StubClient,
+    make_aws_settings,
+    make_parameter_store_settings,
+    make_secrets_manager_settings,
+)
+
+FIELD_COUNTS = [1, 10, 100, 1000]
+
+
+def expected_parameter_store_calls(n_fields: int) -> int:
+    return math.ceil(n_fields / GET_PARAMETERS_MAX_NAMES)
+
+
+def expected_secrets_manager_calls(n_fields: int) -> int:
+    return 1
+
+
+def expected_aws_calls(n_fields: int) -> int:
+    ssm_fields = n_fields // 2
+    return math.ceil(ssm_fields / GET_PARAMETERS_MAX_NAMES) + 1
+
+
+SETTINGS = {
+    "ParameterStoreBaseSettings": (
+        make_parameter_store_settings,
+        expected_parameter_store_calls,
+    ),
+    "SecretsManagerBaseSettings": (
+        make_secrets_manager_settings,
+        expected_secrets_manager_calls,
+    ),
+    "AWSBaseSettings": (make_aws_settings, expected_aws_calls),
+}
+
+
+@pytest.mark.parametrize("n_fields", FIELD_COUNTS)
+@pytest.mark.parametrize("base", list(SETTINGS))
+def test_settings_instantiation(
+    benchmark: Any, stub_client: StubClient, base: str, n_fields: int
+) -> None:
+    make_settings, expected_calls = SETTINGS[base]
+    settings_cls: type[BaseSettings] = make_settings(n_fields, stub_client)
+
+    # a single instrumented instantiation gates the number of AWS calls and
+    # records the allocations, then the benchmark measures the latency
+    calls, peak_bytes = measure_instantiation(settings_cls, stub_client)
+    benchmark.extra_info["aws_calls"] = calls
+    benchmark.extra_info["peak_allocated_bytes"] = peak_bytes
+
+    assert calls == expected_calls(n_fields)
+
+    benchmark(settings_cls)
+
+
+def measure_instantiation(
+    settings_cls: Callable[[], BaseSettings], client: StubClient
+) -> tuple[int, int]:
+    client.reset()
+    tracemalloc.start()
+    try:
+        settings_cls()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return client.total_calls(), peak_bytes
@@ -1,3 +1,6 @@
+from .bulk import LoadResult, load_many
+from .cache import ValueCache, value_cache
+from .clients import ClientPool, client_pool
 from .config import AWSSettingsConfigDict
 from .errors import (
     AWSClientError,
@@ -10,12 +13,37 @@ from .errors import (
     SecretsManagerError,
     SSMError,
 )
+from .extension import LambdaExtensionClient
 from .fields import SSM, Secrets
+from .instrumentation import (
+    OpenTelemetrySpanHook,
+    Span,
+    SpanHook,
+    add_span_hook,
+    remove_span_hook,
+)
+from .invalidation import (
+    ChangeEvent,
+    ChangeInvalidator,
+    EventFeed,
+    SQSEventBatch,
+    SQSEventFeed,
+    parse_change_event,
+)
+from .prefork import after_fork_in_child, clear_prewarmed, prewarm
+from .refresh import RefreshingSettings
+from .regions import MultiRegionClient, RegionLatencies, RegionLatency, region_latencies
+from .resolution import ResolutionContext, ResolutionStats
 from .settings import (
     AWSBaseSettings,
+    LazyAWSBaseSettings,
+    LazyParameterStoreBaseSettings,
     ParameterStoreBaseSettings,
     SecretsManagerBaseSettings,
 )
+from .singleflight import SingleFlight, SingleFlightStats, single_flight
+from .snapshot import SnapshotStats, SnapshotStore, snapshot_metrics
+from .throttling import Throttler, ThrottleStats, throttler
 from .version import VERSION
 
 __all__ = [
@@ -23,17 +51,56 @@ __all__ = [
     "AWSClientError",
     "AWSSettingsConfigDict",
     "AWSSettingsConfigError",
+    "ChangeEvent",
+    "ChangeInvalidator",
+    "ClientPool",
+    "EventFeed",
+    "LambdaExtensionClient",
+    "LazyAWSBaseSettings",
+    "LazyParameterStoreBaseSettings",
+    "LoadResult",
+    "MultiRegionClient",
+    "OpenTelemetrySpanHook",
     "ParameterNotFoundError",
     "ParameterStoreBaseSettings",
     "PydanticSettingsAWSError",
+    "RefreshingSettings",
+    "RegionLatencies",
+    "RegionLatency",
+    "ResolutionContext",
+    "ResolutionStats",
     "SecretContentError",
     "SecretDecodeError",
     "SecretNotFoundError",
     "Secrets",
     "SecretsManagerBaseSettings",
     "SecretsManagerError",
+    "SingleFlight",
+    "SingleFlightStats",
+    "SnapshotStats",
+    "SnapshotStore",
+    "Span",
+    "SpanHook",
     "SSM",
     "SSMError",
+    "SQSEventBatch",
+    "SQSEventFeed",
+    "ThrottleStats",
+    "Throttler",
+    "ValueCache",
+    "add_span_hook",
+    "after_fork_in_child",
+    "clear_prewarmed",
+    "client_pool",
+    "load_many",
+    "parse_change_event",
+    "prewarm",
+    "region_latencies",
+    "remove_span_hook",
+    "single_flight",
+    "snapshot_metrics",
+    "throttler",
+    "value_cache",
 ]
 
 __version__ = VERSION
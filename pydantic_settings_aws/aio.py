@@ -0,0 +1,310 @@
+import asyncio
+import functools
+import inspect
+import weakref
+from collections.abc import Collection
+from contextlib import AsyncExitStack
+from typing import Any
+
+from pydantic_settings import BaseSettings
+
+from . import aws, boto, instrumentation, throttling
+from .errors import AWSClientError
+from .logger import logger
+from .models import AwsSession
+
+_SERVICES: dict[str, tuple[aws.AWSService, aws.ClientParam]] = {
+    "ssm": ("ssm", "ssm_client"),
+    "secrets": ("secretsmanager", "secrets_client"),
+}
+
+
+class AsyncClientPool:
+    """aiobotocore clients shared by every settings class loaded on an event loop.
+
+    Clients are created on first use, one per service and session key, and are
+    kept open until :meth:`close` is called.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+        self._exit_stack = AsyncExitStack()
+
+    async def get_client(
+        self,
+        session_args: AwsSession,
+        service: aws.AWSService,
+        config_args: dict[str, Any] | None = None,
+    ) -> Any:
+        """Return the aiobotocore client for ``service``, creating it if needed.
+
+        Raises:
+            AWSClientError: If aiobotocore is not installed or the client cannot
+                be created.
+        """
+        cache_key = aws.get_client_key(session_args, service, config_args)
+
+        async with self._lock:
+            if cache_key in self._clients:
+                return self._clients[cache_key]
+
+            try:
+                from aiobotocore.config import AioConfig  # type: ignore[import-not-found]
+                from aiobotocore.session import AioSession  # type: ignore[import-not-found]
+            except ImportError as e:
+                raise AWSClientError(
+                    "aiobotocore is required to load settings asynchronously, "
+                    "install it with 'pip install pydantic-settings-aws[async]'"
+                ) from e
+
+            with instrumentation.span(instrumentation.CREATE_CLIENT, service=service):
+                try:
+                    session = AioSession(profile=session_args.aws_profile)
+                    client = await self._exit_stack.enter_async_context(
+                        session.create_client(
+                            service,
+                            config=AioConfig(**config_args) if config_args else None,
+                            **session_args.model_dump(
+                                by_alias=True,
+                                exclude={"aws_profile"},
+                                exclude_none=True,
+                            ),
+                        )
+                    )
+                except Exception as e:
+                    raise AWSClientError(
+                        f"Failed to create aiobotocore client for '{service}': {e}"
+                    ) from e
+
+            self._clients[cache_key] = client
+
+        return client
+
+    async def close(self) -> None:
+        """Close every client of the pool."""
+        async with self._lock:
+            await self._exit_stack.aclose()
+            self._exit_stack = AsyncExitStack()
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, client: Any) -> bool:
+        return any(pooled is client for pooled in self._clients.values())
+
+
+_client_pools: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, AsyncClientPool
+] = weakref.WeakKeyDictionary()
+
+
+def get_client_pool() -> AsyncClientPool:
+    """Return the client pool of the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _client_pools.get(loop)
+
+    if pool is None:
+        pool = _client_pools[loop] = AsyncClientPool()
+
+    return pool
+
+
+def _after_fork_in_child() -> None:
+    # the event loops of the parent don't run in the child
+    _client_pools.clear()
+
+
+async def close_client_pool() -> None:
+    """Close the aiobotocore clients created on the running event loop."""
+    await get_client_pool().close()
+
+
+async def get_client(settings: type[BaseSettings], service: str) -> Any:
+    """Return the client configured for ``settings`` and the ``service`` metadata.
+
+    Args:
+        settings (type[BaseSettings]): The settings class being built.
+        service (str): ``"ssm"`` or ``"secrets"``, as used in field metadata.
+
+    Returns:
+        Any: The ``ssm_client`` or ``secrets_client`` of ``settings`` when set,
+            otherwise a pooled aiobotocore client.
+    """
+    aws_service, client_param = _SERVICES[service]
+    client = settings.model_config.get(client_param)
+
+    if client:
+        logger.debug("Will use client from model config %s", client_param)
+        return client
+
+    return await get_client_pool().get_client(
+        aws.get_session_args(settings),
+        aws_service,
+        aws.get_client_config_args(settings),
+    )
+
+
+async def get_ssm_contents(
+    settings: type[BaseSettings], client: Any, ssm_names: list[str]
+) -> dict[str, str | None]:
+    """Async counterpart of :func:`aws.get_ssm_contents`.
+
+    The ``GetParameters`` requests of every chunk of 10 names run concurrently.
+    """
+    names = list(dict.fromkeys(ssm_names))
+
+    with instrumentation.span(
+        instrumentation.GET_PARAMETERS, service="ssm", count=len(names)
+    ) as span:
+        cache_keys, cached = aws.get_cached_ssm_contents(settings, client, names)
+        span.set_attribute("cache_hits", len(cached))
+
+        ssm_responses = await asyncio.gather(
+            *(
+                call_client(
+                    settings,
+                    "ssm",
+                    client,
+                    "get_parameters",
+                    Names=chunk,
+                    WithDecryption=True,
+                )
+                for chunk in aws.get_parameters_chunks(names, cached)
+            )
+        )
+        span.set_attribute("requests", len(ssm_responses))
+
+        return aws.read_ssm_contents(
+            settings, cache_keys, cached, list(ssm_responses)
+        )
+
+
+async def get_ssm_path_contents(
+    settings: type[BaseSettings],
+    client: Any,
+    ssm_path: str,
+    recursive: bool = False,
+) -> dict[str, str | None]:
+    """Async counterpart of :func:`aws.get_ssm_path_contents`."""
+    with instrumentation.span(
+        instrumentation.GET_PARAMETERS_BY_PATH, service="ssm", name=ssm_path
+    ) as span:
+        cache_key = aws.get_value_cache_key(
+            settings, "ssm", client, aws.get_ssm_path_cache_name(ssm_path, recursive)
+        )
+        if cache_key:
+            hit, value = aws.get_cached_value(cache_key)
+            span.set_attribute("cache_hit", hit)
+            if hit:
+                logger.debug("Parameters under %s found in the value cache", ssm_path)
+                return value
+
+        contents: dict[str, str | None] = {}
+        next_token: str | None = None
+        requests = 0
+
+        while True:
+            logger.debug("Getting a page of parameters under %s", ssm_path)
+            ssm_response = await call_client(
+                settings,
+                "ssm",
+                client,
+                "get_parameters_by_path",
+                **aws.get_parameters_by_path_args(ssm_path, recursive, next_token),
+            )
+            requests += 1
+            next_token = aws.read_ssm_path_contents(ssm_response, contents)
+
+            if not next_token:
+                break
+
+        span.set_attribute("requests", requests)
+        span.set_attribute("count", len(contents))
+
+        if cache_key:
+            aws.set_cached_value(settings, cache_key, contents)
+
+        return contents
+
+
+async def get_secrets_content(
+    settings: type[BaseSettings],
+    client: Any = None,
+    secrets_name: str | None = None,
+    keys: Collection[str] | None = None,
+) -> dict[str, Any]:
+    """Async counterpart of :func:`aws.get_secrets_content`."""
+    if not client:
+        client = await get_client(settings, "secrets")
+
+    secrets_args = aws.get_secrets_args(settings, secrets_name)
+
+    with instrumentation.span(
+        instrumentation.GET_SECRET_VALUE,
+        service="secretsmanager",
+        name=secrets_args.secrets_name,
+    ) as span:
+        cache_key = aws.get_secrets_cache_key(settings, client, secrets_args, keys)
+        if cache_key:
+            hit, value = aws.get_cached_value(cache_key)
+            span.set_attribute("cache_hit", hit)
+            if hit:
+                logger.debug("Secrets manager value found in the value cache")
+                return value
+
+        logger.debug("Getting secrets manager value with async client")
+        try:
+            secret_response = await call_client(
+                settings,
+                "secretsmanager",
+                client,
+                "get_secret_value",
+                **secrets_args.model_dump(by_alias=True, exclude_none=True),
+            )
+        except boto.client_errors() as e:
+            aws.raise_for_secrets_client_error(e, secrets_args)
+            raise
+
+    json_content = aws.read_secrets_content(secret_response, secrets_args, keys)
+
+    if cache_key:
+        aws.set_cached_value(settings, cache_key, json_content)
+
+    return json_content
+
+
+async def call_client(
+    settings: type[BaseSettings],
+    service: aws.AWSService,
+    client: Any,
+    method: str,
+    **kwargs: Any,
+) -> Any:
+    """Async counterpart of :func:`aws.call_client`."""
+
+    def get_throttle_key() -> throttling.ThrottleKey:
+        if client in get_client_pool():
+            return aws.get_session_args(settings).session_key(), service
+
+        return aws.get_injected_client_key(client), service
+
+    return await throttling.acall(
+        settings,
+        get_throttle_key,
+        functools.partial(call, getattr(client, method), **kwargs),
+    )
+
+
+async def call(method: Any, **kwargs: Any) -> Any:
+    """Call a client method without blocking the event loop.
+
+    Methods of async clients, like aiobotocore's, are awaited. Methods of sync
+    clients, like a boto3 client injected through ``ssm_client``, run on a
+    worker thread.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(**kwargs)
+
+    return await asyncio.to_thread(method, **kwargs)
@@ -1,12 +1,17 @@
-import json
-import threading
-from typing import Any, Literal
+import functools
+import itertools
+import weakref
+from collections.abc import Collection, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Literal, NoReturn
 
-import boto3  # type: ignore[import-untyped]
-from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 from pydantic import ValidationError
 from pydantic_settings import BaseSettings
 
+from . import boto, decoding, instrumentation, throttling, utils
+from .cache import ValueCacheKey, value_cache
+from .clients import client_pool
 from .errors import (
     AWSClientError,
     AWSSettingsConfigError,
@@ -14,17 +19,76 @@ from .errors import (
     SecretContentError,
     SecretDecodeError,
     SecretNotFoundError,
+    SecretsManagerError,
 )
+from .extension import DEFAULT_TIMEOUT, LambdaExtensionClient
 from .fields import SSM
 from .logger import logger
 from .models import AwsSecretsArgs, AwsSession
+from .regions import MultiRegionClient
+from .singleflight import single_flight
+
+if TYPE_CHECKING:
+    from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 
 AWSService = Literal["ssm", "secretsmanager"]
 
 ClientParam = Literal["secrets_client", "ssm_client"]
 
-_client_cache: dict[str, Any] = {}
-_client_cache_lock = threading.Lock()
+GET_PARAMETERS_MAX_NAMES = 10
+
+GET_PARAMETERS_BY_PATH_MAX_RESULTS = 10
+
+BATCH_GET_SECRET_VALUE_MAX_IDS = 20
+
+# tokens are never reused, unlike ``id()`` of garbage collected clients
+_injected_client_tokens: weakref.WeakKeyDictionary[Any, str] = (
+    weakref.WeakKeyDictionary()
+)
+_injected_client_counter = itertools.count()
+
+VersionKey = tuple[AWSService, str]
+
+_recorded_versions: ContextVar[dict[VersionKey, str | None] | None] = ContextVar(
+    "pydantic_settings_aws_recorded_versions", default=None
+)
+
+
+@contextmanager
+def record_versions() -> Iterator[dict[VersionKey, str | None]]:
+    """Record the version of every parameter and secret fetched in the block.
+
+    The yielded dict maps ``(service, name)`` to the SSM parameter ``Version``
+    or the secret ``VersionId``. While versions are recorded, values are always
+    fetched from AWS: the value cache is written but not read, so that the
+    versions are the current ones.
+    """
+    versions: dict[VersionKey, str | None] = {}
+    token = _recorded_versions.set(versions)
+    try:
+        yield versions
+    finally:
+        _recorded_versions.reset(token)
+
+
+def record_version(service: AWSService, name: str, version: Any) -> None:
+    """Record the version of a fetched value if :func:`record_versions` is active."""
+    versions = _recorded_versions.get()
+    if versions is not None:
+        versions[(service, name)] = None if version is None else str(version)
+
+
+def is_recording_versions() -> bool:
+    """Return whether :func:`record_versions` is active."""
+    return _recorded_versions.get() is not None
+
+
+def get_cached_value(cache_key: ValueCacheKey) -> tuple[bool, Any]:
+    """Return ``(True, value)`` for a fresh value cache entry, ``(False, None)`` otherwise."""
+    if is_recording_versions():
+        return False, None
+
+    return value_cache.get(cache_key)
 
 
 def get_ssm_content(
@@ -32,6 +96,109 @@ def get_ssm_content(
     field_name: str,
     ssm_info: dict[str, Any] | str | SSM | None = None,
 ) -> str | None:
+    ssm_name, client = get_ssm_name_and_client(settings, field_name, ssm_info)
+
+    with instrumentation.span(
+        instrumentation.GET_PARAMETER, service="ssm", name=ssm_name
+    ) as span:
+        cache_key = get_value_cache_key(settings, "ssm", client, ssm_name)
+        if cache_key:
+            hit, value = get_cached_value(cache_key)
+            span.set_attribute("cache_hit", hit)
+            if hit:
+                logger.debug("Parameter %s value found in the value cache", ssm_name)
+                return value
+
+        logger.debug("Getting parameter %s value with boto3 client", ssm_name)
+        try:
+            ssm_response: dict[str, Any] = call_client(
+                settings,
+                "ssm",
+                client,
+                "get_parameter",
+                Name=ssm_name,
+                WithDecryption=True,
+            )
+        except boto.client_errors() as e:
+            if e.response["Error"]["Code"] == "ParameterNotFound":
+                raise ParameterNotFoundError(
+                    f"Parameter '{ssm_name}' not found in SSM Parameter Store",
+                    ssm_name,
+                ) from e
+            raise
+
+    parameter = ssm_response.get("Parameter", {})
+    ssm_value: str | None = parameter.get("Value", None)
+    record_version("ssm", ssm_name, parameter.get("Version"))
+
+    if cache_key:
+        set_cached_value(settings, cache_key, ssm_value)
+
+    return ssm_value
+
+
+def call_client(
+    settings: type[BaseSettings],
+    service: AWSService,
+    client: Any,
+    method: str,
+    **kwargs: Any,
+) -> Any:
+    """Call ``method`` of ``client`` with the throttling options of ``settings``.
+
+    Requests are rate limited per session key and service, see
+    :class:`throttling.Throttler`. Concurrent identical requests, with the
+    same client, method and arguments, are sent once: the callers share the
+    response, or the error, of the request in flight.
+    """
+    return single_flight.do(
+        (id(client), method, _freeze_args(kwargs)),
+        functools.partial(
+            throttling.call,
+            settings,
+            lambda: (_get_session_key(settings, service, client), service),
+            functools.partial(getattr(client, method), **kwargs),
+        ),
+    )
+
+
+def _freeze_args(kwargs: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
+    return tuple(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(kwargs.items())
+    )
+
+
+def get_ssm_name_and_client(
+    settings: type[BaseSettings],
+    field_name: str,
+    ssm_info: dict[str, Any] | str | SSM | None = None,
+) -> tuple[str, Any]:
+    """Resolve the parameter name and the boto3 client to use for a field.
+
+    Args:
+        settings (type[BaseSettings]): The settings class being built.
+        field_name (str): The model field name, used as the parameter name
+            when ``ssm_info`` does not specify one.
+        ssm_info (dict | str | SSM | None): The field's SSM metadata.
+
+    Returns:
+        tuple[str, Any]: The parameter name and the boto3 SSM client.
+    """
+    ssm_name, client = get_ssm_name(field_name, ssm_info)
+
+    return ssm_name, get_ssm_client(settings, client)
+
+
+def get_ssm_name(
+    field_name: str,
+    ssm_info: dict[str, Any] | str | SSM | None = None,
+) -> tuple[str, Any]:
+    """Resolve the parameter name and the per-field client of a field.
+
+    Returns:
+        tuple[str, Any]: The parameter name and the client specified in the
+            field's metadata, or ``None``.
+    """
     client = None
     ssm_name = field_name
 
@@ -55,44 +222,514 @@ def get_ssm_content(
     else:
         logger.debug("Will try to find a parameter with the parameter name")
 
-    if not client:
-        logger.debug("Boto3 client not specified in metadata")
-        client = _create_client_from_settings(settings, "ssm", "ssm_client")
+    return ssm_name, client
 
-    logger.debug(f"Getting parameter {ssm_name} value with boto3 client")
-    try:
-        ssm_response: dict[str, Any] = client.get_parameter(
-            Name=ssm_name, WithDecryption=True
+
+def get_ssm_client(settings: type[BaseSettings], client: Any = None) -> Any:
+    """Return ``client`` or the SSM client configured for ``settings``.
+
+    Args:
+        settings (type[BaseSettings]): The settings class being built.
+        client: A per-field client, usually from an :class:`SSM` descriptor.
+
+    Returns:
+        Any: The boto3 SSM client to use.
+    """
+    if client:
+        return client
+
+    logger.debug("Boto3 client not specified in metadata")
+    return _create_client_from_settings(settings, "ssm", "ssm_client")
+
+
+def get_ssm_contents(
+    settings: type[BaseSettings],
+    client: Any,
+    ssm_names: list[str],
+    skip_invalid: bool = False,
+) -> dict[str, str | None]:
+    """Fetch several parameters with ``GetParameters``, in chunks of 10 names.
+
+    Names already present in the value cache are not requested again.
+
+    Args:
+        settings (type[BaseSettings]): The settings class being built.
+        client: The boto3 SSM client used for every name.
+        ssm_names (list[str]): The parameter names or ARNs to retrieve.
+        skip_invalid (bool): Whether to leave the names reported in
+            ``InvalidParameters`` out of the result instead of raising.
+
+    Returns:
+        dict[str, str | None]: The value of each requested name.
+
+    Raises:
+        ParameterNotFoundError: If any of the names is reported in
+            ``InvalidParameters``, unless ``skip_invalid`` is set. The first
+            one, in request order, is raised.
+    """
+    names = list(dict.fromkeys(ssm_names))
+
+    with instrumentation.span(
+        instrumentation.GET_PARAMETERS, service="ssm", count=len(names)
+    ) as span:
+        cache_keys, cached = get_cached_ssm_contents(settings, client, names)
+        span.set_attribute("cache_hits", len(cached))
+
+        ssm_responses: list[dict[str, Any]] = []
+        for chunk in get_parameters_chunks(names, cached):
+            logger.debug("Getting %d parameters value with boto3 client", len(chunk))
+            ssm_responses.append(
+                call_client(
+                    settings,
+                    "ssm",
+                    client,
+                    "get_parameters",
+                    Names=chunk,
+                    WithDecryption=True,
+                )
+            )
+        span.set_attribute("requests", len(ssm_responses))
+
+        return read_ssm_contents(
+            settings, cache_keys, cached, ssm_responses, skip_invalid
         )
-    except ClientError as e:
-        if e.response["Error"]["Code"] == "ParameterNotFound":
-            raise ParameterNotFoundError(
-                f"Parameter '{ssm_name}' not found in SSM Parameter Store"
-            ) from e
-        raise
 
-    return ssm_response.get("Parameter", {}).get("Value", None)
 
+def get_cached_ssm_contents(
+    settings: type[BaseSettings], client: Any, ssm_names: list[str]
+) -> tuple[dict[str, ValueCacheKey | None], dict[str, str | None]]:
+    """Look ``ssm_names`` up in the value cache.
 
-def get_secrets_content(settings: type[BaseSettings]) -> dict[str, Any]:
-    client = _create_client_from_settings(
-        settings, "secretsmanager", "secrets_client"
+    Returns:
+        tuple: The value cache key of each name, in request order, and the
+            values that were found in the cache.
+    """
+    cache_keys = {
+        name: get_value_cache_key(settings, "ssm", client, name)
+        for name in ssm_names
+    }
+    cached: dict[str, str | None] = {}
+    for name, cache_key in cache_keys.items():
+        if cache_key:
+            hit, value = get_cached_value(cache_key)
+            if hit:
+                cached[name] = value
+
+    if cached:
+        logger.debug("%d parameters found in the value cache", len(cached))
+
+    return cache_keys, cached
+
+
+def get_parameters_chunks(
+    ssm_names: list[str], cached: dict[str, str | None]
+) -> list[list[str]]:
+    """Split the names missing from ``cached`` into ``GetParameters`` requests."""
+    names = [name for name in ssm_names if name not in cached]
+
+    return [
+        names[i : i + GET_PARAMETERS_MAX_NAMES]
+        for i in range(0, len(names), GET_PARAMETERS_MAX_NAMES)
+    ]
+
+
+def read_ssm_contents(
+    settings: type[BaseSettings],
+    cache_keys: dict[str, ValueCacheKey | None],
+    cached: dict[str, str | None],
+    ssm_responses: list[dict[str, Any]],
+    skip_invalid: bool = False,
+) -> dict[str, str | None]:
+    """Map ``GetParameters`` responses back onto the requested names.
+
+    Fetched values are stored in the value cache when it is enabled.
+
+    Raises:
+        ParameterNotFoundError: If any of the names is reported in
+            ``InvalidParameters``, unless ``skip_invalid`` is set. The first
+            one, in request order, is raised.
+    """
+    values: dict[str, str | None] = {}
+    invalid: set[str] = set()
+
+    for ssm_response in ssm_responses:
+        invalid.update(ssm_response.get("InvalidParameters", []))
+
+        for parameter in ssm_response.get("Parameters", []):
+            value = parameter.get("Value", None)
+            name = parameter.get("Name")
+            values[name] = value
+            record_version("ssm", name, parameter.get("Version"))
+            values[f"{name}{parameter.get('Selector', '')}"] = value
+            if parameter.get("ARN"):
+                values[parameter["ARN"]] = value
+
+    for name in cache_keys:
+        if name in invalid and not skip_invalid:
+            raise_parameter_not_found(name)
+
+    for name, cache_key in cache_keys.items():
+        if cache_key and name not in cached and name not in invalid:
+            set_cached_value(settings, cache_key, values.get(name))
+
+    return {
+        name: cached[name] if name in cached else values.get(name)
+        for name in cache_keys
+        if name not in invalid
+    }
+
+
+def raise_parameter_not_found(ssm_name: str) -> NoReturn:
+    """Raise the :class:`ParameterNotFoundError` of ``ssm_name``."""
+    raise ParameterNotFoundError(
+        f"Parameter '{ssm_name}' not found in SSM Parameter Store", ssm_name
     )
-    secrets_args: AwsSecretsArgs = _get_secrets_args(settings)
 
-    logger.debug("Getting secrets manager value with boto3 client")
-    try:
-        secret_response = client.get_secret_value(
-            **secrets_args.model_dump(by_alias=True, exclude_none=True)
+
+def get_ssm_path_contents(
+    settings: type[BaseSettings],
+    client: Any,
+    ssm_path: str,
+    recursive: bool = False,
+) -> dict[str, str | None]:
+    """Fetch every parameter under ``ssm_path`` with ``GetParametersByPath``.
+
+    Pages of 10 parameters are requested until the whole path is read. The
+    result is stored in the value cache as a single entry when it is enabled.
+
+    Args:
+        settings (type[BaseSettings]): The settings class being built.
+        client: The boto3 SSM client.
+        ssm_path (str): The hierarchy to read, e.g. ``"/myapp/prod"``.
+        recursive (bool): Whether to read the whole subtree or only the
+            parameters directly under ``ssm_path``.
+
+    Returns:
+        dict[str, str | None]: The value of each parameter, by full name.
+    """
+    with instrumentation.span(
+        instrumentation.GET_PARAMETERS_BY_PATH, service="ssm", name=ssm_path
+    ) as span:
+        cache_key = get_value_cache_key(
+            settings, "ssm", client, get_ssm_path_cache_name(ssm_path, recursive)
         )
-    except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            raise SecretNotFoundError(
-                f"Secret '{secrets_args.secrets_name}' not found in Secrets Manager"
-            ) from e
-        raise
+        if cache_key:
+            hit, value = get_cached_value(cache_key)
+            span.set_attribute("cache_hit", hit)
+            if hit:
+                logger.debug("Parameters under %s found in the value cache", ssm_path)
+                return value
+
+        contents: dict[str, str | None] = {}
+        next_token: str | None = None
+        requests = 0
+
+        while True:
+            logger.debug("Getting a page of parameters under %s", ssm_path)
+            ssm_response: dict[str, Any] = call_client(
+                settings,
+                "ssm",
+                client,
+                "get_parameters_by_path",
+                **get_parameters_by_path_args(ssm_path, recursive, next_token),
+            )
+            requests += 1
+            next_token = read_ssm_path_contents(ssm_response, contents)
+
+            if not next_token:
+                break
+
+        span.set_attribute("requests", requests)
+        span.set_attribute("count", len(contents))
+
+        if cache_key:
+            set_cached_value(settings, cache_key, contents)
+
+        return contents
+
+
+def get_ssm_path_cache_name(ssm_path: str, recursive: bool) -> str:
+    """Return the value cache name of a path, distinct from any parameter name."""
+    return ssm_path.rstrip("/") + ("/**" if recursive else "/*")
+
+
+def get_parameters_by_path_args(
+    ssm_path: str, recursive: bool, next_token: str | None = None
+) -> dict[str, Any]:
+    """Return the ``GetParametersByPath`` arguments of a page."""
+    args: dict[str, Any] = {
+        "Path": ssm_path,
+        "Recursive": recursive,
+        "WithDecryption": True,
+        "MaxResults": GET_PARAMETERS_BY_PATH_MAX_RESULTS,
+    }
+
+    if next_token:
+        args["NextToken"] = next_token
+
+    return args
+
+
+def read_ssm_path_contents(
+    ssm_response: dict[str, Any], contents: dict[str, str | None]
+) -> str | None:
+    """Add the parameters of a ``GetParametersByPath`` page to ``contents``.
+
+    Returns:
+        str | None: The token of the next page, or ``None`` on the last page.
+    """
+    for parameter in ssm_response.get("Parameters", []):
+        contents[parameter["Name"]] = parameter.get("Value", None)
+        record_version("ssm", parameter["Name"], parameter.get("Version"))
+
+    return ssm_response.get("NextToken")
+
+
+def get_secrets_content(
+    settings: type[BaseSettings],
+    client: Any = None,
+    secrets_name: str | None = None,
+    keys: Collection[str] | None = None,
+) -> dict[str, Any]:
+    """Fetch a secret with ``GetSecretValue`` and decode its JSON content.
+
+    Args:
+        settings (type[BaseSettings]): The settings class being built.
+        client: A per-field client. When ``None``, the client configured for
+            ``settings`` is used.
+        secrets_name (str | None): The secret to read, in its current
+            version. When ``None``, the secret configured for ``settings`` is
+            read.
+        keys (Collection[str] | None): The keys of the JSON object to keep,
+            see :func:`read_secrets_content`. When ``None``, every key is kept.
+    """
+    client = get_secrets_client(settings, client)
+    secrets_args: AwsSecretsArgs = get_secrets_args(settings, secrets_name)
+
+    with instrumentation.span(
+        instrumentation.GET_SECRET_VALUE,
+        service="secretsmanager",
+        name=secrets_args.secrets_name,
+    ) as span:
+        cache_key = get_secrets_cache_key(settings, client, secrets_args, keys)
+        if cache_key:
+            hit, value = get_cached_value(cache_key)
+            span.set_attribute("cache_hit", hit)
+            if hit:
+                logger.debug("Secrets manager value found in the value cache")
+                return value
+
+        logger.debug("Getting secrets manager value with boto3 client")
+        try:
+            secret_response = call_client(
+                settings,
+                "secretsmanager",
+                client,
+                "get_secret_value",
+                **secrets_args.model_dump(by_alias=True, exclude_none=True),
+            )
+        except boto.client_errors() as e:
+            raise_for_secrets_client_error(e, secrets_args)
+            raise
+
+    json_content = read_secrets_content(secret_response, secrets_args, keys)
+
+    if cache_key:
+        set_cached_value(settings, cache_key, json_content)
+
+    return json_content
+
+
+def get_batch_secrets_contents(
+    settings: type[BaseSettings],
+    secret_names: list[str],
+    client: Any = None,
+    keys: Mapping[str, Collection[str]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Fetch several secrets with ``BatchGetSecretValue``, in chunks of 20 ids.
+
+    The current version of each secret is read. Pages are requested until
+    every secret of a chunk is returned, and secrets already present in the
+    value cache are not requested again.
+
+    Args:
+        settings (type[BaseSettings]): The settings class being built.
+        secret_names (list[str]): The names or ARNs of the secrets.
+        client: A Secrets Manager client. When ``None``, the client
+            configured for ``settings`` is used.
+        keys (Mapping[str, Collection[str]] | None): The keys of the JSON
+            object to keep, by secret. Every key of the secrets missing from
+            the mapping is kept.
+
+    Returns:
+        dict[str, dict[str, Any]]: The JSON content of each requested secret.
+
+    Raises:
+        SecretNotFoundError: If a secret does not exist.
+        SecretContentError: If the content of a secret is empty.
+        SecretDecodeError: If the content of a secret is not valid JSON.
+    """
+    client = get_secrets_client(settings, client)
+    names = list(dict.fromkeys(secret_names))
+    keys = keys or {}
+
+    with instrumentation.span(
+        instrumentation.BATCH_GET_SECRET_VALUE,
+        service="secretsmanager",
+        count=len(names),
+    ) as span:
+        cache_keys = {
+            name: get_secrets_cache_key(
+                settings, client, get_secrets_args(settings, name), keys.get(name)
+            )
+            for name in names
+        }
+        contents: dict[str, dict[str, Any]] = {}
+        for name, cache_key in cache_keys.items():
+            if cache_key:
+                hit, value = get_cached_value(cache_key)
+                if hit:
+                    contents[name] = value
+        span.set_attribute("cache_hits", len(contents))
 
-    secrets_content = _get_secrets_content(secret_response)
+        missing = [name for name in names if name not in contents]
+        secrets_responses: list[dict[str, Any]] = []
+        for i in range(0, len(missing), BATCH_GET_SECRET_VALUE_MAX_IDS):
+            chunk = missing[i : i + BATCH_GET_SECRET_VALUE_MAX_IDS]
+            logger.debug("Getting %d secrets values with boto3 client", len(chunk))
+            kwargs: dict[str, Any] = {"SecretIdList": chunk}
+            while True:
+                secrets_response = call_client(
+                    settings,
+                    "secretsmanager",
+                    client,
+                    "batch_get_secret_value",
+                    **kwargs,
+                )
+                secrets_responses.append(secrets_response)
+                if not secrets_response.get("NextToken"):
+                    break
+                kwargs["NextToken"] = secrets_response["NextToken"]
+        span.set_attribute("requests", len(secrets_responses))
+
+    for name, json_content in read_batch_secrets_contents(
+        missing, secrets_responses, keys
+    ).items():
+        contents[name] = json_content
+        cache_key = cache_keys[name]
+        if cache_key:
+            set_cached_value(settings, cache_key, json_content)
+
+    return {name: contents[name] for name in names}
+
+
+def read_batch_secrets_contents(
+    secret_names: list[str],
+    secrets_responses: list[dict[str, Any]],
+    keys: Mapping[str, Collection[str]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Map ``BatchGetSecretValue`` responses back onto the requested secrets.
+
+    Secrets are matched by name or ARN, and errors are raised for the first
+    failing secret in request order.
+
+    Raises:
+        SecretNotFoundError: If a secret is reported as not found, or is
+            missing from the responses.
+        SecretContentError: If the content of a secret is empty.
+        SecretDecodeError: If the content of a secret is not valid JSON.
+    """
+    secret_values: dict[str, dict[str, Any]] = {}
+    errors: dict[str, dict[str, Any]] = {}
+
+    for secrets_response in secrets_responses:
+        for secret_value in secrets_response.get("SecretValues", []):
+            for secret_id in (secret_value.get("Name"), secret_value.get("ARN")):
+                if secret_id:
+                    secret_values[secret_id] = secret_value
+
+        for error in secrets_response.get("Errors", []):
+            errors[error.get("SecretId", "")] = error
+
+    contents: dict[str, dict[str, Any]] = {}
+    for name in secret_names:
+        secrets_args = AwsSecretsArgs.model_validate({"secrets_name": name})
+        secret_value = secret_values.get(name)
+
+        if secret_value is None:
+            error = errors.get(name, {})
+            code = error.get("ErrorCode", "ResourceNotFoundException")
+            if code != "ResourceNotFoundException":
+                raise SecretsManagerError(
+                    f"Secret '{name}' could not be read from Secrets Manager: "
+                    f"{code} {error.get('Message', '')}".rstrip()
+                )
+            raise SecretNotFoundError(f"Secret '{name}' not found in Secrets Manager")
+
+        contents[name] = read_secrets_content(
+            secret_value, secrets_args, (keys or {}).get(name)
+        )
+
+    return contents
+
+
+def get_secrets_cache_key(
+    settings: type[BaseSettings],
+    client: Any,
+    secrets_args: AwsSecretsArgs,
+    keys: Collection[str] | None = None,
+) -> ValueCacheKey | None:
+    """Return the value cache key of a secret, or ``None`` if caching is off.
+
+    Contents decoded with different ``keys`` are cached apart.
+    """
+    cache_key = get_value_cache_key(
+        settings,
+        "secretsmanager",
+        client,
+        secrets_args.secrets_name,
+        secrets_args.secrets_version or secrets_args.secrets_stage,
+    )
+    if cache_key is None or keys is None:
+        return cache_key
+
+    return cache_key._replace(keys=tuple(sorted(keys)))
+
+
+def raise_for_secrets_client_error(
+    error: "ClientError", secrets_args: AwsSecretsArgs
+) -> None:
+    """Raise the library error matching a ``GetSecretValue`` client error.
+
+    Returns without raising when the error has no matching library error, so
+    that the caller can re-raise the original one.
+    """
+    if error.response["Error"]["Code"] == "ResourceNotFoundException":
+        raise SecretNotFoundError(
+            f"Secret '{secrets_args.secrets_name}' not found in Secrets Manager"
+        ) from error
+
+
+def read_secrets_content(
+    secret_response: dict[str, Any],
+    secrets_args: AwsSecretsArgs,
+    keys: Collection[str] | None = None,
+) -> dict[str, Any]:
+    """Decode the JSON content of a ``GetSecretValue`` response.
+
+    ``SecretBinary`` bytes are decoded as they are, without an intermediate
+    ``str``. When ``keys`` is given, only those keys of the JSON object are
+    kept and the rest of the document is dropped right away.
+
+    Raises:
+        SecretContentError: If the secret content is empty, or if
+            ``SecretBinary`` is not valid UTF-8.
+        SecretDecodeError: If the secret content is not valid JSON.
+    """
+    record_version(
+        "secretsmanager", secrets_args.secrets_name, secret_response.get("VersionId")
+    )
+    secrets_content = _get_secrets_payload(secret_response)
 
     if not secrets_content:
         logger.warning(
@@ -102,18 +739,83 @@ def get_secrets_content(settings: type[BaseSettings]) -> dict[str, Any]:
             f"Secret '{secrets_args.secrets_name}' exists but its content is empty"
         )
 
-    try:
-        return json.loads(secrets_content)
-    except json.decoder.JSONDecodeError as json_err:
-        logger.error(
-            f"The content of the secrets manager must be a valid json: {json_err}"
-        )
-        raise SecretDecodeError(
-            f"Secret '{secrets_args.secrets_name}' content is not valid JSON"
-        ) from json_err
+    json_backend = decoding.get_json_backend()
+    with instrumentation.span(
+        instrumentation.DECODE_SECRET,
+        service="secretsmanager",
+        name=secrets_args.secrets_name,
+        bytes=len(secrets_content),
+        backend=json_backend.name,
+    ):
+        try:
+            json_content: dict[str, Any] = decoding.decode_json_object(
+                secrets_content, keys, json_backend
+            )
+        except ValueError as json_err:
+            if isinstance(secrets_content, bytes):
+                # checked on failure only, to tell bytes that are not UTF-8
+                # apart from invalid JSON
+                _decode_secret_binary(secrets_content)
+
+            logger.error(
+                "The content of the secrets manager must be a valid json: %s",
+                json_err,
+            )
+            raise SecretDecodeError(
+                f"Secret '{secrets_args.secrets_name}' content is not valid JSON"
+            ) from json_err
 
+    return json_content
+
+
+def get_secrets_client(settings: type[BaseSettings], client: Any = None) -> Any:
+    """Return ``client`` or the Secrets Manager client configured for ``settings``.
+
+    Args:
+        settings (type[BaseSettings]): The settings class being built.
+        client: A per-field client, usually from a :class:`Secrets` descriptor.
+
+    Returns:
+        Any: The boto3 Secrets Manager client to use.
+    """
+    if client:
+        logger.debug("Will use the boto3 client specified in metadata")
+        return client
+
+    return _create_client_from_settings(settings, "secretsmanager", "secrets_client")
+
+
+def get_secret_key(
+    settings: type[BaseSettings], client: Any, secrets_name: str | None = None
+) -> tuple[int, str, str | None, str | None]:
+    """Return the key identifying which secret ``settings`` reads with ``client``.
+
+    Fields sharing the same key read the same ``GetSecretValue`` response.
+
+    Returns:
+        tuple: The client identity, ``SecretId``, ``VersionId`` and ``VersionStage``.
+    """
+    secrets_args = get_secrets_args(settings, secrets_name)
+
+    return (
+        id(client),
+        secrets_args.secrets_name,
+        secrets_args.secrets_version,
+        secrets_args.secrets_stage,
+    )
+
+
+def get_secrets_args(
+    settings: type[BaseSettings], secrets_name: str | None = None
+) -> AwsSecretsArgs:
+    """Return the ``GetSecretValue`` arguments of ``settings``.
+
+    When ``secrets_name`` is given, the current version of that secret is
+    read instead of the one configured.
+    """
+    if secrets_name is not None:
+        return AwsSecretsArgs.model_validate({"secrets_name": secrets_name})
 
-def _get_secrets_args(settings: type[BaseSettings]) -> AwsSecretsArgs:
     logger.debug(
         "Extracting settings prefixed with secrets_, except _client and _dir"
     )
@@ -129,7 +831,8 @@ def _get_secrets_args(settings: type[BaseSettings]) -> AwsSecretsArgs:
 
     except ValidationError as err:
         logger.error(
-            f"A validation error was caught. Please check all required fields: {err}"
+            "A validation error was caught. Please check all required fields: %s",
+            err,
         )
         raise AWSSettingsConfigError(
             f"Invalid or missing Secrets Manager configuration: {err}"
@@ -139,7 +842,26 @@ def _get_secrets_args(settings: type[BaseSettings]) -> AwsSecretsArgs:
 def _get_secrets_content(
     secret: dict[str, Any],
 ) -> str | None:
-    secrets_content: str | None = None
+    secrets_content = _get_secrets_payload(secret)
+
+    if isinstance(secrets_content, bytes):
+        return _decode_secret_binary(secrets_content)
+
+    return secrets_content
+
+
+def _get_secrets_payload(
+    secret: dict[str, Any],
+) -> str | bytes | None:
+    """Return the ``SecretString``, or the ``SecretBinary`` bytes as they are.
+
+    The JSON backends decode the bytes as UTF-8 themselves, without a ``str``
+    copy.
+
+    Raises:
+        SecretContentError: If ``SecretBinary`` is not bytes.
+    """
+    secrets_content: str | bytes | None = None
 
     if "SecretString" in secret and secret.get("SecretString"):
         logger.debug("Extracting content from SecretString.")
@@ -149,46 +871,206 @@ def _get_secrets_content(
         logger.debug(
             "SecretString was not present. Getting content from SecretBinary."
         )
-        secret_binary: bytes | None = secret.get("SecretBinary")
+        secret_binary = secret.get("SecretBinary")
 
-        if secret_binary:
-            try:
-                secrets_content = secret_binary.decode("utf-8")
-            except (AttributeError, ValueError) as err:
-                logger.error(f"Error decoding secrets content: {err}")
-                raise SecretContentError(
-                    "Failed to decode SecretBinary content as UTF-8"
-                ) from err
+        if secret_binary and not isinstance(secret_binary, bytes):
+            logger.error(
+                "SecretBinary content must be bytes, got %s",
+                type(secret_binary).__name__,
+            )
+            raise SecretContentError("Failed to decode SecretBinary content as UTF-8")
+
+        secrets_content = secret_binary
 
     return secrets_content
 
 
+def _decode_secret_binary(secret_binary: bytes) -> str:
+    try:
+        return secret_binary.decode("utf-8")
+    except ValueError as err:
+        logger.error("Error decoding secrets content: %s", err)
+        raise SecretContentError(
+            "Failed to decode SecretBinary content as UTF-8"
+        ) from err
+
+
+def get_value_cache_key(
+    settings: type[BaseSettings],
+    service: AWSService,
+    client: Any,
+    name: str,
+    version: str | None = None,
+) -> ValueCacheKey | None:
+    """Return the value cache key for ``name``, or ``None`` if caching is off."""
+    if utils.get_config_value(settings, "value_cache_ttl") is None:
+        return None
+
+    return get_value_key(settings, service, client, name, version)
+
+
+def get_value_key(
+    settings: type[BaseSettings],
+    service: AWSService,
+    client: Any,
+    name: str,
+    version: str | None = None,
+) -> ValueCacheKey:
+    """Return the key identifying the value of ``name`` read with ``client``."""
+    return ValueCacheKey(
+        service, _get_session_key(settings, service, client), name, version
+    )
+
+
+def set_cached_value(
+    settings: type[BaseSettings], cache_key: ValueCacheKey, value: Any
+) -> None:
+    max_entries = utils.get_config_value(settings, "value_cache_max_entries")
+    if max_entries:
+        value_cache.max_entries = max_entries
+
+    ttl = utils.get_config_value(settings, "value_cache_ttl")
+    value_cache.set(cache_key, value, ttl)
+
+
+def _get_session_key(
+    settings: type[BaseSettings], service: AWSService, client: Any
+) -> str:
+    """Return the session key ``client`` was created with.
+
+    Clients that were not created from the settings' ``aws_`` options, such as
+    the ones injected through ``ssm_client``, ``secrets_client`` or a field
+    descriptor, are identified by the client object itself.
+    """
+    session_args = get_session_args(settings)
+    client_key = get_client_key(session_args, service, get_client_config_args(settings))
+    if isinstance(client, LambdaExtensionClient):
+        client_key = get_extension_client_key(client_key, client.endpoint)
+    elif isinstance(client, MultiRegionClient):
+        client_key = get_regions_client_key(client_key, client.regions)
+
+    if client_pool.peek(client_key) is client:
+        return session_args.session_key()
+
+    return get_injected_client_key(client)
+
+
+def get_injected_client_key(client: Any) -> str:
+    """Return the key identifying a client that was not created by the library.
+
+    The key is a token given to ``client`` on its first lookup and kept for as
+    long as the client is alive, so that a new client can never be handed the
+    values cached for a garbage collected one. Clients that cannot be weakly
+    referenced get a new token on every lookup, so their values are never
+    shared.
+    """
+    token = f"client-{next(_injected_client_counter)}"
+    try:
+        return _injected_client_tokens.setdefault(client, token)
+    except TypeError:
+        return token
+
+
+def get_session_args(settings: type[BaseSettings]) -> AwsSession:
+    logger.debug("Extracting settings prefixed with aws_")
+    args: dict[str, Any] = {
+        k: v for k, v in settings.model_config.items() if k.startswith("aws_")
+    }
+
+    return AwsSession(**args)
+
+
 def _create_client_from_settings(  # type: ignore[no-untyped-def]
     settings: type[BaseSettings], service: AWSService, client_param: ClientParam
 ):
     client = settings.model_config.get(client_param)
 
     if client:
-        logger.debug(f"Will use client from model config {client_param}")
+        logger.debug("Will use client from model config %s", client_param)
         return client
 
-    logger.debug("Extracting settings prefixed with aws_")
-    args: dict[str, Any] = {
-        k: v for k, v in settings.model_config.items() if k.startswith("aws_")
+    session_args = get_session_args(settings)
+    config_args = get_client_config_args(settings)
+
+    if utils.get_config_value(settings, "transport") == "lambda_extension":
+        return _create_extension_client(settings, session_args, service, config_args)
+
+    if utils.get_config_value(settings, "aws_regions"):
+        return _create_regions_client(settings, session_args, service, config_args)
+
+    return _create_boto3_client(session_args, service, config_args)
+
+
+def get_client_config_args(settings: type[BaseSettings]) -> dict[str, Any]:
+    """Return the ``botocore.config.Config`` arguments set with the ``client_`` options.
+
+    When ``throttle_max_attempts`` retries throttling errors and
+    ``client_max_attempts`` is not set, botocore is limited to a single
+    attempt, so that both layers don't retry the same call and multiply
+    its attempts.
+
+    Returns:
+        dict[str, Any]: The arguments that were set, empty when none was.
+    """
+    config_args: dict[str, Any] = {
+        "max_pool_connections": utils.get_config_value(
+            settings, "client_max_pool_connections"
+        ),
+        "connect_timeout": utils.get_config_value(settings, "client_connect_timeout"),
+        "read_timeout": utils.get_config_value(settings, "client_read_timeout"),
+    }
+
+    max_attempts = utils.get_config_value(settings, "client_max_attempts")
+    if max_attempts is None and (
+        utils.get_config_value(settings, "throttle_max_attempts") or 1
+    ) > 1:
+        max_attempts = 1
+
+    retries: dict[str, Any] = {
+        "mode": utils.get_config_value(settings, "client_retry_mode"),
+        "max_attempts": max_attempts,
     }
+    retries = {k: v for k, v in retries.items() if v is not None}
+    if retries:
+        config_args["retries"] = retries
+
+    return {k: v for k, v in config_args.items() if v is not None}
+
+
+def get_client_key(
+    session_args: AwsSession,
+    service: AWSService,
+    config_args: dict[str, Any] | None = None,
+) -> str:
+    """Return the key of a client in :data:`client_pool`.
+
+    Clients of the same service and session with different ``client_``
+    options are pooled apart.
+    """
+    key = service + "_" + session_args.session_key()
 
-    session_args = AwsSession(**args)
+    if config_args:
+        key += "_" + repr(sorted(config_args.items()))
 
-    return _create_boto3_client(session_args, service)
+    return key
 
 
-def _create_boto3_client(session_args: AwsSession, service: AWSService):  # type: ignore[no-untyped-def]
+def _create_boto3_client(  # type: ignore[no-untyped-def]
+    session_args: AwsSession,
+    service: AWSService,
+    config_args: dict[str, Any] | None = None,
+):
     """Create a boto3 client for the service informed.
 
+    The boto3 session is shared by the clients of every service created with
+    the same ``session_args``, so credentials are only resolved once.
+
     Args:
         session_args (AwsSession): Settings informed in `SettingsConfigDict` to create
             the boto3 session.
         service (str): The service client that will be created.
+        config_args (dict[str, Any] | None): The ``botocore.config.Config``
+            arguments of the client, from :func:`get_client_config_args`.
 
     Returns:
         boto3.client: An aws service boto3 client.
@@ -196,22 +1078,102 @@ def _create_boto3_client(session_args: AwsSession, service: AWSService):  # type
     Raises:
         AWSClientError: If the boto3 session or client cannot be created.
     """
-    cache_key = service + "_" + session_args.session_key()
 
-    with _client_cache_lock:
-        if cache_key in _client_cache:
-            return _client_cache[cache_key]
+    def create_session() -> Any:
+        # imported on the first client, as boto3 is slow to import
+        import boto3  # type: ignore[import-untyped]
 
-        try:
-            session: boto3.Session = boto3.Session(
-                **session_args.model_dump(by_alias=True, exclude_none=True)
-            )
-            client = session.client(service)
-        except Exception as e:
-            raise AWSClientError(
-                f"Failed to create boto3 client for '{service}': {e}"
-            ) from e
+        return boto3.Session(
+            **session_args.model_dump(by_alias=True, exclude_none=True)
+        )
 
-        _client_cache[cache_key] = client
+    def create_client() -> Any:
+        with instrumentation.span(instrumentation.CREATE_CLIENT, service=service):
+            try:
+                session = client_pool.get_or_create_session(
+                    session_args.session_key(), create_session
+                )
+                if config_args:
+                    from botocore.config import Config  # type: ignore[import-untyped]
+
+                    return session.client(service, config=Config(**config_args))
+
+                return session.client(service)
+            except Exception as e:
+                raise AWSClientError(
+                    f"Failed to create boto3 client for '{service}': {e}"
+                ) from e
+
+    return client_pool.get_or_create(
+        get_client_key(session_args, service, config_args), create_client
+    )
 
-    return client
+
+def get_extension_client_key(client_key: str, endpoint: str) -> str:
+    """Return the key of a Lambda extension client in :data:`client_pool`."""
+    return f"{client_key}_lambda_extension_{endpoint}"
+
+
+def _create_extension_client(
+    settings: type[BaseSettings],
+    session_args: AwsSession,
+    service: AWSService,
+    config_args: dict[str, Any],
+) -> LambdaExtensionClient:
+    """Create a client reading through the AWS Parameters and Secrets Lambda Extension.
+
+    The boto3 client it falls back to is only created when the extension
+    can't answer, so that cold starts served by the extension don't pay for it.
+    """
+    timeout = utils.get_config_value(settings, "lambda_extension_timeout")
+    extension_client = LambdaExtensionClient(
+        service,
+        lambda: _create_boto3_client(session_args, service, config_args),
+        endpoint=utils.get_config_value(settings, "lambda_extension_endpoint"),
+        timeout=DEFAULT_TIMEOUT if timeout is None else timeout,
+    )
+
+    return client_pool.get_or_create(
+        get_extension_client_key(
+            get_client_key(session_args, service, config_args),
+            extension_client.endpoint,
+        ),
+        lambda: extension_client,
+    )
+
+
+def get_regions_client_key(client_key: str, regions: tuple[str, ...]) -> str:
+    """Return the key of a multi-region client in :data:`client_pool`."""
+    return f"{client_key}_regions_{','.join(regions)}"
+
+
+def _create_regions_client(
+    settings: type[BaseSettings],
+    session_args: AwsSession,
+    service: AWSService,
+    config_args: dict[str, Any],
+) -> MultiRegionClient:
+    """Create a client reading from the ``aws_regions`` of the settings.
+
+    The boto3 client of each region is pooled like any other, and only
+    created when the region is first called.
+    """
+    regions = tuple(utils.get_config_value(settings, "aws_regions"))
+    regions_client = MultiRegionClient(
+        service,
+        regions,
+        lambda region: _create_boto3_client(
+            session_args.model_copy(update={"aws_region": region}),
+            service,
+            config_args,
+        ),
+        hedge_delay=utils.get_config_value(settings, "region_hedge_delay"),
+        order=utils.get_config_value(settings, "region_order") or "priority",
+    )
+
+    return client_pool.get_or_create(
+        get_regions_client_key(
+            get_client_key(session_args, service, config_args), regions
+        ),
+        lambda: regions_client,
+    )
@@ -0,0 +1,60 @@
+import sys
+from typing import Any
+
+from .errors import AWSClientError
+
+_UNREACHABLE_ERROR_CODES = {
+    "InternalFailure",
+    "InternalServerError",
+    "InternalServiceError",
+    "RequestLimitExceeded",
+    "ServiceUnavailable",
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+}
+
+
+def client_errors() -> tuple[type[Any], ...]:
+    """Return ``(botocore.exceptions.ClientError,)``, or ``()`` before botocore is imported.
+
+    boto3 and botocore take hundreds of milliseconds to import, so they are
+    only imported when the first boto3 client is created. Until then, no
+    client can have raised a ``ClientError``: use ``except client_errors()``
+    to handle it without importing botocore. An empty tuple catches nothing.
+    """
+    exceptions = sys.modules.get("botocore.exceptions")
+    if exceptions is None:
+        return ()
+
+    return (exceptions.ClientError,)
+
+
+def botocore_errors() -> tuple[type[Any], ...]:
+    """Return ``(botocore.exceptions.BotoCoreError,)``, or ``()`` before botocore is imported."""
+    exceptions = sys.modules.get("botocore.exceptions")
+    if exceptions is None:
+        return ()
+
+    return (exceptions.BotoCoreError,)
+
+
+def is_unreachable_error(error: BaseException) -> bool:
+    """Return whether ``error`` means that AWS could not answer.
+
+    Connection errors, timeouts, throttling and 5xx responses are; missing
+    parameters or secrets, invalid content and access errors are not, so
+    that they are never hidden by a snapshot or another region.
+    """
+    if isinstance(error, (*botocore_errors(), AWSClientError)):
+        return True
+
+    if isinstance(error, client_errors()):
+        response = error.response
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+        return (
+            status >= 500 or response["Error"].get("Code") in _UNREACHABLE_ERROR_CODES
+        )
+
+    cause = error.__cause__
+    return cause is not None and is_unreachable_error(cause)
@@ -0,0 +1,144 @@
+import hashlib
+import itertools
+import json
+import types
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, Generic
+
+from .logger import logger
+from .resolution import DEFAULT_PREFETCH_WORKERS, ResolutionContext
+from .settings import SettingsT
+
+DEFAULT_CHUNK_SIZE = 100
+
+
+@dataclass(frozen=True)
+class LoadResult(Generic[SettingsT]):
+    """The settings built by :func:`load_many` for one set of overrides, or its error."""
+
+    overrides: Mapping[str, Any]
+    """The ``model_config`` overrides the settings were built with."""
+
+    settings: SettingsT | None = None
+    """The validated settings, or ``None`` if they could not be built."""
+
+    error: Exception | None = None
+    """The error raised building the settings, if any."""
+
+
+def load_many(
+    settings_cls: type[SettingsT],
+    overrides: Iterable[Mapping[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = DEFAULT_PREFETCH_WORKERS,
+) -> Iterator[LoadResult[SettingsT]]:
+    """Build ``settings_cls`` once per set of ``model_config`` overrides.
+
+    Use it to build the settings of many tenants or environments that share
+    a settings class, each with its own ``secrets_name``, ``ssm_prefix`` or
+    ``ssm_path`` for example. Overrides are read ``chunk_size`` at a time,
+    and the AWS reads of a chunk are planned together in a
+    :class:`ResolutionContext`:
+
+    * parameters read with the same session are fetched together, in as few
+      ``GetParameters`` calls as possible, whichever overrides they belong to;
+    * secrets and parameter paths are fetched concurrently, on up to
+      ``max_workers`` threads;
+    * values read by several overrides are fetched once, and clients are
+      shared by the overrides with the same ``aws_`` options.
+
+    Results are yielded in the order of ``overrides``, once their chunk is
+    built, so that memory stays bounded whatever the number of overrides.
+    Each override is built independently: an error, like a missing secret or
+    an invalid value, is yielded in its result instead of being raised.
+
+    Example:
+        ```py
+        tenants = [
+            {"secrets_name": f"{tenant}/db", "ssm_prefix": f"/tenants/{tenant}"}
+            for tenant in ("acme", "globex")
+        ]
+
+        for result in load_many(TenantSettings, tenants):
+            if result.error:
+                logger.error("Tenant %s failed: %s", result.overrides, result.error)
+            else:
+                register(result.settings)
+        ```
+
+    Args:
+        settings_cls (type[SettingsT]): A subclass of :class:`AWSBaseSettings`,
+            :class:`ParameterStoreBaseSettings` or
+            :class:`SecretsManagerBaseSettings`.
+        overrides (Iterable[Mapping[str, Any]]): The
+            :class:`AWSSettingsConfigDict` keys of each settings to build,
+            merged over the ``model_config`` of ``settings_cls``.
+        chunk_size (int): How many overrides are planned and built together.
+        max_workers (int): Maximum number of threads fetching secrets and
+            parameter paths concurrently.
+
+    Yields:
+        LoadResult[SettingsT]: The settings, or the error, of each overrides.
+    """
+    overrides_iterator = iter(overrides)
+
+    while chunk := list(itertools.islice(overrides_iterator, chunk_size)):
+        yield from _load_chunk(settings_cls, chunk, max_workers)
+
+
+def _load_chunk(
+    settings_cls: type[SettingsT],
+    chunk: list[Mapping[str, Any]],
+    max_workers: int,
+) -> list[LoadResult[SettingsT]]:
+    # built in a list, not yielded, so that the context is never active in
+    # the caller's code between two results
+    tenant_classes = [get_overridden_cls(settings_cls, o) for o in chunk]
+    logger.debug("Loading %d %s settings", len(chunk), settings_cls.__name__)
+
+    with ResolutionContext(*tenant_classes) as context:
+        context.prefetch(max_workers)
+
+        return [
+            _build(tenant_cls, overrides)
+            for tenant_cls, overrides in zip(tenant_classes, chunk)
+        ]
+
+
+def _build(
+    settings_cls: type[SettingsT], overrides: Mapping[str, Any]
+) -> LoadResult[SettingsT]:
+    try:
+        return LoadResult(overrides, settings_cls())
+    # the error is returned with the result of its overrides
+    except Exception as e:  # noqa: BLE001
+        logger.debug(
+            "Failed to load %s with %s: %r", settings_cls.__name__, overrides, e
+        )
+        return LoadResult(overrides, error=e)
+
+
+def get_overridden_cls(
+    settings_cls: type[SettingsT], overrides: Mapping[str, Any]
+) -> type[SettingsT]:
+    """Return a subclass of ``settings_cls`` with ``overrides`` merged in its ``model_config``.
+
+    The subclass is named after ``settings_cls``, and its qualified name ends
+    with a digest of ``overrides``, so that the snapshots of different
+    overrides don't collide.
+    """
+    digest = hashlib.sha256(
+        json.dumps(overrides, sort_keys=True, default=repr).encode()
+    ).hexdigest()[:12]
+    namespace = {
+        "__module__": settings_cls.__module__,
+        "__qualname__": f"{settings_cls.__qualname__}[{digest}]",
+        "model_config": dict(overrides),
+    }
+
+    return types.new_class(
+        settings_cls.__name__,
+        (settings_cls,),
+        exec_body=lambda ns: ns.update(namespace),
+    )
@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class ValueCacheKey(NamedTuple):
+    """Identifies a value resolved from AWS."""
+
+    service: str
+    """The AWS service the value was read from (``"ssm"`` or ``"secretsmanager"``)."""
+
+    session_key: str
+    """The boto3 session (or injected client) the value was read with."""
+
+    name: str
+    """The parameter name or the secret name / ARN."""
+
+    version: str | None = None
+    """The secret ``VersionId`` or ``VersionStage``, when one was requested."""
+
+    keys: tuple[str, ...] | None = None
+    """The keys kept from a secret's JSON object, or ``None`` for every key."""
+
+
+class ValueCache:
+    """Thread-safe LRU cache with a per-entry TTL for values resolved from AWS.
+
+    The cache is opt-in: values are only stored for settings classes that set
+    ``value_cache_ttl`` in :class:`AWSSettingsConfigDict`. A single instance,
+    :data:`value_cache`, is shared by the whole process.
+
+    Example::
+
+        from pydantic_settings_aws import value_cache
+
+        value_cache.invalidate(name="/myapp/prod/db/host")
+        value_cache.clear()
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._entries: OrderedDict[ValueCacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._clock = clock
+
+    @property
+    def max_entries(self) -> int:
+        """The maximum number of entries kept before the least recently used is evicted."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, max_entries: int) -> None:
+        with self._lock:
+            self._max_entries = max_entries
+            self._evict()
+
+    def get(self, key: ValueCacheKey) -> tuple[bool, Any]:
+        """Return ``(True, value)`` for a fresh entry, ``(False, None)`` otherwise."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: ValueCacheKey, value: Any, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def invalidate(self, name: str | None = None, service: str | None = None) -> int:
+        """Remove the entries matching ``name`` and/or ``service``.
+
+        Args:
+            name (str | None): The parameter or secret name to drop, for every
+                session and version. When ``None``, any name matches.
+            service (str | None): ``"ssm"`` or ``"secretsmanager"``. When
+                ``None``, any service matches.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        return self.invalidate_matching(
+            lambda key: (name is None or key.name == name)
+            and (service is None or key.service == service)
+        )
+
+    def invalidate_matching(self, predicate: Callable[[ValueCacheKey], bool]) -> int:
+        """Remove the entries whose key ``predicate`` returns ``True`` for.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _after_fork_in_child(self) -> None:
+        # entries are plain values and stay valid in the child, only the
+        # lock, which a parent thread may have held, is replaced
+        self._lock = threading.Lock()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+value_cache = ValueCache()
@@ -0,0 +1,256 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from .logger import logger
+
+DEFAULT_MAX_SIZE = 64
+
+
+class ClientPoolStats(NamedTuple):
+    """Counters of a :class:`ClientPool`."""
+
+    hits: int
+    """Lookups that returned a pooled client."""
+
+    misses: int
+    """Lookups that created a new client."""
+
+    evictions: int
+    """Clients dropped because the pool was full or they were idle for too long."""
+
+
+class ClientPool:
+    """Thread-safe LRU pool of the boto3 clients created from settings.
+
+    Clients are keyed by service and session key, which includes digests of
+    ``aws_secret_access_key`` and ``aws_session_token``, so that a client built
+    with expired STS credentials is never handed back for new ones. The boto3
+    sessions the clients are created from are pooled too, by session key only,
+    so that the clients of every service share credential resolution. A single
+    instance, :data:`client_pool`, is shared by the whole process.
+
+    Evicted clients are not closed, as they may still be in use: their
+    connections are released when they are garbage collected. Call
+    :meth:`close` to release every connection right away.
+
+    Example::
+
+        from pydantic_settings_aws import client_pool
+
+        client_pool.max_size = 16
+        client_pool.idle_ttl = 900
+        client_pool.stats()
+        client_pool.close()
+
+    Args:
+        max_size (int): The maximum number of clients kept before the least
+            recently used is evicted.
+        idle_ttl (float | None): Seconds a client can stay unused before it is
+            evicted. When ``None``, clients are only evicted when the pool is full.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        idle_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clients: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._sessions: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        # per key, so that creating a client does not block the other keys
+        self._creating: dict[str, threading.Lock] = {}
+        self._max_size = max_size
+        self._idle_ttl = idle_ttl
+        self._clock = clock
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of clients kept before the least recently used is evicted."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    @property
+    def idle_ttl(self) -> float | None:
+        """Seconds a client can stay unused before it is evicted."""
+        return self._idle_ttl
+
+    @idle_ttl.setter
+    def idle_ttl(self, idle_ttl: float | None) -> None:
+        with self._lock:
+            self._idle_ttl = idle_ttl
+
+    def get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Return the client pooled under ``key``, creating it with ``factory`` if needed.
+
+        ``factory`` runs outside the pool lock, under a lock of its own key, so
+        that concurrent lookups of the same key create a single client while
+        lookups of other keys go on.
+        """
+        with self._lock:
+            client = self._lookup(key)
+            if client is not None:
+                self._hits += 1
+                return client
+
+            creating = self._creating.setdefault(key, threading.Lock())
+
+        with creating:
+            try:
+                with self._lock:
+                    # another thread may have created it while we waited
+                    client = self._lookup(key)
+                    if client is not None:
+                        self._hits += 1
+                        return client
+
+                client = factory()
+
+                with self._lock:
+                    self._misses += 1
+                    self._clients[key] = (self._clock(), client)
+                    self._evict()
+            finally:
+                with self._lock:
+                    if self._creating.get(key) is creating:
+                        del self._creating[key]
+
+        return client
+
+    def get_or_create_session(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Return the boto3 session pooled under ``key``, creating it with ``factory`` if needed.
+
+        Sessions are not counted in :meth:`stats` and are evicted with the
+        same ``max_size`` as clients.
+        """
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+                return session
+
+            creating = self._creating.setdefault(f"session:{key}", threading.Lock())
+
+        with creating:
+            try:
+                with self._lock:
+                    session = self._sessions.get(key)
+                    if session is not None:
+                        self._sessions.move_to_end(key)
+                        return session
+
+                session = factory()
+
+                with self._lock:
+                    self._sessions[key] = session
+                    while len(self._sessions) > self._max_size:
+                        self._sessions.popitem(last=False)
+            finally:
+                with self._lock:
+                    if self._creating.get(f"session:{key}") is creating:
+                        del self._creating[f"session:{key}"]
+
+        return session
+
+    def peek(self, key: str) -> Any | None:
+        """Return the client pooled under ``key``, without counting a lookup."""
+        with self._lock:
+            entry = self._clients.get(key)
+
+        return entry[1] if entry else None
+
+    def stats(self) -> ClientPoolStats:
+        """Return the hit, miss and eviction counters."""
+        with self._lock:
+            return ClientPoolStats(self._hits, self._misses, self._evictions)
+
+    def clear(self) -> None:
+        """Drop every client and session, without closing them, and reset the counters."""
+        with self._lock:
+            self._clients.clear()
+            self._sessions.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def close(self) -> None:
+        """Close every client, releasing their urllib3 connection pools, and drop them with the sessions."""
+        with self._lock:
+            clients = [client for _, client in self._clients.values()]
+            self._clients.clear()
+            self._sessions.clear()
+
+        for client in clients:
+            close = getattr(client, "close", None)
+            if callable(close):
+                close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def _after_fork_in_child(self) -> None:
+        """Drop the clients inherited from the parent process, without closing them.
+
+        Their urllib3 connection pools share sockets with the parent, so
+        closing them here would close the parent's connections. The lock is
+        replaced with the per key ones, as a parent thread may have held them
+        during the fork.
+        """
+        self._lock = threading.Lock()
+        self._creating = {}
+        self._clients.clear()
+        self._sessions.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def _lookup(self, key: str) -> Any | None:
+        """Return the client pooled under ``key`` and mark it used, evicting it if idle.
+
+        Must be called with the pool lock held.
+        """
+        entry = self._clients.get(key)
+        if entry is None:
+            return None
+
+        now = self._clock()
+        if self._is_idle(entry[0], now):
+            # the key holds credentials, so it is not logged
+            logger.debug("Evicting an idle client")
+            del self._clients[key]
+            self._evictions += 1
+            return None
+
+        self._clients[key] = (now, entry[1])
+        self._clients.move_to_end(key)
+        return entry[1]
+
+    def _is_idle(self, last_used: float, now: float) -> bool:
+        return self._idle_ttl is not None and now - last_used >= self._idle_ttl
+
+    def _evict(self) -> None:
+        if self._idle_ttl is not None:
+            now = self._clock()
+            idle = [
+                key
+                for key, (last_used, _) in self._clients.items()
+                if self._is_idle(last_used, now)
+            ]
+            for key in idle:
+                del self._clients[key]
+            self._evictions += len(idle)
+
+        while len(self._clients) > self._max_size:
+            self._clients.popitem(last=False)
+            self._evictions += 1
+
+
+client_pool = ClientPool()
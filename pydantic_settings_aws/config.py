@@ -1,4 +1,5 @@
-from typing import Any
+from collections.abc import Callable
+from typing import Any, Literal
 
 from pydantic_settings import SettingsConfigDict
 
@@ -37,6 +38,61 @@ class AWSSettingsConfigDict(SettingsConfigDict, total=False):
     aws_session_token: str | None
     """Temporary session token, required when using short-lived STS credentials. When ``None``, boto3 resolves credentials through the standard chain."""
 
+    # boto3 client args
+    client_max_pool_connections: int | None
+    """Maximum number of connections each boto3 client keeps in its connection pool. When ``None``, botocore's default (10) is used."""
+
+    client_connect_timeout: float | None
+    """Seconds a boto3 client waits to open a connection. When ``None``, botocore's default (60) is used."""
+
+    client_read_timeout: float | None
+    """Seconds a boto3 client waits to read a response. When ``None``, botocore's default (60) is used."""
+
+    client_retry_mode: Literal["legacy", "standard", "adaptive"] | None
+    """botocore retry mode of the boto3 clients. When ``None``, the mode configured in the environment or AWS config file is used."""
+
+    client_max_attempts: int | None
+    """Maximum number of attempts of each boto3 client call, including the first one. When ``None``, the retry mode default is used, or 1 when ``throttle_max_attempts`` retries throttling errors."""
+
+    # Throttling args
+    throttle_rate: float | None
+    """Requests per second sent at most per session and service, shared by every settings class of the process using the same session. When ``None`` (the default), requests are not rate limited."""
+
+    throttle_burst: float | None
+    """Requests that can be sent at once before ``throttle_rate`` applies. When ``None``, defaults to ``throttle_rate``, and at least 1."""
+
+    throttle_max_attempts: int | None
+    """Attempts of each request on throttling errors, including the first one, with exponential backoff and full jitter between them. Unless ``client_max_attempts`` is set, botocore retries are then turned off. When ``None``, throttling errors are raised right away."""
+
+    throttle_backoff_base: float | None
+    """Seconds the first retry waits at most, doubled on each retry. When ``None``, defaults to 0.1."""
+
+    throttle_backoff_cap: float | None
+    """Seconds any retry waits at most. When ``None``, defaults to 20."""
+
+    throttle_startup_jitter: float | None
+    """Seconds the first requests of the process are randomly delayed by at most, so that processes started together spread their requests. When ``None`` (the default), requests are not delayed."""
+
+    # Transport args
+    transport: Literal["boto3", "lambda_extension"] | None
+    """How the clients created from settings fetch values. With ``"lambda_extension"``, parameters and secrets are read through the local HTTP cache of the AWS Parameters and Secrets Lambda Extension, falling back to boto3 when it can't answer. When ``None``, defaults to ``"boto3"``. Clients given with ``ssm_client``, ``secrets_client`` or a field descriptor are always used as they are."""
+
+    lambda_extension_endpoint: str | None
+    """URL of the AWS Parameters and Secrets Lambda Extension. When ``None``, ``http://localhost`` with the ``PARAMETERS_SECRETS_EXTENSION_HTTP_PORT`` variable, or port 2773, is used."""
+
+    lambda_extension_timeout: float | None
+    """Seconds to wait for the Lambda extension before falling back to boto3. When ``None``, defaults to 1."""
+
+    # Region args
+    aws_regions: list[str] | None
+    """Regions the clients created from settings read from, by priority, e.g. ``["eu-west-1", "eu-central-1"]``. A region that can't answer, because of a connection error, a timeout, throttling or a 5xx response, fails over to the next one. When ``None`` (the default), only ``aws_region`` is read. Ignored by the Lambda extension transport and by ``aload()``."""
+
+    region_hedge_delay: float | None
+    """Seconds to wait for a region of ``aws_regions`` before also sending the call to the next one, the first response winning. When ``None`` (the default), the next region is only called when a region can't answer."""
+
+    region_order: Literal["priority", "latency"] | None
+    """Order in which ``aws_regions`` are tried. With ``"latency"``, regions are tried from the fastest to the slowest, by the moving average of their recent calls in the process. When ``None``, defaults to ``"priority"``."""
+
     # Secrets Manager args
     secrets_name: str
     """Name or full ARN of the Secrets Manager secret to retrieve. Required when using ``SecretsManagerSettingsSource``."""
@@ -53,3 +109,39 @@ class AWSSettingsConfigDict(SettingsConfigDict, total=False):
     # SSM Parameter Store args
     ssm_client: Any
     """Pre-constructed ``boto3`` SSM client. Useful for injecting custom clients in tests. When not provided, a client is created automatically."""
+
+    ssm_prefix: str | None
+    """Prefix prepended to the parameter name of every SSM field, e.g. ``"/tenants/acme"`` to read ``"/db/host"`` from ``"/tenants/acme/db/host"``. ARNs are read as they are. Useful to share a settings class between tenants or environments."""
+
+    ssm_path: str | None
+    """Parameter hierarchy (e.g. ``"/myapp/prod"``) read with ``GetParametersByPath`` by ``ParameterStoreBaseSettings``. Fields without a parameter name are mapped to the parameters under it by name. When ``None``, every field is fetched by name."""
+
+    ssm_path_recursive: bool
+    """Whether ``ssm_path`` is read recursively, mapping sub-hierarchies to nested models by path segment. Defaults to ``False``, which only reads the parameters directly under ``ssm_path``."""
+
+    # Resolution args
+    resolve_max_workers: int | None
+    """Maximum number of threads ``AWSBaseSettings`` uses to fetch its distinct SSM batches and secrets concurrently. When ``None`` or ``1`` (the default), they are fetched one after another."""
+
+    resolve_lazily: bool
+    """Whether ``LazyAWSBaseSettings`` and ``LazyParameterStoreBaseSettings`` defer their AWS fields to their first access instead of fetching them on instantiation. Fields of the same ``group`` are fetched together, and ``resolve_all()`` fetches every remaining field. Defaults to ``True`` on those classes. Setting it on other classes raises ``AWSSettingsConfigError``."""
+
+    # Value cache args
+    value_cache_ttl: float | None
+    """Seconds a value resolved from AWS is reused by later instantiations of any settings class in the process. When ``None`` (the default), values are fetched from AWS on every instantiation."""
+
+    value_cache_max_entries: int | None
+    """Maximum number of values kept by the process-wide value cache before the least recently used one is evicted. The cache is shared, so the last configured value applies. When ``None``, the current capacity (1024 by default) is kept."""
+
+    # Snapshot args
+    snapshot_dir: str | None
+    """Directory of the encrypted snapshots of the values resolved from AWS. When set, a fresh snapshot is used instead of AWS on instantiation and revalidated in the background once per process, and a stale one is used when AWS is unreachable. Requires the ``snapshot`` extra. When ``None`` (the default), no snapshot is read or written."""
+
+    snapshot_key: bytes | str | Callable[[], bytes] | None
+    """Key material the snapshots are encrypted with, or a callable returning it, for example by decrypting a data key with KMS. The callable is called once per process. When ``None``, the ``PYDANTIC_SETTINGS_AWS_SNAPSHOT_KEY`` environment variable is used."""
+
+    snapshot_ttl: float | None
+    """Seconds a snapshot is used instead of AWS on instantiation. When ``None``, defaults to 300."""
+
+    snapshot_max_staleness: float | None
+    """Maximum age, in seconds, of a snapshot used when AWS is unreachable. When ``None`` (the default), any snapshot can be used."""
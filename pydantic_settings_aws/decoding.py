@@ -0,0 +1,107 @@
+import json
+from collections.abc import Callable, Collection
+from typing import Any, Literal, NamedTuple
+
+JSONBackendName = Literal["orjson", "msgspec", "json"]
+
+JSON_BACKENDS: tuple[JSONBackendName, ...] = ("orjson", "msgspec", "json")
+
+
+class JSONBackend(NamedTuple):
+    """A JSON decoder of secret contents."""
+
+    name: JSONBackendName
+    """The module decoding JSON."""
+
+    loads: Callable[[str | bytes], Any]
+    """Decodes a ``str`` or UTF-8 ``bytes`` document."""
+
+    errors: tuple[type[Exception], ...]
+    """The errors ``loads`` raises on invalid documents."""
+
+
+_backends: dict[JSONBackendName | None, JSONBackend] = {}
+
+
+def get_json_backend(name: JSONBackendName | None = None) -> JSONBackend:
+    """Return the JSON backend ``name``, or the fastest one installed.
+
+    ``orjson`` is used when installed, then ``msgspec``, then the standard
+    library ``json``. Backends are imported on first use.
+
+    Raises:
+        ImportError: If the ``name`` backend is not installed.
+    """
+    backend = _backends.get(name)
+    if backend is None:
+        backend = _backends[name] = _load_json_backend(name)
+
+    return backend
+
+
+def _load_json_backend(name: JSONBackendName | None) -> JSONBackend:
+    if name is None:
+        for candidate in JSON_BACKENDS[:-1]:
+            try:
+                return get_json_backend(candidate)
+            except ImportError:
+                continue
+
+        return get_json_backend("json")
+
+    if name == "orjson":
+        import orjson  # type: ignore[import-not-found, unused-ignore]
+
+        return JSONBackend(name, orjson.loads, (orjson.JSONDecodeError,))
+
+    if name == "msgspec":
+        import msgspec  # type: ignore[import-not-found]
+
+        return JSONBackend(name, msgspec.json.decode, (msgspec.DecodeError,))
+
+    return JSONBackend(name, json.loads, (ValueError,))
+
+
+def decode_json_object(
+    content: str | bytes,
+    keys: Collection[str] | None = None,
+    backend: JSONBackend | None = None,
+) -> Any:
+    """Decode a JSON document, keeping only ``keys`` of its top-level object.
+
+    ``bytes`` are decoded as UTF-8 by the backend itself, without an
+    intermediate ``str`` copy. Documents the backend rejects are decoded
+    again with the standard library ``json``, so that every backend reads
+    the same documents. The rest of the document is dropped as soon as
+    the keys are extracted, so that large secrets don't stay in memory.
+
+    Args:
+        content (str | bytes): The JSON document.
+        keys (Collection[str] | None): The keys to keep. When ``None``, or
+            when the document is not an object, the whole document is returned.
+        backend (JSONBackend | None): The JSON backend. When ``None``, the
+            fastest one installed is used.
+
+    Raises:
+        ValueError: If ``content`` is not valid JSON or not valid UTF-8.
+    """
+    backend = backend or get_json_backend()
+
+    try:
+        document = backend.loads(content)
+    except backend.errors as e:
+        if backend.name == "json":
+            raise ValueError(str(e)) from e
+
+        # orjson and msgspec reject documents the standard library reads,
+        # like NaN or integers over 64 bits, so it gets the last word
+        fallback = get_json_backend("json")
+        try:
+            document = fallback.loads(content)
+        except fallback.errors:
+            raise ValueError(str(e)) from e
+
+    if keys is None or not isinstance(document, dict):
+        return document
+
+    return {key: document[key] for key in keys if key in document}
@@ -32,3 +32,8 @@ class SSMError(PydanticSettingsAWSError):
 
 class ParameterNotFoundError(SSMError):
     """Raised when the requested parameter does not exist in Parameter Store."""
+
+    def __init__(self, message: str, ssm_name: str | None = None) -> None:
+        super().__init__(message)
+        self.ssm_name = ssm_name
+        """The name of the missing parameter, when known."""
@@ -0,0 +1,267 @@
+import base64
+import http.client
+import json
+import os
+import threading
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+from .logger import logger
+
+PORT_ENV = "PARAMETERS_SECRETS_EXTENSION_HTTP_PORT"
+
+DEFAULT_PORT = 2773
+
+DEFAULT_TIMEOUT = 1.0
+
+TOKEN_HEADER = "X-Aws-Parameters-Secrets-Token"
+
+
+def get_default_endpoint() -> str:
+    """Return the endpoint of the extension, from ``PARAMETERS_SECRETS_EXTENSION_HTTP_PORT``."""
+    return f"http://localhost:{os.environ.get(PORT_ENV, DEFAULT_PORT)}"
+
+
+class LambdaExtensionClient:
+    """Client reading through the AWS Parameters and Secrets Lambda Extension.
+
+    The extension serves cached parameters and secrets on a local HTTP
+    endpoint. This client mirrors the boto3 methods the library calls and
+    returns responses of the same shape, so it can be used wherever a boto3
+    client is. Requests are sent on a keep-alive connection per thread, with
+    ``AWS_SESSION_TOKEN`` in the ``X-Aws-Parameters-Secrets-Token`` header.
+
+    When the extension does not answer, or answers with an error, the call is
+    made with the boto3 client returned by ``fallback`` instead, so that AWS
+    errors like a missing parameter are the ones boto3 raises. The fallback
+    client is only created on first use.
+
+    Args:
+        service (str): ``"ssm"`` or ``"secretsmanager"``.
+        fallback (Callable[[], Any]): Returns the boto3 client of the service.
+        endpoint (str | None): The URL of the extension. When ``None``, uses
+            ``localhost`` and the ``PARAMETERS_SECRETS_EXTENSION_HTTP_PORT``
+            variable, or port 2773.
+        timeout (float): Seconds to wait for the extension before falling back.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        fallback: Callable[[], Any],
+        endpoint: str | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        url = urlsplit(endpoint or get_default_endpoint())
+
+        self.service = service
+        self.endpoint = f"{url.scheme}://{url.netloc}"
+        self.timeout = timeout
+        self._host = url.hostname or "localhost"
+        self._port = url.port or DEFAULT_PORT
+        self._fallback = fallback
+        self._fallback_client: Any = None
+        self._local = threading.local()
+        self._connections: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    @property
+    def fallback_client(self) -> Any:
+        """The boto3 client used when the extension can't answer."""
+        if self._fallback_client is None:
+            with self._lock:
+                if self._fallback_client is None:
+                    self._fallback_client = self._fallback()
+
+        return self._fallback_client
+
+    def get_parameter(self, Name: str, WithDecryption: bool = False) -> Any:
+        response = self._get_parameter(Name, WithDecryption)
+        if response is None:
+            return self.fallback_client.get_parameter(
+                Name=Name, WithDecryption=WithDecryption
+            )
+
+        return response
+
+    def get_parameters(self, Names: list[str], WithDecryption: bool = False) -> Any:
+        """Read each name from the extension, and the missing ones with one boto3 call."""
+        parameters: list[dict[str, Any]] = []
+        missing: list[str] = []
+
+        for name in Names:
+            response = self._get_parameter(name, WithDecryption)
+            if response is None:
+                missing.append(name)
+            else:
+                parameters.append(response["Parameter"])
+
+        if not missing:
+            return {"Parameters": parameters, "InvalidParameters": []}
+
+        response = self.fallback_client.get_parameters(
+            Names=missing, WithDecryption=WithDecryption
+        )
+
+        return {
+            **response,
+            "Parameters": [*parameters, *response.get("Parameters", [])],
+        }
+
+    def get_parameters_by_path(self, **kwargs: Any) -> Any:
+        # not served by the extension
+        return self.fallback_client.get_parameters_by_path(**kwargs)
+
+    def get_secret_value(
+        self,
+        SecretId: str,
+        VersionId: str | None = None,
+        VersionStage: str | None = None,
+    ) -> Any:
+        query = {"secretId": SecretId, "versionId": VersionId, "versionStage": VersionStage}
+        response = self._get("/secretsmanager/get", query)
+
+        if response is None:
+            secrets_args = {
+                k: v
+                for k, v in (("VersionId", VersionId), ("VersionStage", VersionStage))
+                if v is not None
+            }
+            return self.fallback_client.get_secret_value(
+                SecretId=SecretId, **secrets_args
+            )
+
+        if isinstance(response.get("SecretBinary"), str):
+            # JSON responses hold binary secrets base64 encoded, boto3 decodes them
+            response["SecretBinary"] = base64.b64decode(response["SecretBinary"])
+
+        return response
+
+    def batch_get_secret_value(
+        self, SecretIdList: list[str], NextToken: str | None = None
+    ) -> Any:
+        """Read each secret from the extension, and the missing ones with boto3.
+
+        Every page of the boto3 calls is read here, so the response never has
+        a ``NextToken``.
+        """
+        secret_values: list[dict[str, Any]] = []
+        missing: list[str] = []
+
+        for secret_id in SecretIdList:
+            response = self._get("/secretsmanager/get", {"secretId": secret_id})
+            if response is None:
+                missing.append(secret_id)
+                continue
+
+            if isinstance(response.get("SecretBinary"), str):
+                response["SecretBinary"] = base64.b64decode(response["SecretBinary"])
+            secret_values.append(response)
+
+        errors: list[dict[str, Any]] = []
+        kwargs: dict[str, Any] = {"SecretIdList": missing}
+        while missing:
+            response = self.fallback_client.batch_get_secret_value(**kwargs)
+            secret_values.extend(response.get("SecretValues", []))
+            errors.extend(response.get("Errors", []))
+            if not response.get("NextToken"):
+                break
+            kwargs["NextToken"] = response["NextToken"]
+
+        return {"SecretValues": secret_values, "Errors": errors}
+
+    def close(self) -> None:
+        """Close the connections to the extension and the fallback client."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            fallback_client, self._fallback_client = self._fallback_client, None
+
+        for connection in connections:
+            connection.close()
+
+        close = getattr(fallback_client, "close", None)
+        if callable(close):
+            close()
+
+    def _get_parameter(self, name: str, with_decryption: bool) -> dict[str, Any] | None:
+        return self._get(
+            "/systemsmanager/parameters/get",
+            {"name": name, "withDecryption": str(with_decryption).lower()},
+        )
+
+    def _get(self, path: str, query: dict[str, Any]) -> dict[str, Any] | None:
+        """Send a GET request to the extension.
+
+        Returns:
+            dict[str, Any] | None: The decoded response, or ``None`` if the
+                extension could not answer.
+        """
+        url = path + "?" + urlencode({k: v for k, v in query.items() if v is not None})
+        headers = {}
+        token = os.environ.get("AWS_SESSION_TOKEN")
+        if token:
+            headers[TOKEN_HEADER] = token
+
+        # a kept-alive connection may have been closed by the extension, so
+        # a request failing on one is sent again on a new connection
+        while True:
+            connection = self._get_connection()
+            reused = self._local.requests > 0
+            try:
+                connection.request("GET", url, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                self._drop_connection()
+                if reused:
+                    continue
+
+                logger.debug(
+                    "Lambda extension unavailable, falling back to boto3: %r", e
+                )
+                return None
+
+            self._local.requests += 1
+            break
+
+        if response.status != 200:
+            logger.debug(
+                "Lambda extension answered %d for %s, falling back to boto3",
+                response.status,
+                path,
+            )
+            return None
+
+        try:
+            content: dict[str, Any] = json.loads(body)
+        except ValueError:
+            logger.debug("Invalid Lambda extension response for %s", path)
+            return None
+
+        return content
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        connection: http.client.HTTPConnection | None = getattr(
+            self._local, "connection", None
+        )
+
+        if connection is None:
+            connection = http.client.HTTPConnection(
+                self._host, self._port, timeout=self.timeout
+            )
+            self._local.connection = connection
+            self._local.requests = 0
+            with self._lock:
+                self._connections.append(connection)
+
+        return connection
+
+    def _drop_connection(self) -> None:
+        connection = self._local.connection
+        self._local.connection = None
+        connection.close()
+
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
@@ -22,6 +22,10 @@ class Secrets:
         Use the model field name as the key (equivalent to the raw dict annotation)::
 
             db_host: Annotated[str, Secrets()]
+
+        Read the field from another secret than ``secrets_name``::
+
+            api_key: Annotated[str, Secrets(secret="myapp/prod/api", field="key")]
     """
 
     field: str | None = None
@@ -30,6 +34,12 @@ class Secrets:
     client: Any = dc_field(default=None, repr=False)
     """A pre-constructed ``boto3`` Secrets Manager client to use for this field. When ``None``, the client is resolved from :class:`AWSSettingsConfigDict` or created automatically."""
 
+    group: str | None = None
+    """With ``resolve_lazily``, the fields of the same group are fetched together on the first access to any of them. When ``None``, the field is fetched with the other fields of its secret only."""
+
+    secret: str | None = None
+    """The name or ARN of the secret to read the field from. When ``None``, the ``secrets_name`` of :class:`AWSSettingsConfigDict` is used. ``SecretsManagerBaseSettings`` reads every secret of its fields with a single ``BatchGetSecretValue`` call."""
+
 
 @dataclass
 class SSM:
@@ -61,3 +71,6 @@ class SSM:
 
     client: Any = dc_field(default=None, repr=False)
     """A pre-constructed ``boto3`` SSM client to use for this field. When ``None``, the client is resolved from :class:`AWSSettingsConfigDict` or created automatically. Useful for per-field multi-account or multi-region setups."""
+
+    group: str | None = None
+    """With ``resolve_lazily``, the fields of the same group are fetched together, in one batch, on the first access to any of them. When ``None``, the field is fetched alone."""
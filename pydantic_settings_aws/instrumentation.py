@@ -0,0 +1,229 @@
+import threading
+import time
+from collections.abc import Callable
+from types import TracebackType
+from typing import Any
+
+from typing_extensions import Self
+
+from .errors import AWSSettingsConfigError
+from .logger import logger
+
+CREATE_CLIENT = "pydantic_settings_aws.create_client"
+
+GET_PARAMETER = "pydantic_settings_aws.get_parameter"
+
+GET_PARAMETERS = "pydantic_settings_aws.get_parameters"
+
+GET_PARAMETERS_BY_PATH = "pydantic_settings_aws.get_parameters_by_path"
+
+GET_SECRET_VALUE = "pydantic_settings_aws.get_secret_value"
+
+BATCH_GET_SECRET_VALUE = "pydantic_settings_aws.batch_get_secret_value"
+
+DECODE_SECRET = "pydantic_settings_aws.decode_secret"
+
+BUILD_SETTINGS = "pydantic_settings_aws.build_settings"
+
+
+class Span:
+    """A timed operation of the library, passed to the span hooks.
+
+    Attributes:
+        name (str): The operation, one of the span name constants of this
+            module, like ``"pydantic_settings_aws.get_secret_value"``.
+        attributes (dict[str, Any]): Details of the operation, such as
+            ``service``, ``name``, ``cache_hit`` or ``bytes``.
+        start_time (float): ``time.perf_counter()`` when the operation started.
+        duration (float | None): Seconds the operation took, once it ended.
+        error (BaseException | None): The error the operation raised, if any.
+    """
+
+    __slots__ = ("_hooks", "attributes", "duration", "error", "name", "start_time")
+
+    def __init__(
+        self, name: str, attributes: dict[str, Any], hooks: "tuple[SpanHook, ...]"
+    ) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.start_time = 0.0
+        self.duration: float | None = None
+        self.error: BaseException | None = None
+        self._hooks = hooks
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> Self:
+        for hook in self._hooks:
+            _call_hook(hook.on_start, self)
+
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.duration = time.perf_counter() - self.start_time
+        self.error = exc
+
+        for hook in reversed(self._hooks):
+            _call_hook(hook.on_end, self)
+
+
+class _NoopSpan:
+    """Span returned when no hook is registered, so that spans cost close to nothing."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class SpanHook:
+    """Base class of the objects notified when a span starts and ends.
+
+    Override :meth:`on_start` and :meth:`on_end`, then register the hook with
+    :func:`add_span_hook`. Hooks run on the thread, or in the task, of the
+    operation, in registration order on start and in reverse order on end.
+    Their errors are logged and ignored.
+    """
+
+    def on_start(self, span: Span) -> None:
+        """Called before the operation starts. ``span.duration`` is not set yet."""
+
+    def on_end(self, span: Span) -> None:
+        """Called once the operation ended, even if it raised."""
+
+
+class CallbackSpanHook(SpanHook):
+    """Calls ``callback`` with every span that ended."""
+
+    def __init__(self, callback: Callable[[Span], None]) -> None:
+        self.callback = callback
+
+    def on_end(self, span: Span) -> None:
+        self.callback(span)
+
+
+class OpenTelemetrySpanHook(SpanHook):
+    """Emits an OpenTelemetry span for every span of the library.
+
+    Spans are made current while the operation runs, so that spans nest
+    under the application's spans and under each other.
+
+    Requires the ``opentelemetry-api`` package, installed with the ``otel`` extra.
+
+    Args:
+        tracer (Any): The OpenTelemetry tracer. When ``None``, the tracer of
+            the global tracer provider is used.
+
+    Raises:
+        AWSSettingsConfigError: If ``opentelemetry-api`` is not installed.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import context, trace  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise AWSSettingsConfigError(
+                "opentelemetry-api is required to emit OpenTelemetry spans, "
+                "install it with 'pip install pydantic-settings-aws[otel]'"
+            ) from e
+
+        self._context = context
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("pydantic_settings_aws")
+        self._active: dict[int, tuple[Any, Any]] = {}
+
+    def on_start(self, span: Span) -> None:
+        otel_span = self._tracer.start_span(span.name, attributes=span.attributes)
+        token = self._context.attach(self._trace.set_span_in_context(otel_span))
+        self._active[id(span)] = (otel_span, token)
+
+    def on_end(self, span: Span) -> None:
+        otel_span, token = self._active.pop(id(span))
+        self._context.detach(token)
+
+        otel_span.set_attributes(span.attributes)
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, repr(span.error))
+            )
+        otel_span.end()
+
+
+_hooks: tuple[SpanHook, ...] = ()
+_hooks_lock = threading.Lock()
+
+
+def add_span_hook(hook: SpanHook | Callable[[Span], None]) -> SpanHook:
+    """Notify ``hook`` of every span of the library.
+
+    Args:
+        hook (SpanHook | Callable[[Span], None]): A :class:`SpanHook`, or a
+            callable called with every span that ended.
+
+    Returns:
+        SpanHook: The registered hook, to give to :func:`remove_span_hook`.
+    """
+    global _hooks
+
+    if not isinstance(hook, SpanHook):
+        hook = CallbackSpanHook(hook)
+
+    with _hooks_lock:
+        _hooks = (*_hooks, hook)
+
+    return hook
+
+
+def remove_span_hook(hook: SpanHook) -> None:
+    """Stop notifying ``hook``."""
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = tuple(registered for registered in _hooks if registered is not hook)
+
+
+def span(name: str, /, **attributes: Any) -> Span | _NoopSpan:
+    """Return a context manager timing the operation ``name``.
+
+    When no hook is registered, a shared no-op span is returned.
+    """
+    hooks = _hooks
+    if not hooks:
+        return _NOOP_SPAN
+
+    return Span(name, attributes, hooks)
+
+
+def _call_hook(method: Callable[[Span], None], span: Span) -> None:
+    try:
+        method(span)
+    # a failing hook must not fail the operation it traces
+    except Exception:  # noqa: BLE001
+        logger.exception("A span hook failed for %s", span.name)
+
+
+def _after_fork_in_child() -> None:
+    """Replace the lock, as a parent thread may have held it during the fork.
+
+    The span hooks are kept.
+    """
+    global _hooks_lock
+
+    _hooks_lock = threading.Lock()
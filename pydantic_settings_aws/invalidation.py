@@ -0,0 +1,468 @@
+import functools
+import json
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any, NamedTuple
+
+from pydantic_settings import BaseSettings
+from typing_extensions import Self
+
+from . import aws, plan, utils
+from .cache import ValueCache, ValueCacheKey, value_cache
+from .errors import AWSSettingsConfigError
+from .logger import logger
+from .refresh import RefreshingSettings
+
+EventFeed = Callable[[], Iterable[Mapping[str, Any]]]
+
+SSM_CHANGE_DETAIL_TYPE = "Parameter Store Change"
+
+# CloudTrail events of Secrets Manager after which a secret reads differently
+SECRET_CHANGE_EVENTS = frozenset(
+    {
+        "PutSecretValue",
+        "UpdateSecret",
+        "UpdateSecretVersionStage",
+        "RotationSucceeded",
+        "DeleteSecret",
+        "RestoreSecret",
+    }
+)
+
+# seconds the polling thread waits after a feed error before polling again
+FEED_ERROR_DELAY = 5.0
+
+SQS_MAX_MESSAGES = 10
+
+
+class ChangeEvent(NamedTuple):
+    """A change of a parameter or a secret, parsed from an EventBridge event."""
+
+    service: aws.AWSService
+    """``"ssm"`` or ``"secretsmanager"``."""
+
+    name: str
+    """The parameter name, or the secret name or ARN the event was sent for."""
+
+    arn: str | None = None
+    """The ARN of the parameter or secret, when the event has it."""
+
+    def affects(self, service: str, name: str) -> bool:
+        """Return whether the value read from ``service`` with ``name`` changed.
+
+        ``name`` is a parameter name or ARN, a secret name or ARN, or the
+        value cache name of an ``ssm_path`` hierarchy, which changes with any
+        parameter under it.
+        """
+        if service != self.service:
+            return False
+
+        if self.service == "secretsmanager":
+            return not get_secret_names(name).isdisjoint(
+                get_secret_names(self.name) | get_secret_names(self.arn)
+            )
+
+        if name in (self.name, self.arn):
+            return True
+
+        if name.endswith("/**"):
+            return self.name.startswith(name[:-2])
+
+        if name.endswith("/*"):
+            return self.name.rpartition("/")[0] == name[:-2]
+
+        return False
+
+
+def parse_change_event(event: Mapping[str, Any]) -> ChangeEvent | None:
+    """Return the change described by an EventBridge event.
+
+    SSM ``Parameter Store Change`` events and the CloudTrail events of Secrets
+    Manager changing a secret, like ``PutSecretValue`` or
+    ``RotationSucceeded``, are parsed. Other events return ``None``.
+    """
+    detail = event.get("detail") or {}
+    resources = event.get("resources") or [None]
+
+    if event.get("source") == "aws.ssm":
+        if event.get("detail-type") != SSM_CHANGE_DETAIL_TYPE:
+            return None
+
+        if not detail.get("name"):
+            return None
+
+        return ChangeEvent("ssm", detail["name"], resources[0])
+
+    if event.get("source") != "aws.secretsmanager":
+        return None
+
+    if detail.get("eventName") not in SECRET_CHANGE_EVENTS:
+        return None
+
+    arn = (detail.get("responseElements") or {}).get("arn") or (
+        detail.get("additionalEventData") or {}
+    ).get("SecretId")
+    secret_id = (detail.get("requestParameters") or {}).get("secretId") or arn
+    if not secret_id:
+        return None
+
+    return ChangeEvent("secretsmanager", secret_id, arn)
+
+
+def get_secret_names(secret_id: str | None) -> set[str]:
+    """Return the names a secret may be read with, from its name or ARN.
+
+    The ARN of a secret ends with its name and a random 6 characters suffix,
+    which a partial ARN leaves out, so both names are returned.
+    """
+    if not secret_id:
+        return set()
+
+    if not secret_id.startswith("arn:"):
+        return {secret_id}
+
+    name = secret_id.partition(":secret:")[2]
+    names = {secret_id, name}
+    if len(name) > 7 and name[-7] == "-":
+        names.add(name[:-7])
+
+    return names
+
+
+def get_references(
+    settings_cls: type[BaseSettings],
+) -> frozenset[tuple[str, str]]:
+    """Return the ``(service, name)`` of every value ``settings_cls`` reads.
+
+    Names are the parameter names, with ``ssm_prefix``, the value cache names
+    of ``ssm_path`` hierarchies, and the secret names or ARNs.
+    """
+    from .settings import AWSBaseSettings, ParameterStoreBaseSettings
+
+    references: set[tuple[str, str]] = set()
+
+    if issubclass(settings_cls, AWSBaseSettings):
+        routes = plan.get_plan(settings_cls, "aws").routes
+    elif issubclass(settings_cls, ParameterStoreBaseSettings):
+        ssm_plan = plan.get_plan(settings_cls, "ssm")
+        routes = ssm_plan.routes
+        ssm_path = utils.get_config_value(settings_cls, "ssm_path")
+        if ssm_path and ssm_plan.path_fields:
+            recursive = bool(
+                utils.get_config_value(settings_cls, "ssm_path_recursive")
+            )
+            path_name = aws.get_ssm_path_cache_name(ssm_path, recursive)
+            references.add(("ssm", path_name))
+    else:
+        routes = plan.get_plan(settings_cls, "secrets").routes
+
+    for route in routes:
+        if route.service == "ssm":
+            references.add(("ssm", route.key))
+        else:
+            secrets_args = aws.get_secrets_args(settings_cls, route.secret)
+            references.add(("secretsmanager", secrets_args.secrets_name))
+
+    return frozenset(references)
+
+
+class SQSEventFeed:
+    """Event feed receiving EventBridge events from an SQS queue.
+
+    Each call long-polls the queue once and returns the events of the messages
+    received, sent by an EventBridge rule either directly or through SNS, as
+    an :class:`SQSEventBatch`. Messages are only deleted when the batch is
+    acknowledged, which :meth:`ChangeInvalidator.poll` does once the events
+    were applied and every refresh succeeded, so that the events of a batch
+    whose handling failed are received again.
+
+    Example::
+
+        queue_url = "https://sqs.eu-west-1.amazonaws.com/123456789012/settings"
+        invalidator = ChangeInvalidator(SQSEventFeed(queue_url))
+
+    Args:
+        queue_url (str): The URL of the queue.
+        client (Any): A boto3 SQS client. When ``None``, one is created with
+            the default session on the first call.
+        wait_time (int): Seconds each call waits for messages, up to 20.
+        max_messages (int): Messages received per call, up to 10.
+    """
+
+    def __init__(
+        self,
+        queue_url: str,
+        client: Any = None,
+        wait_time: int = 20,
+        max_messages: int = SQS_MAX_MESSAGES,
+    ) -> None:
+        self.queue_url = queue_url
+        self.wait_time = wait_time
+        self.max_messages = max_messages
+        self._client = client
+
+    def __call__(self) -> "SQSEventBatch":
+        response = self._get_client().receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=self.max_messages,
+            WaitTimeSeconds=self.wait_time,
+        )
+
+        return SQSEventBatch(self, response.get("Messages", []))
+
+    def delete(self, messages: list[Mapping[str, Any]]) -> None:
+        """Delete received ``messages`` from the queue.
+
+        Messages that could not be deleted are logged, and are received again
+        once their visibility timeout expires.
+        """
+        if not messages:
+            return
+
+        response = self._get_client().delete_message_batch(
+            QueueUrl=self.queue_url,
+            Entries=[
+                {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                for i, message in enumerate(messages)
+            ],
+        )
+        for failed in response.get("Failed", []):
+            logger.warning(
+                "Failed to delete message %s from %s, it will be received again: %s %s",
+                failed.get("Id"),
+                self.queue_url,
+                failed.get("Code"),
+                failed.get("Message", ""),
+            )
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            # imported on the first call, as boto3 is slow to import
+            import boto3  # type: ignore[import-untyped]
+
+            self._client = boto3.client("sqs")
+
+        return self._client
+
+
+class SQSEventBatch:
+    """The events of the messages an :class:`SQSEventFeed` call received.
+
+    Iterating the batch yields the events, and :meth:`acknowledge` deletes
+    the messages, including the ones that were not EventBridge events.
+    """
+
+    def __init__(self, feed: SQSEventFeed, messages: list[Mapping[str, Any]]) -> None:
+        self.feed = feed
+        self.messages = messages
+
+    def __iter__(self) -> Iterator[Mapping[str, Any]]:
+        for message in self.messages:
+            event = _read_message_body(message.get("Body", ""))
+            if event is not None:
+                yield event
+
+    def acknowledge(self) -> None:
+        """Delete the messages of the batch from the queue."""
+        self.feed.delete(self.messages)
+
+
+def _read_message_body(body: str) -> Mapping[str, Any] | None:
+    try:
+        event = json.loads(body)
+        if event.get("Type") == "Notification" and "Message" in event:
+            event = json.loads(event["Message"])
+    except (ValueError, AttributeError) as e:
+        # malformed messages are deleted, they would fail again
+        logger.warning("Ignoring a message that is not an EventBridge event: %r", e)
+        return None
+
+    return event if isinstance(event, dict) else None
+
+
+class ChangeInvalidator:
+    """Applies parameter and secret change events to the cached and refreshed settings.
+
+    For each SSM ``Parameter Store Change`` event, or Secrets Manager
+    change, like a ``PutSecretValue`` or a ``RotationSucceeded``, the value
+    cache entries of the changed parameter or secret, and of the
+    ``ssm_path`` hierarchies containing it, are invalidated, and the
+    :class:`RefreshingSettings` watched whose class reads the changed value
+    are refreshed. Other settings are not touched.
+
+    Events are either given to :meth:`handle`, for example by a function
+    called with them, or polled from ``feed`` on a daemon thread started
+    with :meth:`start`. :class:`SQSEventFeed` polls the queue an EventBridge
+    rule sends them to.
+
+    Example::
+
+        settings = RefreshingSettings(DatabaseSettings, interval=3600)
+
+        invalidator = ChangeInvalidator(SQSEventFeed(queue_url))
+        invalidator.watch(settings)
+        invalidator.start()
+
+    Args:
+        feed (EventFeed | None): Returns the next EventBridge events when
+            called, waiting for them for a while, like :class:`SQSEventFeed`.
+            Required by :meth:`start` only.
+        cache (ValueCache): The value cache to invalidate. Defaults to
+            :data:`value_cache`.
+        start (bool): Whether to start polling ``feed`` right away. Defaults
+            to ``False``.
+    """
+
+    def __init__(
+        self,
+        feed: EventFeed | None = None,
+        cache: ValueCache = value_cache,
+        *,
+        start: bool = False,
+    ) -> None:
+        self.feed = feed
+        self.cache = cache
+        self._watched: dict[RefreshingSettings[Any], frozenset[tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        if start:
+            self.start()
+
+    def watch(self, settings: RefreshingSettings[Any]) -> None:
+        """Refresh ``settings`` when a value its class reads changes."""
+        references = get_references(settings.settings_cls)
+
+        with self._lock:
+            self._watched[settings] = references
+
+    def unwatch(self, settings: RefreshingSettings[Any]) -> None:
+        """Stop refreshing ``settings`` on changes."""
+        with self._lock:
+            self._watched.pop(settings, None)
+
+    def handle(self, events: Iterable[Mapping[str, Any]]) -> list[ChangeEvent]:
+        """Apply EventBridge events, ignoring the ones that don't change a value.
+
+        Each event is applied to the value cache as it is iterated, then the
+        affected settings are refreshed once for all of them. Refresh errors
+        are logged, and the current settings are kept.
+
+        Returns:
+            list[ChangeEvent]: The changes parsed from ``events``.
+        """
+        return self._apply(events)[0]
+
+    def poll(self) -> list[ChangeEvent]:
+        """Handle the next events of ``feed``.
+
+        When the events returned by ``feed`` have an ``acknowledge()`` method,
+        like the batches of :class:`SQSEventFeed`, it is called once the
+        events were applied and every refresh succeeded. Otherwise, the events
+        are left to be received again.
+
+        Raises:
+            AWSSettingsConfigError: If the invalidator has no feed.
+        """
+        if self.feed is None:
+            raise AWSSettingsConfigError("The change invalidator has no event feed")
+
+        events = self.feed()
+        changes, refreshed = self._apply(events)
+
+        acknowledge = getattr(events, "acknowledge", None)
+        if refreshed and callable(acknowledge):
+            acknowledge()
+
+        return changes
+
+    def start(self) -> None:
+        """Start polling ``feed`` on a daemon thread, if not started yet."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="pydantic-settings-aws-invalidation",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the polling thread, after its current poll, and wait for it to exit."""
+        self._stop_event.set()
+
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            # the polling thread must outlive any error, the next poll may work
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to poll the change events")
+                self._stop_event.wait(FEED_ERROR_DELAY)
+
+    def _apply(
+        self, events: Iterable[Mapping[str, Any]]
+    ) -> tuple[list[ChangeEvent], bool]:
+        """Apply ``events``, returning their changes and whether all refreshes succeeded."""
+        changes: list[ChangeEvent] = []
+        for event in events:
+            change = parse_change_event(event)
+            if change is None:
+                continue
+
+            invalidated = self.cache.invalidate_matching(
+                functools.partial(_affects, change)
+            )
+            logger.debug(
+                "%s %s changed, %d cached values invalidated",
+                change.service,
+                change.name,
+                invalidated,
+            )
+            changes.append(change)
+
+        refreshed = True
+        for settings in self._get_affected(changes):
+            try:
+                settings.refresh()
+            # a failing refresh must not keep the other settings from refreshing
+            except Exception:  # noqa: BLE001
+                logger.exception(
+                    "Failed to refresh %s after a change, keeping the current settings",
+                    settings.settings_cls.__name__,
+                )
+                refreshed = False
+
+        return changes, refreshed
+
+    def _get_affected(
+        self, changes: list[ChangeEvent]
+    ) -> list[RefreshingSettings[Any]]:
+        with self._lock:
+            watched = list(self._watched.items())
+
+        return [
+            settings
+            for settings, references in watched
+            if any(
+                change.affects(service, name)
+                for change in changes
+                for service, name in references
+            )
+        ]
+
+
+def _affects(change: ChangeEvent, key: ValueCacheKey) -> bool:
+    return change.affects(key.service, key.name)
@@ -0,0 +1,389 @@
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, cast
+
+from pydantic import BaseModel, PrivateAttr, create_model, field_validator
+from pydantic_settings import BaseSettings
+
+from . import plan, utils
+from .errors import AWSSettingsConfigError
+from .logger import logger
+from .plan import PlanKind
+from .sources import (
+    AWSSettingsSource,
+    ParameterStoreSettingsSource,
+    get_preloaded_values,
+    preload_values,
+)
+
+_SOURCES: dict[PlanKind, Callable[[Any], Any]] = {
+    "aws": AWSSettingsSource,
+    "ssm": ParameterStoreSettingsSource,
+}
+
+_deferring: ContextVar[dict[type[BaseModel], tuple[PlanKind, frozenset[str]]]] = (
+    ContextVar("pydantic_settings_aws_deferring")
+)
+
+_models: weakref.WeakKeyDictionary[
+    type[BaseModel], dict[tuple[str, frozenset[str]], tuple[Any, type[BaseModel]]]
+] = weakref.WeakKeyDictionary()
+_models_lock = threading.Lock()
+
+# the attributes holding the state of a pydantic model instance
+_INSTANCE_STATE = (
+    "__dict__",
+    "__pydantic_fields_set__",
+    "__pydantic_extra__",
+    "__pydantic_private__",
+)
+
+
+class DeferredFields:
+    """The AWS fields of a settings instance fetched on first access.
+
+    Fields missing from the instance ``__dict__`` are not resolved yet. The
+    values the other sources had for them on instantiation, like environment
+    variables, are kept as fallbacks, used when AWS has no value.
+    """
+
+    def __init__(
+        self, kind: PlanKind, fields: frozenset[str], fallbacks: dict[str, Any]
+    ) -> None:
+        self.kind = kind
+        self.fields = fields
+        self.fallbacks = fallbacks
+        self._lock = threading.Lock()
+
+    def resolve(self, settings: BaseModel, field_names: Iterable[str]) -> None:
+        """Fetch and validate ``field_names`` and the fields of their groups.
+
+        Raises:
+            ValidationError: If a fetched value is invalid, or if a required
+                field has no value in AWS nor in the other sources.
+        """
+        # only the settings classes inheriting DeferredFieldsModel defer fields
+        settings_cls = cast(type[BaseSettings], type(settings))
+
+        with self._lock:
+            group: set[str] = set()
+            for field_name in field_names:
+                group.update(_get_group(settings_cls, self.kind, field_name))
+
+            pending = tuple(
+                field_name
+                for field_name in settings_cls.model_fields
+                if field_name in group
+                and field_name in self.fields
+                and field_name not in settings.__dict__
+            )
+            if not pending:
+                return
+
+            logger.debug(
+                "Resolving %d deferred fields of %s",
+                len(pending),
+                settings_cls.__name__,
+            )
+            values = _SOURCES[self.kind](settings_cls).load_fields(pending)
+
+            data: dict[str, Any] = {}
+            for field_name in pending:
+                value = values.get(field_name)
+                if value is None:
+                    value = self.fallbacks.get(field_name)
+                if value is not None:
+                    data[field_name] = value
+
+            validated = _get_model(
+                settings_cls, "fields", frozenset(pending)
+            ).model_validate(data)
+
+            settings.__dict__.update(validated.__dict__)
+            settings.__pydantic_fields_set__.update(validated.model_fields_set)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "DeferredFields":
+        # the state is never mutated, so copies of the settings can share it
+        return self
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"kind": self.kind, "fields": self.fields, "fallbacks": self.fallbacks}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+
+class _Unresolved:
+    def __repr__(self) -> str:
+        return "<unresolved>"
+
+
+_UNRESOLVED = _Unresolved()
+
+
+class DeferredFieldsModel(BaseModel):
+    """Base model of the settings classes supporting ``resolve_lazily``.
+
+    It sits right after :class:`pydantic_settings.BaseSettings` in the MRO of
+    :class:`~pydantic_settings_aws.LazyAWSBaseSettings` and
+    :class:`~pydantic_settings_aws.LazyParameterStoreBaseSettings`, so that it
+    receives the values of every source and validates them without the
+    deferred fields. Other settings classes don't inherit it.
+    """
+
+    _deferred: DeferredFields | None = PrivateAttr(default=None)
+
+    def __init__(self, /, **data: Any) -> None:
+        deferring = _deferring.get({}).get(type(self))
+        if deferring is None:
+            super().__init__(**data)
+            return
+
+        kind, fields = deferring
+        fallbacks = {
+            field_name: data.pop(field_name)
+            for field_name in fields
+            if field_name in data
+        }
+
+        validated = _get_model(type(self), "init", fields).model_validate(data)
+        constructed = self.model_construct(
+            validated.model_fields_set,
+            **validated.__dict__,
+            **(validated.model_extra or {}),
+        )
+        for field_name in fields:
+            constructed.__dict__.pop(field_name, None)
+
+        for name in _INSTANCE_STATE:
+            object.__setattr__(self, name, getattr(constructed, name))
+
+        self._deferred = DeferredFields(kind, fields, fallbacks)
+
+    def resolve_all(self) -> None:
+        """Fetch and validate every field deferred by ``resolve_lazily``.
+
+        Use it to fail right away on missing or invalid values instead of on
+        first access. Every deferred field is fetched at once, batched as on
+        eager instantiation.
+
+        Raises:
+            ValidationError: With an error for every invalid or missing field.
+        """
+        if self._deferred is not None:
+            self._deferred.resolve(self, self._deferred.fields)
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        self.resolve_all()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self.resolve_all()
+        return super().model_dump_json(**kwargs)
+
+    def __eq__(self, other: object) -> bool:
+        # the deferred state differs between instances, so it is left out,
+        # and the deferred fields are resolved to be compared
+        if not isinstance(other, DeferredFieldsModel) or type(other) is not type(self):
+            return super().__eq__(other)
+
+        self.resolve_all()
+        other.resolve_all()
+
+        return (
+            self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+            and _get_private(self) == _get_private(other)
+        )
+
+    def __repr_args__(self) -> Iterator[tuple[str | None, Any]]:
+        yield from super().__repr_args__()
+
+        deferred = self._deferred
+        if deferred is None:
+            return
+
+        for field_name, field in type(self).model_fields.items():
+            if (
+                field_name in deferred.fields
+                and field_name not in self.__dict__
+                and field.repr
+            ):
+                yield field_name, _UNRESOLVED
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            try:
+                private = object.__getattribute__(self, "__pydantic_private__")
+            except AttributeError:
+                private = None
+
+            deferred = private.get("_deferred") if private else None
+            if deferred is not None and name in deferred.fields:
+                deferred.resolve(self, (name,))
+                return self.__dict__[name]
+
+            return super().__getattr__(name)
+
+
+def check_lazy_settings(settings_cls: type[BaseSettings]) -> None:
+    """Check on class definition that ``settings_cls`` can resolve lazily.
+
+    Raises:
+        AWSSettingsConfigError: If ``resolve_lazily`` is set on a class that
+            is not a lazy settings class, or on a class with model validators,
+            which would run without the deferred fields.
+    """
+    if not utils.get_config_value(settings_cls, "resolve_lazily"):
+        return
+
+    if not issubclass(settings_cls, DeferredFieldsModel):
+        raise AWSSettingsConfigError(
+            f"resolve_lazily is only supported by subclasses of "
+            f"LazyAWSBaseSettings and LazyParameterStoreBaseSettings, "
+            f"{settings_cls.__name__} is not one"
+        )
+
+    if settings_cls.__pydantic_decorators__.model_validators:
+        raise AWSSettingsConfigError(
+            f"resolve_lazily is not supported by {settings_cls.__name__}, "
+            "its model validators would run without the deferred fields"
+        )
+
+
+@contextmanager
+def deferring(
+    settings_cls: type[BaseSettings], values: dict[str, Any], kind: PlanKind
+) -> Iterator[None]:
+    """Defer the AWS fields of ``settings_cls`` while it is instantiated.
+
+    Does nothing unless ``resolve_lazily`` is set. Fields given as init
+    values, and instantiations with preloaded values, like ``aload()``, are
+    not deferred.
+    """
+    fields: frozenset[str] = frozenset()
+    if (
+        utils.get_config_value(settings_cls, "resolve_lazily")
+        and get_preloaded_values(settings_cls) is None
+    ):
+        fields = _get_deferred_fields(settings_cls, kind, values)
+
+    if not fields:
+        yield
+        return
+
+    token = _deferring.set({**_deferring.get({}), settings_cls: (kind, fields)})
+    try:
+        with preload_values(settings_cls, {}):
+            yield
+    finally:
+        _deferring.reset(token)
+
+
+def _get_deferred_fields(
+    settings_cls: type[BaseSettings], kind: PlanKind, values: dict[str, Any]
+) -> frozenset[str]:
+    resolution_plan = plan.get_plan(settings_cls, kind)
+    field_names = [route.field_name for route in resolution_plan.routes]
+    field_names.extend(resolution_plan.path_fields)
+
+    return frozenset(
+        field_name
+        for field_name in field_names
+        if field_name not in values
+        and settings_cls.model_fields[field_name].alias not in values
+    )
+
+
+def _get_group(
+    settings_cls: type[BaseSettings], kind: PlanKind, field_name: str
+) -> set[str]:
+    """Return the fields fetched together with ``field_name``.
+
+    Those are the fields of its ``group``, the fields of the same secret, and
+    every field read from ``ssm_path``.
+    """
+    resolution_plan = plan.get_plan(settings_cls, kind)
+    route = next(
+        (r for r in resolution_plan.routes if r.field_name == field_name), None
+    )
+    if route is None:
+        return set(resolution_plan.path_fields)
+
+    return {
+        r.field_name
+        for r in resolution_plan.routes
+        if r is route
+        or (route.group is not None and r.group == route.group)
+        or (
+            route.service == r.service == "secrets"
+            and r.client is route.client
+            and r.secret == route.secret
+        )
+    }
+
+
+def _get_model(
+    settings_cls: type[BaseModel], kind: str, field_names: frozenset[str]
+) -> type[BaseModel]:
+    """Return a model validating part of the fields of ``settings_cls``.
+
+    The ``"init"`` model validates every field but ``field_names``, and the
+    ``"fields"`` model validates ``field_names`` alone. Both are created with
+    :func:`pydantic.create_model`, with the fields, config and field
+    validators of ``settings_cls``.
+    """
+    key = (kind, field_names)
+    model_fields = settings_cls.model_fields
+
+    with _models_lock:
+        cached = _models.get(settings_cls, {}).get(key)
+
+    if cached is not None and cached[0] is model_fields:
+        return cached[1]
+
+    fields: dict[str, Any] = {
+        field_name: (field.annotation, field)
+        for field_name, field in model_fields.items()
+        if (field_name in field_names) == (kind == "fields")
+    }
+    # the validators are bound to ``settings_cls`` already, a static method
+    # keeps them from being bound to the new model
+    validators: dict[str, Callable[..., Any]] = {
+        name: field_validator(
+            *decorator.info.fields, mode=decorator.info.mode, check_fields=False
+        )(staticmethod(decorator.func))
+        for name, decorator in (
+            settings_cls.__pydantic_decorators__.field_validators.items()
+        )
+    }
+    model = create_model(
+        settings_cls.__name__,
+        __config__=settings_cls.model_config,
+        __validators__=validators,
+        **fields,
+    )
+
+    with _models_lock:
+        _models.setdefault(settings_cls, {})[key] = (model_fields, model)
+
+    return model
+
+
+def _get_private(settings: BaseModel) -> dict[str, Any]:
+    private = settings.__pydantic_private__ or {}
+    return {name: value for name, value in private.items() if name != "_deferred"}
+
+
+def _after_fork_in_child() -> None:
+    """Replace the lock, as a parent thread may have held it during the fork.
+
+    The models built for deferred fields are kept.
+    """
+    global _models_lock
+
+    _models_lock = threading.Lock()
@@ -1,3 +1,5 @@
+import hashlib
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -21,11 +23,17 @@ class AwsSession(BaseModel):
     def session_key(self) -> str:
         key = ""
         for k in self.__class__.model_fields.keys():
-            # session token is too long
-            if k != "aws_session_token":
-                v = getattr(self, k)
-                if v:
-                    key += f"{v}_"
+            v = getattr(self, k)
+            if not v:
+                continue
+
+            # the secrets must not end up in keys that may be logged, and the
+            # session token is too long: a digest is enough to tell
+            # credentials apart
+            if k in ("aws_secret_access_key", "aws_session_token"):
+                v = hashlib.sha256(v.encode()).hexdigest()[:16]
+
+            key += f"{v}_"
 
         if not key:
             key = "default"
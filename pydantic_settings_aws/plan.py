@@ -0,0 +1,194 @@
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any, Literal, NamedTuple
+
+from pydantic_settings import BaseSettings
+
+from . import aws, utils
+from .logger import logger
+
+PlanKind = Literal["aws", "ssm", "secrets"]
+
+
+class FieldRoute(NamedTuple):
+    """How the value of a single field is resolved."""
+
+    field_name: str
+    """The name of the field."""
+
+    service: Literal["ssm", "secrets"]
+    """The service the value is read from."""
+
+    key: str
+    """The parameter name for ``"ssm"``, the JSON key inside the secret for ``"secrets"``."""
+
+    client: Any = None
+    """The per-field client from the field metadata, if any."""
+
+    group: str | None = None
+    """The lazy resolution group from the field metadata, if any."""
+
+    secret: str | None = None
+    """For ``"secrets"``, the secret from the field metadata, if any, else ``secrets_name``."""
+
+
+class ResolutionPlan(NamedTuple):
+    """The routes of every field a source resolves, compiled once per settings class."""
+
+    routes: tuple[FieldRoute, ...]
+    """The fields resolved by name, in field order."""
+
+    path_fields: tuple[str, ...] = ()
+    """The fields read from ``ssm_path``, for ``ParameterStoreSettingsSource``."""
+
+
+PlanKey = tuple[PlanKind, str | None, str | None]
+
+_plans: weakref.WeakKeyDictionary[
+    type[BaseSettings], dict[PlanKey, tuple[Any, ResolutionPlan]]
+] = weakref.WeakKeyDictionary()
+_plans_lock = threading.Lock()
+
+
+def get_plan(settings_cls: type[BaseSettings], kind: PlanKind) -> ResolutionPlan:
+    """Return the resolution plan of ``settings_cls`` for a source.
+
+    The plan is compiled from the field metadata on first use and cached
+    against the class, weakly so that redefined classes drop their plans. It
+    is compiled again if the fields of the class are rebuilt.
+
+    Args:
+        settings_cls (type[BaseSettings]): The settings class being built.
+        kind (PlanKind): ``"aws"`` for ``AWSSettingsSource``, ``"ssm"`` for
+            ``ParameterStoreSettingsSource`` and ``"secrets"`` for
+            ``SecretsManagerSettingsSource``.
+    """
+    ssm_path = utils.get_config_value(settings_cls, "ssm_path") if kind == "ssm" else None
+    ssm_prefix = utils.get_config_value(settings_cls, "ssm_prefix")
+    plan_key: PlanKey = (kind, ssm_path, ssm_prefix)
+    model_fields = settings_cls.model_fields
+
+    with _plans_lock:
+        compiled = _plans.get(settings_cls, {}).get(plan_key)
+
+    if compiled is not None and compiled[0] is model_fields:
+        return compiled[1]
+
+    logger.debug(
+        "Compiling the %s resolution plan of %s", kind, settings_cls.__name__
+    )
+    plan = _COMPILERS[kind](settings_cls, ssm_path)
+
+    with _plans_lock:
+        _plans.setdefault(settings_cls, {})[plan_key] = (model_fields, plan)
+
+    return plan
+
+
+def _compile_aws_plan(
+    settings_cls: type[BaseSettings], ssm_path: str | None
+) -> ResolutionPlan:
+    routes: list[FieldRoute] = []
+    ssm_prefix = utils.get_config_value(settings_cls, "ssm_prefix")
+
+    for field_name, field in settings_cls.model_fields.items():
+        service_metadata = utils.get_annotated_service_metadata(field.metadata)
+
+        if not service_metadata:
+            logger.info("No information about AWS service was found for %s", field_name)
+            continue
+
+        service = service_metadata.get("service")
+
+        if service == "ssm":
+            ssm_info = utils.get_ssm_name_from_annotated_field(field.metadata)
+            ssm_name, client = aws.get_ssm_name(field_name, ssm_info)
+            ssm_name = utils.get_prefixed_ssm_name(ssm_prefix, ssm_name)
+            routes.append(
+                FieldRoute(
+                    field_name,
+                    "ssm",
+                    ssm_name,
+                    client,
+                    utils.get_field_group(field.metadata),
+                )
+            )
+
+        elif service == "secrets":
+            routes.append(
+                FieldRoute(
+                    field_name,
+                    "secrets",
+                    utils.get_secrets_field_name(field.metadata, field_name),
+                    utils.get_secrets_client_from_annotated_field(field.metadata),
+                    utils.get_field_group(field.metadata),
+                    utils.get_secret_name_from_annotated_field(field.metadata),
+                )
+            )
+
+    return ResolutionPlan(tuple(routes))
+
+
+def _compile_ssm_plan(
+    settings_cls: type[BaseSettings], ssm_path: str | None
+) -> ResolutionPlan:
+    routes: list[FieldRoute] = []
+    path_fields: list[str] = []
+    ssm_prefix = utils.get_config_value(settings_cls, "ssm_prefix")
+
+    for field_name, field in settings_cls.model_fields.items():
+        ssm_info = utils.get_ssm_name_from_annotated_field(field.metadata)
+
+        if ssm_path and utils.is_ssm_path_field(ssm_info):
+            path_fields.append(field_name)
+            continue
+
+        ssm_name, client = aws.get_ssm_name(field_name, ssm_info)
+        ssm_name = utils.get_prefixed_ssm_name(ssm_prefix, ssm_name)
+        routes.append(
+            FieldRoute(
+                field_name,
+                "ssm",
+                ssm_name,
+                client,
+                utils.get_field_group(field.metadata),
+            )
+        )
+
+    return ResolutionPlan(tuple(routes), tuple(path_fields))
+
+
+def _compile_secrets_plan(
+    settings_cls: type[BaseSettings], ssm_path: str | None
+) -> ResolutionPlan:
+    return ResolutionPlan(
+        tuple(
+            FieldRoute(
+                field_name,
+                "secrets",
+                utils.get_secrets_field_name(field.metadata, field_name),
+                secret=utils.get_secret_name_from_annotated_field(field.metadata),
+            )
+            for field_name, field in settings_cls.model_fields.items()
+        )
+    )
+
+
+_COMPILERS: dict[
+    PlanKind, Callable[[type[BaseSettings], str | None], ResolutionPlan]
+] = {
+    "aws": _compile_aws_plan,
+    "ssm": _compile_ssm_plan,
+    "secrets": _compile_secrets_plan,
+}
+
+
+def _after_fork_in_child() -> None:
+    """Replace the lock, as a parent thread may have held it during the fork.
+
+    The compiled plans are kept.
+    """
+    global _plans_lock
+
+    _plans_lock = threading.Lock()
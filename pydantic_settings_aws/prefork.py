@@ -0,0 +1,93 @@
+import os
+
+from pydantic_settings import BaseSettings
+
+from . import aio, instrumentation, lazy, plan, regions, snapshot
+from .cache import value_cache
+from .clients import client_pool
+from .logger import logger
+from .settings import get_source_cls
+from .singleflight import single_flight
+from .sources import clear_prewarmed_values, set_prewarmed_values
+from .throttling import throttler
+
+
+def prewarm(*settings_classes: type[BaseSettings]) -> None:
+    """Resolve the AWS values of ``settings_classes`` once, for the whole process.
+
+    Call it in the master process of a pre-fork server, like gunicorn or
+    uWSGI, or before starting a ``multiprocessing`` pool with the ``fork``
+    start method. The values are kept in a read-only mapping and every later
+    instantiation of the classes, in the process and in its forked children,
+    validates them without any AWS call. Init values and environment
+    variables still apply as usual.
+
+    The clients inherited by a child are dropped on fork, see
+    :func:`after_fork_in_child`, so that a child needing AWS, for a class that
+    was not prewarmed, creates its own.
+
+    Example::
+
+        # gunicorn.conf.py
+        from pydantic_settings_aws import prewarm
+
+        from myapp.settings import DatabaseSettings, FeatureFlags
+
+        def on_starting(server):
+            prewarm(DatabaseSettings, FeatureFlags)
+
+    Args:
+        *settings_classes (type[BaseSettings]): Subclasses of
+            :class:`AWSBaseSettings`, :class:`ParameterStoreBaseSettings` or
+            :class:`SecretsManagerBaseSettings`.
+
+    Raises:
+        AWSSettingsConfigError: If a class is not a subclass of one of the
+            base settings classes.
+        PydanticSettingsAWSError: If the values of a class cannot be fetched.
+            The classes before it stay prewarmed.
+    """
+    for settings_cls in settings_classes:
+        source = get_source_cls(settings_cls)(settings_cls)
+        set_prewarmed_values(settings_cls, source.load())
+        logger.debug("Prewarmed %s", settings_cls.__name__)
+
+
+def clear_prewarmed(*settings_classes: type[BaseSettings]) -> None:
+    """Drop the values prewarmed for ``settings_classes``, or for every class.
+
+    The next instantiations of the classes fetch their values from AWS again.
+    """
+    clear_prewarmed_values(*settings_classes)
+
+
+def after_fork_in_child() -> None:
+    """Reset the process-wide state a forked child must not share with its parent.
+
+    Registered with :func:`os.register_at_fork`, so it runs in every child
+    forked with :func:`os.fork`, by ``multiprocessing`` or by a pre-fork
+    server. It drops the pooled boto3 and aiobotocore clients without closing
+    them, as their connections share sockets with the parent, forgets the
+    requests and snapshot revalidations in flight in parent threads, and
+    restarts client-side throttling with a new startup jitter and the region
+    hedging threads. The locks of the compiled plans, lazy field models and
+    span hooks are replaced. Prewarmed values, value cache entries and region
+    latencies are kept.
+
+    Clients given in :class:`AWSSettingsConfigDict` belong to the application
+    and are not touched.
+    """
+    client_pool._after_fork_in_child()
+    aio._after_fork_in_child()
+    single_flight._after_fork_in_child()
+    throttler._after_fork_in_child()
+    value_cache._after_fork_in_child()
+    snapshot._after_fork_in_child()
+    regions._after_fork_in_child()
+    plan._after_fork_in_child()
+    lazy._after_fork_in_child()
+    instrumentation._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=after_fork_in_child)
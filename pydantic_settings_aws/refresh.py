@@ -0,0 +1,196 @@
+import random
+import threading
+from collections.abc import Callable
+from typing import Any, Generic
+
+from . import aws
+from .errors import AWSSettingsConfigError
+from .logger import logger
+from .settings import SettingsT, get_source_cls
+from .sources import preload_values
+
+Listener = Callable[[SettingsT, SettingsT], None]
+
+
+class RefreshingSettings(Generic[SettingsT]):
+    """Keeps a settings instance up to date by re-resolving it in the background.
+
+    The AWS values of ``settings_cls`` are fetched again every ``interval``
+    seconds on a daemon thread. When a secret ``VersionId``, a parameter
+    ``Version`` or a value changed, a new instance is validated and swapped in
+    atomically, then the listeners are called with the old and new instances.
+    Unchanged values are not validated again.
+
+    Reading :attr:`current` takes no lock: it always returns a fully validated
+    instance, either the previous one or the new one.
+
+    Example::
+
+        settings = RefreshingSettings(DatabaseSettings, interval=300, jitter=0.1)
+        settings.add_listener(lambda old, new: pool.reconnect(new.password))
+
+        settings.current.password
+
+    Args:
+        settings_cls (type[SettingsT]): A subclass of :class:`AWSBaseSettings`,
+            :class:`ParameterStoreBaseSettings` or :class:`SecretsManagerBaseSettings`.
+        interval (float): Seconds between two refreshes.
+        jitter (float): Fraction of ``interval`` each delay is randomly moved
+            by, between ``0`` and ``1``, so that workers started together do
+            not refresh together. Defaults to ``0``.
+        start (bool): Whether to start the background thread right away.
+            Defaults to ``True``.
+        **values: Init values, with the same priority as in ``__init__``.
+
+    Raises:
+        AWSSettingsConfigError: If ``settings_cls`` is not one of the base
+            settings classes or the interval or jitter is invalid.
+    """
+
+    def __init__(
+        self,
+        settings_cls: type[SettingsT],
+        interval: float,
+        *,
+        jitter: float = 0.0,
+        start: bool = True,
+        **values: Any,
+    ) -> None:
+        if interval <= 0:
+            raise AWSSettingsConfigError("The refresh interval must be positive")
+
+        if not 0 <= jitter <= 1:
+            raise AWSSettingsConfigError("The refresh jitter must be between 0 and 1")
+
+        self.settings_cls = settings_cls
+        self.interval = interval
+        self.jitter = jitter
+        self._values = values
+        self._source_cls = get_source_cls(settings_cls)
+        self._listeners: tuple[Listener[SettingsT], ...] = ()
+        self._refresh_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._field_values, self._versions = self._load()
+        self._current = self._validate(self._field_values)
+
+        if start:
+            self.start()
+
+    @property
+    def current(self) -> SettingsT:
+        """The latest validated settings instance."""
+        return self._current
+
+    def add_listener(self, listener: Listener[SettingsT]) -> None:
+        """Call ``listener(old, new)`` every time a new instance is swapped in.
+
+        Listeners run on the thread that refreshed the settings. Their errors
+        are logged and do not stop the other listeners.
+        """
+        self._listeners = (*self._listeners, listener)
+
+    def remove_listener(self, listener: Listener[SettingsT]) -> None:
+        """Stop calling ``listener`` on refresh."""
+        self._listeners = tuple(
+            registered for registered in self._listeners if registered != listener
+        )
+
+    def refresh(self) -> bool:
+        """Re-resolve the settings now.
+
+        Returns:
+            bool: Whether a new instance was swapped in.
+
+        Raises:
+            PydanticSettingsAWSError: If the values cannot be fetched. The
+                current instance is kept.
+            ValidationError: If the new values are invalid. The current
+                instance is kept.
+        """
+        with self._refresh_lock:
+            field_values, versions = self._load()
+
+            if self._is_unchanged(field_values, versions):
+                logger.debug("%s values are unchanged", self.settings_cls.__name__)
+                return False
+
+            new = self._validate(field_values)
+            old, self._current = self._current, new
+            self._field_values, self._versions = field_values, versions
+
+        logger.info("%s was refreshed", self.settings_cls.__name__)
+        for listener in self._listeners:
+            try:
+                listener(old, new)
+            # a failing listener must not keep the others from being called
+            except Exception:  # noqa: BLE001
+                logger.exception(
+                    "A %s refresh listener failed", self.settings_cls.__name__
+                )
+
+        return True
+
+    def start(self) -> None:
+        """Start refreshing the settings on a daemon thread, if not started yet."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"pydantic-settings-aws-refresh-{self.settings_cls.__name__}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread and wait for it to exit."""
+        self._stop_event.set()
+
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def __enter__(self) -> "RefreshingSettings[SettingsT]":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._next_delay()):
+            try:
+                self.refresh()
+            # the refresh thread must outlive any error, the next refresh may work
+            except Exception:  # noqa: BLE001
+                logger.exception(
+                    "Failed to refresh %s, keeping the current settings",
+                    self.settings_cls.__name__,
+                )
+
+    def _next_delay(self) -> float:
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _load(self) -> tuple[dict[str, Any], dict[aws.VersionKey, str | None]]:
+        with aws.record_versions() as versions:
+            field_values = self._source_cls(self.settings_cls).load()
+
+        return field_values, versions
+
+    def _validate(self, field_values: dict[str, Any]) -> SettingsT:
+        with preload_values(self.settings_cls, field_values):
+            return self.settings_cls(**self._values)
+
+    def _is_unchanged(
+        self,
+        field_values: dict[str, Any],
+        versions: dict[aws.VersionKey, str | None],
+    ) -> bool:
+        if versions and None not in versions.values() and versions == self._versions:
+            return True
+
+        # values without a version, like the ones of injected test clients,
+        # are compared directly
+        return field_values == self._field_values
+
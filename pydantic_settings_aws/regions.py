@@ -0,0 +1,280 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Literal, NamedTuple
+
+from . import boto
+from .logger import logger
+
+RegionOrder = Literal["priority", "latency"]
+
+# weight of the last call in the moving average of a region latency
+LATENCY_SMOOTHING = 0.2
+
+# seconds recorded for a call failing because a region could not answer, so
+# that adaptive ordering moves degraded regions last
+FAILURE_LATENCY = 30.0
+
+HEDGE_MAX_WORKERS = 32
+
+
+class RegionLatency(NamedTuple):
+    """Latency record of a service in a region."""
+
+    calls: int
+    """Calls that got a response, or an error, from the region."""
+
+    failures: int
+    """Calls that failed because the region could not answer."""
+
+    latency: float
+    """Exponential moving average of the call duration, in seconds."""
+
+
+class RegionLatencies:
+    """Thread-safe per-service, per-region latency records.
+
+    Every call of a :class:`MultiRegionClient` is recorded, including the
+    calls that lost a hedged race, so that ``region_order="latency"`` can try
+    the fastest region first. A single instance, :data:`region_latencies`, is
+    shared by the whole process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: dict[tuple[str, str], RegionLatency] = {}
+
+    def record(
+        self, service: str, region: str, duration: float, failed: bool = False
+    ) -> None:
+        """Record a call of ``service`` in ``region`` lasting ``duration`` seconds."""
+        if failed:
+            duration = max(duration, FAILURE_LATENCY)
+
+        with self._lock:
+            record = self._records.get((service, region))
+            if record is None:
+                record = RegionLatency(0, 0, duration)
+
+            self._records[(service, region)] = RegionLatency(
+                record.calls + 1,
+                record.failures + failed,
+                record.latency + LATENCY_SMOOTHING * (duration - record.latency),
+            )
+
+    def order(self, service: str, regions: tuple[str, ...]) -> list[str]:
+        """Return ``regions`` from the fastest to the slowest for ``service``.
+
+        Regions without records keep their priority, before the slower ones
+        with records, so that every region is tried at least once.
+        """
+        with self._lock:
+            latencies = [self._records.get((service, region)) for region in regions]
+
+        return [
+            region
+            for _, region in sorted(
+                zip(latencies, regions),
+                key=lambda item: 0.0 if item[0] is None else item[0].latency,
+            )
+        ]
+
+    def stats(self) -> dict[tuple[str, str], RegionLatency]:
+        """Return the record of every ``(service, region)`` called."""
+        with self._lock:
+            return dict(self._records)
+
+    def clear(self) -> None:
+        """Forget every record."""
+        with self._lock:
+            self._records.clear()
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+
+
+region_latencies = RegionLatencies()
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=HEDGE_MAX_WORKERS,
+                thread_name_prefix="pydantic-settings-aws-region",
+            )
+
+    return _executor
+
+
+def _after_fork_in_child() -> None:
+    # the executor threads of the parent don't exist in the child
+    global _executor, _executor_lock
+
+    _executor = None
+    _executor_lock = threading.Lock()
+    region_latencies._after_fork_in_child()
+
+
+class MultiRegionClient:
+    """Client sending each call to the first region of ``regions`` that answers.
+
+    It mirrors the boto3 methods the library calls, like
+    :class:`~pydantic_settings_aws.LambdaExtensionClient`, and sends them to
+    the clients returned by ``create_client`` for each region, which are
+    created on first use.
+
+    Regions are tried in priority order, or from the fastest to the slowest
+    with ``order="latency"``. A region that can't answer, because of a
+    connection error, a timeout, throttling or a 5xx response, fails over to
+    the next one. Other errors, like a missing parameter, are raised right
+    away. With ``hedge_delay``, when a region has not answered within that
+    many seconds, the call is also sent to the next region, and the first
+    response wins. Errors of the other regions are only raised once every
+    call in flight has failed, so that a slow first choice still answers.
+
+    Args:
+        service (str): ``"ssm"`` or ``"secretsmanager"``.
+        regions (tuple[str, ...]): The regions, by priority.
+        create_client (Callable[[str], Any]): Returns the boto3 client of the
+            service in a region.
+        hedge_delay (float | None): Seconds to wait for a region before also
+            calling the next one. When ``None``, the next region is only
+            called when a region can't answer.
+        order (RegionOrder): ``"priority"`` or ``"latency"``.
+        latencies (RegionLatencies): Where calls are recorded.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        regions: tuple[str, ...],
+        create_client: Callable[[str], Any],
+        hedge_delay: float | None = None,
+        order: RegionOrder = "priority",
+        latencies: RegionLatencies = region_latencies,
+    ) -> None:
+        self.service = service
+        self.regions = regions
+        self.hedge_delay = hedge_delay
+        self.order = order
+        self._create_client = create_client
+        self._latencies = latencies
+
+    def get_parameter(self, **kwargs: Any) -> Any:
+        return self._call("get_parameter", kwargs)
+
+    def get_parameters(self, **kwargs: Any) -> Any:
+        return self._call("get_parameters", kwargs)
+
+    def get_parameters_by_path(self, **kwargs: Any) -> Any:
+        return self._call("get_parameters_by_path", kwargs)
+
+    def get_secret_value(self, **kwargs: Any) -> Any:
+        return self._call("get_secret_value", kwargs)
+
+    def batch_get_secret_value(self, **kwargs: Any) -> Any:
+        return self._call("batch_get_secret_value", kwargs)
+
+    def get_regions(self) -> list[str]:
+        """Return the regions in the order they are tried."""
+        if self.order == "latency":
+            return self._latencies.order(self.service, self.regions)
+
+        return list(self.regions)
+
+    def _call(self, method: str, kwargs: dict[str, Any]) -> Any:
+        regions = self.get_regions()
+        if self.hedge_delay is None:
+            return self._fail_over(regions, method, kwargs)
+
+        return self._hedge(regions, method, kwargs)
+
+    def _fail_over(
+        self, regions: list[str], method: str, kwargs: dict[str, Any]
+    ) -> Any:
+        errors: list[BaseException] = []
+
+        for region in regions:
+            try:
+                return self._call_region(region, method, kwargs)
+            except Exception as e:
+                if not boto.is_unreachable_error(e):
+                    raise
+                logger.debug("Region %s can't answer, failing over: %r", region, e)
+                errors.append(e)
+
+        raise errors[0]
+
+    def _hedge(
+        self, regions: list[str], method: str, kwargs: dict[str, Any]
+    ) -> Any:
+        executor = _get_executor()
+        pending: set[Future[Any]] = set()
+        first_choice: Future[Any] | None = None
+        errors: list[BaseException] = []
+        # errors other than unreachable regions, such as a missing parameter,
+        # are answers: a late first choice still wins over a fast secondary one
+        answers: list[BaseException] = []
+        remaining = iter(regions)
+
+        def send_next() -> bool:
+            nonlocal first_choice
+            region = next(remaining, None)
+            if region is None:
+                return False
+            future = executor.submit(self._call_region, region, method, kwargs)
+            if first_choice is None:
+                first_choice = future
+            pending.add(future)
+            return True
+
+        send_next()
+        while pending:
+            done, pending = wait(
+                pending, timeout=self.hedge_delay, return_when=FIRST_COMPLETED
+            )
+            if not done:
+                logger.debug("No answer within %ss, hedging", self.hedge_delay)
+                send_next()
+                continue
+
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    # the calls still pending are left to finish, and recorded
+                    return future.result()
+                if not boto.is_unreachable_error(error):
+                    if future is first_choice:
+                        raise error
+                    answers.append(error)
+                    continue
+                errors.append(error)
+                send_next()
+
+        raise (answers or errors)[0]
+
+    def _call_region(
+        self, region: str, method: str, kwargs: dict[str, Any]
+    ) -> Any:
+        start = time.monotonic()
+        try:
+            response = getattr(self._create_client(region), method)(**kwargs)
+        except Exception as e:
+            self._latencies.record(
+                self.service,
+                region,
+                time.monotonic() - start,
+                failed=boto.is_unreachable_error(e),
+            )
+            raise
+
+        self._latencies.record(self.service, region, time.monotonic() - start)
+
+        return response
@@ -0,0 +1,391 @@
+import functools
+import threading
+from collections.abc import Callable, Collection, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Any, NamedTuple
+
+from pydantic_settings import BaseSettings
+from typing_extensions import Self
+
+from . import aws, plan, utils
+from .cache import ValueCacheKey
+from .errors import PydanticSettingsAWSError
+from .logger import logger
+
+DEFAULT_PREFETCH_WORKERS = 10
+
+_current_context: ContextVar["ResolutionContext | None"] = ContextVar(
+    "pydantic_settings_aws_resolution_context", default=None
+)
+
+
+class ResolutionStats(NamedTuple):
+    """Counters of a :class:`ResolutionContext`."""
+
+    fetched: int
+    """Parameters and secrets fetched from AWS, or the value cache."""
+
+    shared: int
+    """Parameters and secrets served from a value fetched earlier in the context."""
+
+
+class _Reads(NamedTuple):
+    """What the classes of a context read from AWS."""
+
+    ssm: dict[str, tuple[type[BaseSettings], Any, list[str]]]
+    """The parameter names, by session key, with a class and client reading them."""
+
+    paths: dict[ValueCacheKey, tuple[type[BaseSettings], Any, tuple[str, bool]]]
+    """The ``ssm_path`` hierarchies and whether they are read recursively."""
+
+    secrets: dict[ValueCacheKey, tuple[type[BaseSettings], Any, str | None]]
+    """The secrets, ``None`` standing for the ``secrets_name`` of the class."""
+
+
+class ResolutionContext:
+    """Shares the values fetched by every settings class built in its scope.
+
+    Within the ``with`` block, each parameter, parameter path and secret is
+    fetched once, whichever class reads it first, and the other classes
+    reuse its value. Secrets are kept whole, so that every class can read
+    its own keys from them.
+
+    The SSM parameters of the ``settings_classes`` given to the context are
+    fetched together: the first ``GetParameters`` call with a client also
+    requests the parameters of the other classes read with that client, so
+    that building every class costs as few calls as possible.
+
+    Example:
+        ```py
+        with ResolutionContext(DatabaseSettings, CacheSettings, QueueSettings):
+            database = DatabaseSettings()
+            cache = CacheSettings()
+            queue = QueueSettings()
+        ```
+
+    Values are only shared within the block, and only by the sync sources:
+    ``aload()`` and :class:`~pydantic_settings_aws.RefreshingSettings`
+    always fetch from AWS.
+    """
+
+    def __init__(self, *settings_classes: type[BaseSettings]) -> None:
+        self.settings_classes = settings_classes
+        self._lock = threading.Lock()
+        self._values: dict[ValueCacheKey, Any] = {}
+        self._pending: dict[str, list[str]] | None = None
+        self._reads: _Reads | None = None
+        self._tokens: list[Token[ResolutionContext | None]] = []
+        self._fetched = 0
+        self._shared = 0
+
+    def __enter__(self) -> Self:
+        self._tokens.append(_current_context.set(self))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        _current_context.reset(self._tokens.pop())
+        if not self._tokens:
+            self.clear()
+
+    def get_ssm_contents(
+        self, settings: type[BaseSettings], client: Any, ssm_names: list[str]
+    ) -> dict[str, str | None]:
+        """Shared counterpart of :func:`aws.get_ssm_contents`.
+
+        The parameters of the context's classes read with the same client,
+        and not fetched yet, are requested in the same calls.
+        """
+        keys = {
+            name: aws.get_value_key(settings, "ssm", client, name)
+            for name in dict.fromkeys(ssm_names)
+        }
+
+        with self._lock:
+            missing = [name for name, key in keys.items() if key not in self._values]
+            self._shared += len(keys) - len(missing)
+            pending = self._take_pending(keys[missing[0]], keys) if missing else []
+
+        if missing:
+            # a parameter of another class may be missing from SSM: it is
+            # left out, and raised when that class fetches it
+            contents = aws.get_ssm_contents(
+                settings, client, missing + pending, skip_invalid=True
+            )
+            self._set_values(
+                {
+                    aws.get_value_key(settings, "ssm", client, name): value
+                    for name, value in contents.items()
+                }
+            )
+            for name in missing:
+                if name not in contents:
+                    aws.raise_parameter_not_found(name)
+
+        return self._get_values(keys)
+
+    def get_ssm_path_contents(
+        self,
+        settings: type[BaseSettings],
+        client: Any,
+        ssm_path: str,
+        recursive: bool = False,
+    ) -> dict[str, str | None]:
+        """Shared counterpart of :func:`aws.get_ssm_path_contents`."""
+        key = aws.get_value_key(
+            settings, "ssm", client, aws.get_ssm_path_cache_name(ssm_path, recursive)
+        )
+        if not self._has_value(key):
+            self._set_values(
+                {key: aws.get_ssm_path_contents(settings, client, ssm_path, recursive)}
+            )
+
+        return dict(self._values[key])
+
+    def get_secrets_content(
+        self,
+        settings: type[BaseSettings],
+        client: Any = None,
+        secrets_name: str | None = None,
+        keys: Collection[str] | None = None,
+    ) -> dict[str, Any]:
+        """Shared counterpart of :func:`aws.get_secrets_content`."""
+        client = aws.get_secrets_client(settings, client)
+        secrets_args = aws.get_secrets_args(settings, secrets_name)
+        key = aws.get_value_key(
+            settings,
+            "secretsmanager",
+            client,
+            secrets_args.secrets_name,
+            secrets_args.secrets_version or secrets_args.secrets_stage,
+        )
+        if not self._has_value(key):
+            self._set_values(
+                {key: aws.get_secrets_content(settings, client, secrets_name)}
+            )
+
+        return _select_keys(self._values[key], keys)
+
+    def get_batch_secrets_contents(
+        self,
+        settings: type[BaseSettings],
+        secret_names: list[str],
+        client: Any = None,
+        keys: Mapping[str, Collection[str]] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Shared counterpart of :func:`aws.get_batch_secrets_contents`."""
+        client = aws.get_secrets_client(settings, client)
+        value_keys = {
+            name: aws.get_value_key(settings, "secretsmanager", client, name)
+            for name in dict.fromkeys(secret_names)
+        }
+
+        with self._lock:
+            missing = [
+                name for name, key in value_keys.items() if key not in self._values
+            ]
+            self._shared += len(value_keys) - len(missing)
+
+        if missing:
+            contents = aws.get_batch_secrets_contents(settings, missing, client)
+            self._set_values(
+                {value_keys[name]: content for name, content in contents.items()}
+            )
+
+        return {
+            name: _select_keys(self._values[key], (keys or {}).get(name))
+            for name, key in value_keys.items()
+        }
+
+    def prefetch(self, max_workers: int = DEFAULT_PREFETCH_WORKERS) -> None:
+        """Fetch the values of the context's classes before they are built.
+
+        The parameters are fetched first, with as few ``GetParameters`` calls
+        as possible per session, then the parameter paths and the secrets
+        are fetched concurrently, on up to ``max_workers`` threads.
+
+        Errors are not raised: a value that could not be fetched is fetched
+        again, and its error raised, when its class is built.
+        """
+        reads = self._get_reads()
+
+        for settings, client, ssm_names in reads.ssm.values():
+            _try_fetch(self.get_ssm_contents, settings, client, ssm_names)
+
+        fetches: list[Callable[[], Any]] = [
+            functools.partial(
+                _try_fetch, self.get_ssm_path_contents, settings, client, *path
+            )
+            for settings, client, path in reads.paths.values()
+        ]
+        fetches.extend(
+            functools.partial(
+                _try_fetch, self.get_secrets_content, settings, client, secret
+            )
+            for settings, client, secret in reads.secrets.values()
+        )
+        if not fetches:
+            return
+
+        logger.debug("Prefetching %d parameter paths and secrets", len(fetches))
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(fetches)),
+            thread_name_prefix="pydantic-settings-aws",
+        ) as executor:
+            for future in [executor.submit(fetch) for fetch in fetches]:
+                future.result()
+
+    def stats(self) -> ResolutionStats:
+        """Return the fetched and shared value counters."""
+        with self._lock:
+            return ResolutionStats(self._fetched, self._shared)
+
+    def clear(self) -> None:
+        """Forget the values fetched in the context."""
+        with self._lock:
+            self._values.clear()
+            self._pending = None
+            self._reads = None
+
+    def _has_value(self, key: ValueCacheKey) -> bool:
+        with self._lock:
+            found = key in self._values
+            self._shared += found
+
+        return found
+
+    def _get_values(self, keys: dict[str, ValueCacheKey]) -> dict[str, Any]:
+        with self._lock:
+            return {name: self._values.get(key) for name, key in keys.items()}
+
+    def _set_values(self, values: dict[ValueCacheKey, Any]) -> None:
+        with self._lock:
+            self._values.update(values)
+            self._fetched += len(values)
+
+    def _get_reads(self) -> _Reads:
+        if self._reads is None:
+            self._reads = _get_reads(self.settings_classes)
+
+        return self._reads
+
+    def _take_pending(
+        self, key: ValueCacheKey, requested: Collection[str]
+    ) -> list[str]:
+        """Return, and forget, the parameters of the context's classes not fetched yet.
+
+        Only the parameters read with the session of ``key``, and missing
+        from ``requested``, are returned.
+        """
+        if self._pending is None:
+            self._pending = {
+                session_key: ssm_names
+                for session_key, (_, _, ssm_names) in self._get_reads().ssm.items()
+            }
+
+        return [
+            name
+            for name in self._pending.pop(key.session_key, [])
+            if name not in requested and key._replace(name=name) not in self._values
+        ]
+
+
+def get_resolution_context() -> ResolutionContext | None:
+    """Return the active :class:`ResolutionContext`, if any.
+
+    No context is returned while versions are recorded, so that refreshes
+    always see the current values.
+    """
+    if aws.is_recording_versions():
+        return None
+
+    return _current_context.get()
+
+
+def _select_keys(content: dict[str, Any], keys: Collection[str] | None) -> dict[str, Any]:
+    if keys is None:
+        return dict(content)
+
+    return {key: content[key] for key in keys if key in content}
+
+
+def _try_fetch(fetch: Callable[..., Any], *args: Any) -> None:
+    try:
+        fetch(*args)
+    # the error is raised again by the settings class fetching the value itself
+    except Exception as e:  # noqa: BLE001
+        logger.debug("Prefetch failed, retried when the class is built: %r", e)
+
+
+def _get_reads(settings_classes: tuple[type[BaseSettings], ...]) -> _Reads:
+    """Return what ``settings_classes`` read from AWS.
+
+    Classes whose reads can't be planned, because of an invalid configuration
+    for example, are skipped: they raise their error when they are built.
+    """
+    reads = _Reads({}, {}, {})
+    for settings_cls in settings_classes:
+        try:
+            _add_reads(reads, settings_cls)
+        except PydanticSettingsAWSError as e:
+            logger.debug("Not prefetching %s: %r", settings_cls.__name__, e)
+
+    for _, _, ssm_names in reads.ssm.values():
+        ssm_names[:] = dict.fromkeys(ssm_names)
+
+    return reads
+
+
+def _add_reads(reads: _Reads, settings_cls: type[BaseSettings]) -> None:
+    from .settings import AWSBaseSettings, ParameterStoreBaseSettings
+
+    if issubclass(settings_cls, AWSBaseSettings):
+        routes = plan.get_plan(settings_cls, "aws").routes
+    elif issubclass(settings_cls, ParameterStoreBaseSettings):
+        ssm_plan = plan.get_plan(settings_cls, "ssm")
+        routes = ssm_plan.routes
+        ssm_path = utils.get_config_value(settings_cls, "ssm_path")
+        if ssm_path and ssm_plan.path_fields:
+            recursive = bool(
+                utils.get_config_value(settings_cls, "ssm_path_recursive")
+            )
+            client = aws.get_ssm_client(settings_cls)
+            key = aws.get_value_key(
+                settings_cls,
+                "ssm",
+                client,
+                aws.get_ssm_path_cache_name(ssm_path, recursive),
+            )
+            reads.paths.setdefault(
+                key, (settings_cls, client, (ssm_path, recursive))
+            )
+    else:
+        routes = plan.get_plan(settings_cls, "secrets").routes
+
+    for route in routes:
+        if route.service == "ssm":
+            client = aws.get_ssm_client(settings_cls, route.client)
+            session_key = aws.get_value_key(
+                settings_cls, "ssm", client, route.key
+            ).session_key
+            reads.ssm.setdefault(session_key, (settings_cls, client, []))[2].append(
+                route.key
+            )
+            continue
+
+        client = aws.get_secrets_client(settings_cls, route.client)
+        secrets_args = aws.get_secrets_args(settings_cls, route.secret)
+        key = aws.get_value_key(
+            settings_cls,
+            "secretsmanager",
+            client,
+            secrets_args.secrets_name,
+            secrets_args.secrets_version or secrets_args.secrets_stage,
+        )
+        reads.secrets.setdefault(key, (settings_cls, client, route.secret))
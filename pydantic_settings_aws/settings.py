@@ -1,14 +1,43 @@
+from typing import Any, TypeVar
+
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
 )
+from typing_extensions import Self
 
+from . import instrumentation, lazy
+from .config import AWSSettingsConfigDict
+from .errors import AWSSettingsConfigError
+from .lazy import DeferredFieldsModel
 from .sources import (
+    AsyncAWSSettingsSource,
+    AsyncParameterStoreSettingsSource,
+    AsyncSecretsManagerSettingsSource,
     AWSSettingsSource,
     ParameterStoreSettingsSource,
     SecretsManagerSettingsSource,
+    get_prewarmed_values,
+    preload_values,
 )
 
+SettingsT = TypeVar("SettingsT", bound=BaseSettings)
+
+
+async def _aload(
+    settings_cls: type[SettingsT],
+    source: AsyncAWSSettingsSource
+    | AsyncParameterStoreSettingsSource
+    | AsyncSecretsManagerSettingsSource,
+    values: dict[str, Any],
+) -> SettingsT:
+    field_values = get_prewarmed_values(settings_cls)
+    if field_values is None:
+        field_values = await source.aload()
+
+    with preload_values(settings_cls, field_values):
+        return settings_cls(**values)
+
 
 class AWSBaseSettings(BaseSettings):
     """Base settings class that loads values from both AWS Secrets Manager and SSM Parameter Store.
@@ -18,9 +47,23 @@ class AWSBaseSettings(BaseSettings):
     for Parameter Store. Fields without AWS metadata fall through to the standard
     pydantic-settings sources (environment variables, dotenv, etc.).
 
+    Subclass :class:`LazyAWSBaseSettings` instead to fetch the AWS fields on
+    first access.
+
     Source priority order: init > AWS > env > dotenv > file secrets.
     """
 
+    def __init__(self, **values: Any) -> None:
+        with instrumentation.span(
+            instrumentation.BUILD_SETTINGS, settings=type(self).__name__
+        ), lazy.deferring(type(self), values, "aws"):
+            super().__init__(**values)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        lazy.check_lazy_settings(cls)
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -38,6 +81,19 @@ class AWSBaseSettings(BaseSettings):
             file_secret_settings,
         )
 
+    @classmethod
+    async def aload(cls, **values: Any) -> Self:
+        """Build the settings without blocking the event loop.
+
+        Every AWS value is fetched concurrently with ``asyncio``, then the
+        settings are validated as usual. Requires ``aiobotocore`` unless the
+        boto3 clients are given in :class:`AWSSettingsConfigDict`.
+
+        Args:
+            **values: Init values, with the same priority as in ``__init__``.
+        """
+        return await _aload(cls, AsyncAWSSettingsSource(cls), values)
+
 
 class ParameterStoreBaseSettings(BaseSettings):
     """Base settings class that loads values from AWS SSM Parameter Store.
@@ -50,9 +106,23 @@ class ParameterStoreBaseSettings(BaseSettings):
     and resolved by the remaining pydantic-settings sources (environment
     variables, dotenv, etc.).
 
+    Subclass :class:`LazyParameterStoreBaseSettings` instead to fetch the
+    parameters on first access.
+
     Source priority order: init > Parameter Store > env > dotenv > file secrets.
     """
 
+    def __init__(self, **values: Any) -> None:
+        with instrumentation.span(
+            instrumentation.BUILD_SETTINGS, settings=type(self).__name__
+        ), lazy.deferring(type(self), values, "ssm"):
+            super().__init__(**values)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        lazy.check_lazy_settings(cls)
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -70,19 +140,73 @@ class ParameterStoreBaseSettings(BaseSettings):
             file_secret_settings,
         )
 
+    @classmethod
+    async def aload(cls, **values: Any) -> Self:
+        """Build the settings without blocking the event loop.
+
+        Every AWS value is fetched concurrently with ``asyncio``, then the
+        settings are validated as usual. Requires ``aiobotocore`` unless the
+        boto3 clients are given in :class:`AWSSettingsConfigDict`.
+
+        Args:
+            **values: Init values, with the same priority as in ``__init__``.
+        """
+        return await _aload(cls, AsyncParameterStoreSettingsSource(cls), values)
+
+
+class LazyAWSBaseSettings(AWSBaseSettings, DeferredFieldsModel):
+    """:class:`AWSBaseSettings` fetching each AWS field on first access.
+
+    Instantiation fetches nothing from AWS. The first access to a field
+    fetches it together with the fields of its ``group`` and of its secret,
+    and validates it with its field validators. :meth:`resolve_all` fetches
+    every remaining field at once. Set ``resolve_lazily`` to ``False`` in a
+    subclass to fetch every field on instantiation again.
+
+    Model validators are not supported, as they would run without the
+    deferred fields.
+    """
+
+    model_config = AWSSettingsConfigDict(resolve_lazily=True)
+
+
+class LazyParameterStoreBaseSettings(ParameterStoreBaseSettings, DeferredFieldsModel):
+    """:class:`ParameterStoreBaseSettings` fetching each parameter on first access.
+
+    Instantiation fetches nothing from AWS. The first access to a field
+    fetches it together with the fields of its ``group``, or every field
+    read from ``ssm_path``, and validates it with its field validators.
+    :meth:`resolve_all` fetches every remaining field at once. Set
+    ``resolve_lazily`` to ``False`` in a subclass to fetch every field on
+    instantiation again.
+
+    Model validators are not supported, as they would run without the
+    deferred fields.
+    """
+
+    model_config = AWSSettingsConfigDict(resolve_lazily=True)
+
 
 class SecretsManagerBaseSettings(BaseSettings):
-    """Base settings class that loads values from a single AWS Secrets Manager secret.
+    """Base settings class that loads values from AWS Secrets Manager secrets.
 
     The secret must contain a JSON object whose keys map to the model's field
     names. The secret is fetched once at instantiation time and cached for the
     lifetime of the source.
 
-    Requires ``secrets_name`` to be set in :class:`AWSSettingsConfigDict`.
+    Requires ``secrets_name`` to be set in :class:`AWSSettingsConfigDict`,
+    unless every field names its secret with ``Secrets(secret=...)``. Several
+    secrets are fetched together with ``BatchGetSecretValue``.
 
     Source priority order: init > Secrets Manager > env > dotenv > file secrets.
     """
 
+    def __init__(self, **values: Any) -> None:
+        with instrumentation.span(
+            instrumentation.BUILD_SETTINGS, settings=type(self).__name__
+        ):
+            super().__init__(**values)
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -99,3 +223,44 @@ class SecretsManagerBaseSettings(BaseSettings):
             dotenv_settings,
             file_secret_settings,
         )
+
+    @classmethod
+    async def aload(cls, **values: Any) -> Self:
+        """Build the settings without blocking the event loop.
+
+        Every AWS value is fetched concurrently with ``asyncio``, then the
+        settings are validated as usual. Requires ``aiobotocore`` unless the
+        boto3 clients are given in :class:`AWSSettingsConfigDict`.
+
+        Args:
+            **values: Init values, with the same priority as in ``__init__``.
+        """
+        return await _aload(cls, AsyncSecretsManagerSettingsSource(cls), values)
+
+
+def get_source_cls(
+    settings_cls: type[BaseSettings],
+) -> (
+    type[AWSSettingsSource]
+    | type[ParameterStoreSettingsSource]
+    | type[SecretsManagerSettingsSource]
+):
+    """Return the AWS source class of ``settings_cls``.
+
+    Raises:
+        AWSSettingsConfigError: If ``settings_cls`` is not a subclass of one of
+            the base settings classes.
+    """
+    if issubclass(settings_cls, AWSBaseSettings):
+        return AWSSettingsSource
+
+    if issubclass(settings_cls, ParameterStoreBaseSettings):
+        return ParameterStoreSettingsSource
+
+    if issubclass(settings_cls, SecretsManagerBaseSettings):
+        return SecretsManagerSettingsSource
+
+    raise AWSSettingsConfigError(
+        f"{settings_cls.__name__} must inherit from AWSBaseSettings, "
+        "ParameterStoreBaseSettings or SecretsManagerBaseSettings"
+    )
@@ -0,0 +1,92 @@
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlightStats(NamedTuple):
+    """Counters of a :class:`SingleFlight`."""
+
+    calls: int
+    """Calls that ran their function."""
+
+    coalesced: int
+    """Calls that waited for a concurrent call with the same key instead."""
+
+
+class _Call:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into a single call.
+
+    The first caller of a key runs the function. Callers of the same key
+    arriving while it runs wait for it and get its result, or its exception,
+    instead of running the function again. Once the call is done, the next
+    caller of the key runs the function again: results are not cached.
+
+    All the state is guarded by a lock, so this works the same with or
+    without the GIL.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._count = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """Call ``function``, or wait for the call in flight for ``key``."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._count += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def stats(self) -> SingleFlightStats:
+        """Return the call and coalesced call counters."""
+        with self._lock:
+            return SingleFlightStats(self._count, self._coalesced)
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        with self._lock:
+            self._count = self._coalesced = 0
+
+    def _after_fork_in_child(self) -> None:
+        # the calls in flight belong to parent threads, which don't exist in
+        # the child: waiting for them would block forever
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._count = self._coalesced = 0
+
+
+single_flight = SingleFlight()
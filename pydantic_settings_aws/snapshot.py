@@ -0,0 +1,448 @@
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pydantic_settings import BaseSettings
+
+from . import boto, utils
+from .errors import AWSSettingsConfigError
+from .logger import logger
+
+SNAPSHOT_KEY_ENV = "PYDANTIC_SETTINGS_AWS_SNAPSHOT_KEY"
+
+DEFAULT_SNAPSHOT_TTL = 300.0
+
+_MAGIC = b"PSAWS-SNAPSHOT-1\n"
+
+_NONCE_SIZE = 12
+
+
+class SnapshotStats(NamedTuple):
+    """Counters of the snapshot layer."""
+
+    hits: int
+    """Instantiations served from a fresh snapshot."""
+
+    fallbacks: int
+    """Instantiations served from a stale snapshot because AWS was unreachable."""
+
+    misses: int
+    """Instantiations fetched from AWS, with no usable snapshot."""
+
+    revalidations: int
+    """Snapshots refreshed from AWS in the background."""
+
+    errors: int
+    """Snapshots that could not be read, written or decrypted."""
+
+
+class SnapshotMetrics:
+    """Thread-safe counters of the snapshot layer, shared by the whole process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(SnapshotStats._fields, 0)
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def stats(self) -> SnapshotStats:
+        """Return the hit, fallback, miss, revalidation and error counters."""
+        with self._lock:
+            return SnapshotStats(**self._counters)
+
+    def reset(self) -> None:
+        """Reset every counter to zero."""
+        with self._lock:
+            self._counters = dict.fromkeys(SnapshotStats._fields, 0)
+
+
+snapshot_metrics = SnapshotMetrics()
+
+
+class Snapshot(NamedTuple):
+    """The field values of a settings class, as written to disk."""
+
+    created_at: float
+    """Wall clock time the values were fetched from AWS."""
+
+    values: dict[str, Any]
+    """The value of each field, by field name."""
+
+
+class SnapshotStore:
+    """Encrypted snapshot files of the field values resolved from AWS.
+
+    Each settings class and source gets its own file in ``directory``. Files
+    are encrypted with AES-GCM, with a key derived from ``key`` with HKDF, and
+    are bound to their settings class: a snapshot can't be read back for
+    another class. Files are read through a memory map and written atomically.
+
+    Requires the ``cryptography`` package, installed with the ``snapshot`` extra.
+
+    Args:
+        directory (str | Path): The directory of the snapshot files. It is
+            created if needed.
+        key (bytes): The key material, for example a random 32 bytes key or a
+            data key decrypted with KMS.
+        clock (Callable[[], float]): Returns the wall clock time.
+
+    Raises:
+        AWSSettingsConfigError: If ``cryptography`` is not installed.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        key: bytes,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        try:
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+            from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+        except ImportError as e:
+            raise AWSSettingsConfigError(
+                "cryptography is required to use snapshots, "
+                "install it with 'pip install pydantic-settings-aws[snapshot]'"
+            ) from e
+
+        derived_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"pydantic-settings-aws snapshot",
+        ).derive(key)
+
+        self.directory = Path(directory)
+        self._aead = AESGCM(derived_key)
+        self._clock = clock
+
+    def read(self, settings_cls: type[BaseSettings], kind: str) -> Snapshot | None:
+        """Return the snapshot of ``settings_cls``, or ``None`` if there is no usable one."""
+        path = self.get_path(settings_cls, kind)
+
+        try:
+            with path.open("rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as content:
+                if content[: len(_MAGIC)] != _MAGIC:
+                    raise ValueError("not a snapshot file")
+
+                nonce_end = len(_MAGIC) + _NONCE_SIZE
+                payload = self._aead.decrypt(
+                    content[len(_MAGIC) : nonce_end],
+                    content[nonce_end:],
+                    _get_identity(settings_cls, kind).encode(),
+                )
+        except (FileNotFoundError, ValueError):
+            # missing and empty files can't be mapped
+            return None
+        # a snapshot that can't be read is fetched again instead
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Ignoring unreadable snapshot %s: %r", path, e)
+            snapshot_metrics.increment("errors")
+            return None
+
+        created_at, values = json.loads(payload)
+
+        return Snapshot(created_at, values)
+
+    def write(
+        self, settings_cls: type[BaseSettings], kind: str, values: dict[str, Any]
+    ) -> None:
+        """Encrypt ``values`` and replace the snapshot of ``settings_cls`` with them.
+
+        Errors are logged, as a missing snapshot only makes the next boot slower.
+        """
+        path = self.get_path(settings_cls, kind)
+        nonce = os.urandom(_NONCE_SIZE)
+
+        try:
+            payload = json.dumps([self._clock(), values]).encode()
+            content = self._aead.encrypt(
+                nonce, payload, _get_identity(settings_cls, kind).encode()
+            )
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_MAGIC + nonce + content)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        # failing to write a snapshot must not fail the instantiation
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Failed to write snapshot %s: %r", path, e)
+            snapshot_metrics.increment("errors")
+
+    def age(self, snapshot: Snapshot) -> float:
+        """Return the seconds elapsed since the values of ``snapshot`` were fetched."""
+        return self._clock() - snapshot.created_at
+
+    def get_path(self, settings_cls: type[BaseSettings], kind: str) -> Path:
+        """Return the snapshot file of ``settings_cls``."""
+        digest = hashlib.sha256(_get_identity(settings_cls, kind).encode())
+        return self.directory / f"{digest.hexdigest()[:32]}.snapshot"
+
+
+_stores: dict[tuple[str, bytes], SnapshotStore] = {}
+_provided_keys: dict[Callable[[], bytes], bytes] = {}
+_stores_lock = threading.Lock()
+
+# the sources whose values were fetched from AWS in this process, so that
+# snapshots written by an earlier process are revalidated once per process
+_revalidated: weakref.WeakKeyDictionary[type[BaseSettings], set[str]] = (
+    weakref.WeakKeyDictionary()
+)
+_revalidated_lock = threading.Lock()
+
+_revalidation_tasks: set["asyncio.Task[None]"] = set()
+
+
+def get_snapshot_store(settings_cls: type[BaseSettings]) -> SnapshotStore | None:
+    """Return the snapshot store configured for ``settings_cls``, if any.
+
+    Raises:
+        AWSSettingsConfigError: If ``snapshot_dir`` is set without a key.
+    """
+    directory = utils.get_config_value(settings_cls, "snapshot_dir")
+    if not directory:
+        return None
+
+    key = _get_snapshot_key(settings_cls)
+    store_key = (str(directory), hashlib.sha256(key).digest())
+
+    with _stores_lock:
+        store = _stores.get(store_key)
+        if store is None:
+            store = _stores[store_key] = SnapshotStore(directory, key)
+
+    return store
+
+
+def load_field_values(
+    settings_cls: type[BaseSettings],
+    kind: str,
+    fetch: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    """Return the field values of ``settings_cls``, from its snapshot when possible.
+
+    A snapshot younger than ``snapshot_ttl`` is returned right away, and
+    revalidated with AWS on a background thread the first time the process
+    uses it, unless the process fetched the values itself. Otherwise the
+    values are fetched with ``fetch`` and written to the snapshot. If AWS is
+    unreachable, a snapshot younger than ``snapshot_max_staleness`` is
+    returned instead.
+
+    Args:
+        settings_cls (type[BaseSettings]): The settings class being built.
+        kind (str): The kind of source, so that each source has its own snapshot.
+        fetch (Callable[[], dict[str, Any]]): Fetches the field values from AWS.
+    """
+    store = get_snapshot_store(settings_cls)
+    if store is None:
+        return fetch()
+
+    snapshot = store.read(settings_cls, kind)
+    if snapshot and store.age(snapshot) < _get_ttl(settings_cls):
+        snapshot_metrics.increment("hits")
+        if _mark_revalidated(settings_cls, kind):
+            _revalidate_in_background(store, settings_cls, kind, fetch)
+        return snapshot.values
+
+    try:
+        values = fetch()
+    except Exception as e:
+        if _can_fall_back(settings_cls, store, snapshot, e):
+            return snapshot.values  # type: ignore[union-attr]
+        raise
+
+    snapshot_metrics.increment("misses")
+    _mark_revalidated(settings_cls, kind)
+    store.write(settings_cls, kind, values)
+
+    return values
+
+
+async def aload_field_values(
+    settings_cls: type[BaseSettings],
+    kind: str,
+    fetch: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Async counterpart of :func:`load_field_values`.
+
+    Fresh snapshots are revalidated, once per process, in a task of the
+    running event loop.
+    """
+    store = get_snapshot_store(settings_cls)
+    if store is None:
+        return await fetch()
+
+    snapshot = store.read(settings_cls, kind)
+    if snapshot and store.age(snapshot) < _get_ttl(settings_cls):
+        snapshot_metrics.increment("hits")
+        if _mark_revalidated(settings_cls, kind):
+            task = asyncio.create_task(_arevalidate(store, settings_cls, kind, fetch))
+            _revalidation_tasks.add(task)
+            task.add_done_callback(_revalidation_tasks.discard)
+        return snapshot.values
+
+    try:
+        values = await fetch()
+    except Exception as e:
+        if _can_fall_back(settings_cls, store, snapshot, e):
+            return snapshot.values  # type: ignore[union-attr]
+        raise
+
+    snapshot_metrics.increment("misses")
+    _mark_revalidated(settings_cls, kind)
+    store.write(settings_cls, kind, values)
+
+    return values
+
+
+def save_field_values(
+    settings_cls: type[BaseSettings], kind: str, values: dict[str, Any]
+) -> None:
+    """Write ``values`` to the snapshot of ``settings_cls``, if snapshots are enabled."""
+    store = get_snapshot_store(settings_cls)
+    if store is not None:
+        store.write(settings_cls, kind, values)
+
+
+def _can_fall_back(
+    settings_cls: type[BaseSettings],
+    store: SnapshotStore,
+    snapshot: Snapshot | None,
+    error: Exception,
+) -> bool:
+    if snapshot is None or not boto.is_unreachable_error(error):
+        return False
+
+    age = store.age(snapshot)
+    max_staleness = utils.get_config_value(settings_cls, "snapshot_max_staleness")
+    if max_staleness is not None and age >= max_staleness:
+        logger.warning(
+            "AWS is unreachable and the %s snapshot is older than "
+            "snapshot_max_staleness (%.0fs)",
+            settings_cls.__name__,
+            age,
+        )
+        return False
+
+    logger.warning(
+        "AWS is unreachable, loading %s from a %.0fs old snapshot: %r",
+        settings_cls.__name__,
+        age,
+        error,
+    )
+    snapshot_metrics.increment("fallbacks")
+    return True
+
+
+def _mark_revalidated(settings_cls: type[BaseSettings], kind: str) -> bool:
+    """Mark the snapshot of ``settings_cls`` as revalidated in this process.
+
+    Returns:
+        bool: Whether it was not marked yet.
+    """
+    with _revalidated_lock:
+        kinds = _revalidated.setdefault(settings_cls, set())
+        if kind in kinds:
+            return False
+
+        kinds.add(kind)
+        return True
+
+
+def _revalidate_in_background(
+    store: SnapshotStore,
+    settings_cls: type[BaseSettings],
+    kind: str,
+    fetch: Callable[[], dict[str, Any]],
+) -> None:
+    def revalidate() -> None:
+        try:
+            store.write(settings_cls, kind, fetch())
+            snapshot_metrics.increment("revalidations")
+        # logged only, the snapshot is still fresh
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                "Failed to revalidate the %s snapshot: %r", settings_cls.__name__, e
+            )
+
+    threading.Thread(
+        target=revalidate,
+        name=f"pydantic-settings-aws-snapshot-{settings_cls.__name__}",
+        daemon=True,
+    ).start()
+
+
+async def _arevalidate(
+    store: SnapshotStore,
+    settings_cls: type[BaseSettings],
+    kind: str,
+    fetch: Callable[[], Awaitable[dict[str, Any]]],
+) -> None:
+    try:
+        store.write(settings_cls, kind, await fetch())
+        snapshot_metrics.increment("revalidations")
+    # logged only, the snapshot is still fresh
+    except Exception as e:  # noqa: BLE001
+        logger.warning(
+            "Failed to revalidate the %s snapshot: %r", settings_cls.__name__, e
+        )
+
+
+def _after_fork_in_child() -> None:
+    """Replace the locks and forget the revalidation tasks of the parent.
+
+    Snapshots the parent revalidated are not revalidated again by the child.
+    """
+    global _stores_lock, _revalidated_lock
+
+    _stores_lock = threading.Lock()
+    _revalidated_lock = threading.Lock()
+    _revalidation_tasks.clear()
+
+
+def _get_snapshot_key(settings_cls: type[BaseSettings]) -> bytes:
+    key = utils.get_config_value(settings_cls, "snapshot_key")
+    if callable(key):
+        # key providers may call KMS, so they are called once per process
+        with _stores_lock:
+            if key not in _provided_keys:
+                _provided_keys[key] = key()
+            key = _provided_keys[key]
+
+    if key is None:
+        key = os.environ.get(SNAPSHOT_KEY_ENV)
+
+    if not key:
+        raise AWSSettingsConfigError(
+            f"snapshot_dir is set for {settings_cls.__name__} but no snapshot key "
+            f"was given with snapshot_key or the {SNAPSHOT_KEY_ENV} variable"
+        )
+
+    return key.encode() if isinstance(key, str) else bytes(key)
+
+
+def _get_ttl(settings_cls: type[BaseSettings]) -> float:
+    ttl = utils.get_config_value(settings_cls, "snapshot_ttl")
+    return DEFAULT_SNAPSHOT_TTL if ttl is None else float(ttl)
+
+
+def _get_identity(settings_cls: type[BaseSettings], kind: str) -> str:
+    return f"{settings_cls.__module__}.{settings_cls.__qualname__}:{kind}"
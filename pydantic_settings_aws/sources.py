@@ -1,5 +1,13 @@
+import asyncio
+import contextvars
+import functools
 import sys
 import warnings
+from collections.abc import Awaitable, Callable, Collection, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
 from typing import Any
 
 from pydantic.fields import FieldInfo
@@ -8,8 +16,10 @@ from pydantic_settings import (
     PydanticBaseSettingsSource,
 )
 
-from pydantic_settings_aws import aws, utils
+from pydantic_settings_aws import aio, aws, plan, resolution, snapshot, utils
+from pydantic_settings_aws.errors import ParameterNotFoundError
 from pydantic_settings_aws.logger import logger
+from pydantic_settings_aws.plan import FieldRoute
 
 
 class PythonVersionDeprecationWarning(UserWarning):
@@ -34,40 +44,284 @@ def log_py_version_deprecation_warning() -> None:
         _warned = True
 
 
+FetchKey = tuple[Any, ...]
+
+_preloaded_values: ContextVar[dict[type[BaseSettings], dict[str, Any]]] = ContextVar(
+    "pydantic_settings_aws_preloaded_values"
+)
+
+# read-only, so that the values inherited by forked workers stay the ones
+# resolved by the parent
+_prewarmed_values: dict[type[BaseSettings], Mapping[str, Any]] = {}
+
+
+@contextmanager
+def preload_values(
+    settings_cls: type[BaseSettings], field_values: dict[str, Any]
+) -> Iterator[None]:
+    """Make the sources of ``settings_cls`` use ``field_values`` instead of AWS.
+
+    Used to validate values that were already fetched, for example by
+    :meth:`AsyncAWSSettingsSource.aload`, without fetching them again.
+    """
+    token = _preloaded_values.set(
+        {**_preloaded_values.get({}), settings_cls: field_values}
+    )
+    try:
+        yield
+    finally:
+        _preloaded_values.reset(token)
+
+
+def get_preloaded_values(settings_cls: type[BaseSettings]) -> dict[str, Any] | None:
+    """Return the values preloaded for ``settings_cls``, if any.
+
+    Values given to :func:`preload_values` come first, then the ones resolved
+    by :func:`~pydantic_settings_aws.prewarm`.
+    """
+    field_values = _preloaded_values.get({}).get(settings_cls)
+    if field_values is None:
+        field_values = get_prewarmed_values(settings_cls)
+
+    return field_values
+
+
+def get_prewarmed_values(settings_cls: type[BaseSettings]) -> dict[str, Any] | None:
+    """Return a copy of the values prewarmed for ``settings_cls``, if any."""
+    field_values = _prewarmed_values.get(settings_cls)
+
+    return None if field_values is None else dict(field_values)
+
+
+def set_prewarmed_values(
+    settings_cls: type[BaseSettings], field_values: Mapping[str, Any]
+) -> None:
+    """Make every source of ``settings_cls`` use ``field_values`` instead of AWS."""
+    _prewarmed_values[settings_cls] = MappingProxyType(dict(field_values))
+
+
+def clear_prewarmed_values(*settings_classes: type[BaseSettings]) -> None:
+    """Drop the values prewarmed for ``settings_classes``, or for every class."""
+    if not settings_classes:
+        _prewarmed_values.clear()
+
+    for settings_cls in settings_classes:
+        _prewarmed_values.pop(settings_cls, None)
+
+
+def _get_fetcher(name: str) -> Callable[..., Any]:
+    """Return the ``aws`` fetch function ``name``.
+
+    Within a :class:`~pydantic_settings_aws.ResolutionContext`, its
+    counterpart sharing the values with the other classes is returned.
+    """
+    context = resolution.get_resolution_context()
+
+    return getattr(context or aws, name)
+
+
+def _filter_routes(
+    routes: tuple[FieldRoute, ...], field_names: frozenset[str] | None
+) -> tuple[FieldRoute, ...]:
+    """Return the routes of ``field_names``, or every route when ``None``."""
+    if field_names is None:
+        return routes
+
+    return tuple(route for route in routes if route.field_name in field_names)
+
+
 class AWSSettingsSource(PydanticBaseSettingsSource):
     def __init__(self, settings_cls: type[BaseSettings]):
         super().__init__(settings_cls)
+        self._field_values: dict[str, Any] | None = get_preloaded_values(
+            settings_cls
+        )
+        self._only: frozenset[str] | None = None
         log_py_version_deprecation_warning()
 
     def get_field_value(
         self, field: FieldInfo, field_name: str
     ) -> tuple[Any, str, bool]:
-        logger.debug(f"Getting {field_name} value from AWS service")
-        field_value = None
+        if self._field_values is None:
+            self._field_values = snapshot.load_field_values(
+                self.settings_cls, "aws", self._get_field_values
+            )
+
+        field_value = self._field_values.get(field_name)
+
+        return field_value, field_name, False
+
+    def load(self) -> dict[str, Any]:
+        """Fetch the value of every field from AWS, without validating them.
+
+        The snapshot of the class, when ``snapshot_dir`` is set, is replaced
+        with the fetched values.
+
+        Returns:
+            dict[str, Any]: The value of each field, by field name.
+        """
+        self._field_values = self._get_field_values()
+        snapshot.save_field_values(self.settings_cls, "aws", self._field_values)
+
+        return self._field_values
 
-        service_metadata = utils.get_annotated_service_metadata(field.metadata)
+    def load_fields(self, field_names: Collection[str]) -> dict[str, Any]:
+        """Fetch the value of ``field_names`` only, without validating them.
 
-        if not service_metadata:
-            logger.info("No information about AWS service was found")
-            return None, field_name, False
+        Used by ``resolve_lazily`` to fetch the fields on first access. The
+        snapshot of the class is neither read nor written.
 
-        service = service_metadata.get("service")
+        Returns:
+            dict[str, Any]: The value of each of ``field_names``, by field name.
+        """
+        self._only = frozenset(field_names)
 
+        return self._get_field_values()
+
+    def _get_field_values(self) -> dict[str, Any]:
+        """Fetch the value of every field annotated with an AWS service.
+
+        Fields are grouped into fetches: one ``GetParameters`` batch per SSM
+        client and one ``GetSecretValue`` per distinct secret. Fetches run in
+        the order of their first field, or on a thread pool when
+        ``resolve_max_workers`` is set. Either way, the error of the first
+        failing field, in field order, is the one raised, even when a batch
+        fails on a parameter of a later field.
+        """
+        fetches, field_fetches = self._get_fetches(
+            self._get_client,
+            _get_fetcher("get_ssm_contents"),
+            _get_fetcher("get_secrets_content"),
+        )
+        contents = self._run_fetches(fetches, field_fetches)
+
+        return {
+            field_name: contents[fetch_key].get(key)
+            for field_name, fetch_key, key in field_fetches
+        }
+
+    def _get_aws_fields(self) -> tuple[FieldRoute, ...]:
+        """Return the route of every field annotated with an AWS service.
+
+        The key of a route is the parameter name for ``"ssm"`` fields and the
+        JSON key inside the secret for ``"secrets"`` fields.
+        """
+        return _filter_routes(
+            plan.get_plan(self.settings_cls, "aws").routes, self._only
+        )
+
+    def _get_client(self, service: str, client: Any) -> Any:
         if service == "ssm":
-            ssm_info = utils.get_ssm_name_from_annotated_field(field.metadata)
-            field_value = aws.get_ssm_content(
-                self.settings_cls, field_name, ssm_info
+            return aws.get_ssm_client(self.settings_cls, client)
+
+        return aws.get_secrets_client(self.settings_cls, client)
+
+    def _get_fetches(
+        self,
+        get_client: Callable[[str, Any], Any],
+        get_ssm_contents: Callable[..., Any],
+        get_secrets_content: Callable[..., Any],
+    ) -> tuple[dict[FetchKey, Callable[[], Any]], list[tuple[str, FetchKey, str]]]:
+        """Group the AWS fields into fetches.
+
+        Returns:
+            tuple: The fetches, in the order of their first field, and the
+                fetch key and remote key of every AWS field.
+        """
+        fetches: dict[FetchKey, Callable[[], Any]] = {}
+        ssm_batches: dict[int, tuple[Any, list[str]]] = {}
+        secret_fetches: dict[FetchKey, tuple[Any, str | None, list[str]]] = {}
+        field_fetches: list[tuple[str, FetchKey, str]] = []
+
+        for route in self._get_aws_fields():
+            client = get_client(route.service, route.client)
+
+            if route.service == "ssm":
+                ssm_batches.setdefault(id(client), (client, []))[1].append(route.key)
+                fetch_key: FetchKey = ("ssm", id(client))
+
+            else:
+                fetch_key = (
+                    "secrets",
+                    *aws.get_secret_key(self.settings_cls, client, route.secret),
+                )
+                secret_fetches.setdefault(fetch_key, (client, route.secret, []))[
+                    2
+                ].append(route.key)
+
+            field_fetches.append((route.field_name, fetch_key, route.key))
+
+        for client_id, (client, ssm_names) in ssm_batches.items():
+            fetches[("ssm", client_id)] = functools.partial(
+                get_ssm_contents, self.settings_cls, client, ssm_names
             )
 
-        elif service == "secrets":
-            logger.debug(
-                f"Getting value from secrets manager for filed {field_name}"
+        # only the keys of the fields are decoded from each secret
+        for fetch_key, (client, secret, keys) in secret_fetches.items():
+            fetches[fetch_key] = functools.partial(
+                get_secrets_content, self.settings_cls, client, secret, keys
             )
-            json_content = aws.get_secrets_content(self.settings_cls)
-            secret_key = utils.get_secrets_field_name(field.metadata, field_name)
-            field_value = json_content.get(secret_key)
 
-        return field_value, field_name, False
+        ordered_fetches = {
+            fetch_key: fetches[fetch_key] for _, fetch_key, _ in field_fetches
+        }
+
+        return ordered_fetches, field_fetches
+
+    def _run_fetches(
+        self,
+        fetches: dict[FetchKey, Callable[[], Any]],
+        field_fetches: list[tuple[str, FetchKey, str]],
+    ) -> dict[FetchKey, Any]:
+        max_workers = utils.get_config_value(
+            self.settings_cls, "resolve_max_workers"
+        )
+        contents: dict[FetchKey, Any] = {}
+        errors: dict[FetchKey, BaseException] = {}
+
+        if not max_workers or max_workers <= 1 or len(fetches) <= 1:
+            first_fields: dict[FetchKey, int] = {}
+            for i, (_, fetch_key, _) in enumerate(field_fetches):
+                first_fields.setdefault(fetch_key, i)
+
+            for fetch_key, fetch in fetches.items():
+                # fetches run in the order of their first field, so the ones
+                # left can't fail on an earlier field than the errors so far
+                if errors and first_fields[fetch_key] > min(
+                    _get_failing_field(field_fetches, key, error)
+                    for key, error in errors.items()
+                ):
+                    break
+                try:
+                    contents[fetch_key] = fetch()
+                # raised below, once the first failing field is known
+                except Exception as e:  # noqa: BLE001
+                    errors[fetch_key] = e
+
+            _raise_first_error(errors, field_fetches)
+            return contents
+
+        logger.debug("Running %d fetches on a thread pool", len(fetches))
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(fetches)),
+            thread_name_prefix="pydantic-settings-aws",
+        ) as executor:
+            # each fetch runs in a copy of the caller's context, so that
+            # context-scoped state like recorded versions is shared
+            futures = {
+                fetch_key: executor.submit(contextvars.copy_context().run, fetch)
+                for fetch_key, fetch in fetches.items()
+            }
+
+            for fetch_key, future in futures.items():
+                error = future.exception()
+                if error is None:
+                    contents[fetch_key] = future.result()
+                else:
+                    errors[fetch_key] = error
+
+        _raise_first_error(errors, field_fetches)
+        return contents
 
     def prepare_field_value(
         self,
@@ -99,18 +353,128 @@ class ParameterStoreSettingsSource(PydanticBaseSettingsSource):
 
     def __init__(self, settings_cls: type[BaseSettings]):
         super().__init__(settings_cls)
+        self._field_values: dict[str, Any] | None = get_preloaded_values(
+            settings_cls
+        )
+        self._only: frozenset[str] | None = None
         log_py_version_deprecation_warning()
 
     def get_field_value(
         self, field: FieldInfo, field_name: str
     ) -> tuple[Any, str, bool]:
-        ssm_info = utils.get_ssm_name_from_annotated_field(field.metadata)
-        field_value = aws.get_ssm_content(
-            self.settings_cls, field_name, ssm_info
-        )
+        if self._field_values is None:
+            self._field_values = snapshot.load_field_values(
+                self.settings_cls, "ssm", self._get_field_values
+            )
+
+        field_value = self._field_values.get(field_name)
 
         return field_value, field_name, False
 
+    def load(self) -> dict[str, Any]:
+        """Fetch the value of every field from AWS, without validating them.
+
+        The snapshot of the class, when ``snapshot_dir`` is set, is replaced
+        with the fetched values.
+
+        Returns:
+            dict[str, Any]: The value of each field, by field name.
+        """
+        self._field_values = self._get_field_values()
+        snapshot.save_field_values(self.settings_cls, "ssm", self._field_values)
+
+        return self._field_values
+
+    def load_fields(self, field_names: Collection[str]) -> dict[str, Any]:
+        """Fetch the value of ``field_names`` only, without validating them.
+
+        Used by ``resolve_lazily`` to fetch the fields on first access. The
+        snapshot of the class is neither read nor written.
+
+        Returns:
+            dict[str, Any]: The value of each of ``field_names``, by field name.
+        """
+        self._only = frozenset(field_names)
+
+        return self._get_field_values()
+
+    def _get_field_values(self) -> dict[str, Any]:
+        """Fetch the parameters of every field, batching names by client.
+
+        When ``ssm_path`` is set, the fields without a parameter name are read
+        from the path with ``GetParametersByPath`` instead.
+        """
+        values: dict[str, Any] = {}
+        ssm_path, recursive = self._get_ssm_path()
+
+        if ssm_path and self._get_path_fields():
+            contents = _get_fetcher("get_ssm_path_contents")(
+                self.settings_cls, self._get_client(None), ssm_path, recursive
+            )
+            values.update(self._read_path_values(ssm_path, contents))
+
+        get_ssm_contents = _get_fetcher("get_ssm_contents")
+        for client, fields in self._get_batches(self._get_client).values():
+            contents = get_ssm_contents(
+                self.settings_cls, client, [ssm_name for _, ssm_name in fields]
+            )
+            for field_name, ssm_name in fields:
+                values[field_name] = contents.get(ssm_name)
+
+        return values
+
+    def _get_ssm_fields(self) -> tuple[FieldRoute, ...]:
+        """Return the route of every field fetched by parameter name.
+
+        Fields read from ``ssm_path`` are not included.
+        """
+        return _filter_routes(
+            plan.get_plan(self.settings_cls, "ssm").routes, self._only
+        )
+
+    def _get_path_fields(self) -> tuple[str, ...]:
+        """Return the name of the fields read from ``ssm_path``."""
+        path_fields = plan.get_plan(self.settings_cls, "ssm").path_fields
+        if self._only is None:
+            return path_fields
+
+        return tuple(name for name in path_fields if name in self._only)
+
+    def _get_ssm_path(self) -> tuple[str | None, bool]:
+        ssm_path = utils.get_config_value(self.settings_cls, "ssm_path")
+        recursive = bool(
+            utils.get_config_value(self.settings_cls, "ssm_path_recursive")
+        )
+
+        return ssm_path, recursive
+
+    def _read_path_values(
+        self, ssm_path: str, contents: dict[str, str | None]
+    ) -> dict[str, Any]:
+        """Map the parameters under ``ssm_path`` to the fields read from it."""
+        tree = utils.get_ssm_path_tree(ssm_path, contents)
+
+        return {
+            field_name: tree.get(field_name) for field_name in self._get_path_fields()
+        }
+
+    def _get_client(self, client: Any) -> Any:
+        return aws.get_ssm_client(self.settings_cls, client)
+
+    def _get_batches(
+        self, get_client: Callable[[Any], Any]
+    ) -> dict[int, tuple[Any, list[tuple[str, str]]]]:
+        """Group the field and parameter names by the client that fetches them."""
+        batches: dict[int, tuple[Any, list[tuple[str, str]]]] = {}
+
+        for route in self._get_ssm_fields():
+            client = get_client(route.client)
+            batches.setdefault(id(client), (client, []))[1].append(
+                (route.field_name, route.key)
+            )
+
+        return batches
+
     def prepare_field_value(
         self,
         field_name: str,
@@ -139,16 +503,100 @@ class ParameterStoreSettingsSource(PydanticBaseSettingsSource):
 class SecretsManagerSettingsSource(PydanticBaseSettingsSource):
     def __init__(self, settings_cls: type[BaseSettings]):
         super().__init__(settings_cls)
-        self._json_content = aws.get_secrets_content(settings_cls)
+        self._field_values: dict[str, Any] | None = get_preloaded_values(
+            settings_cls
+        )
         log_py_version_deprecation_warning()
 
     def get_field_value(
         self, field: FieldInfo, field_name: str
     ) -> tuple[Any, str, bool]:
-        secret_key = utils.get_secrets_field_name(field.metadata, field_name)
-        field_value = self._json_content.get(secret_key)
+        if self._field_values is None:
+            self._field_values = snapshot.load_field_values(
+                self.settings_cls, "secrets", self._get_field_values
+            )
+
+        field_value = self._field_values.get(field_name)
+
         return field_value, field_name, False
 
+    def load(self) -> dict[str, Any]:
+        """Fetch the secret from AWS and map it to the fields, without validating them.
+
+        The snapshot of the class, when ``snapshot_dir`` is set, is replaced
+        with the fetched values.
+
+        Returns:
+            dict[str, Any]: The value of each field, by field name.
+        """
+        self._field_values = self._get_field_values()
+        snapshot.save_field_values(self.settings_cls, "secrets", self._field_values)
+
+        return self._field_values
+
+    def _get_field_values(self) -> dict[str, Any]:
+        """Fetch the secrets of the fields and map every field to its key.
+
+        A class reading ``secrets_name`` only makes a single ``GetSecretValue``
+        call. When fields name other secrets, every secret is read with
+        ``BatchGetSecretValue``, except a ``secrets_name`` pinned to a version
+        or stage, which batches can't read.
+        """
+        get_secrets_content = _get_fetcher("get_secrets_content")
+        secret_keys = self._get_secret_keys()
+        secret_names = list(secret_keys)
+        if secret_names == [None]:
+            return self._read_field_values(
+                {
+                    None: get_secrets_content(
+                        self.settings_cls, keys=secret_keys[None]
+                    )
+                }
+            )
+
+        contents: dict[str | None, dict[str, Any]] = {}
+        batch = [name for name in secret_names if name is not None]
+        batch_keys = {name: secret_keys[name] for name in batch}
+        if None in secret_names:
+            secrets_args = aws.get_secrets_args(self.settings_cls)
+            if secrets_args.secrets_version or secrets_args.secrets_stage:
+                contents[None] = get_secrets_content(
+                    self.settings_cls, keys=secret_keys[None]
+                )
+            else:
+                batch.insert(0, secrets_args.secrets_name)
+                batch_keys.setdefault(secrets_args.secrets_name, [])
+                batch_keys[secrets_args.secrets_name] += secret_keys[None]
+
+        batch_contents = _get_fetcher("get_batch_secrets_contents")(
+            self.settings_cls, batch, keys=batch_keys
+        )
+        if None in secret_names and None not in contents:
+            contents[None] = batch_contents[batch[0]]
+        contents.update(batch_contents)
+
+        return self._read_field_values(contents)
+
+    def _get_secret_keys(self) -> dict[str | None, list[str]]:
+        """Return the keys of every secret, ``None`` standing for ``secrets_name``.
+
+        Only these keys are decoded from the JSON content of each secret.
+        """
+        secret_keys: dict[str | None, list[str]] = {}
+        for route in plan.get_plan(self.settings_cls, "secrets").routes:
+            secret_keys.setdefault(route.secret, []).append(route.key)
+
+        return secret_keys or {None: []}
+
+    def _read_field_values(
+        self, contents: dict[str | None, dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Map every field to its key in the JSON content of its secret."""
+        return {
+            route.field_name: contents[route.secret].get(route.key)
+            for route in plan.get_plan(self.settings_cls, "secrets").routes
+        }
+
     def prepare_field_value(
         self,
         field_name: str,
@@ -172,3 +620,215 @@ class SecretsManagerSettingsSource(PydanticBaseSettingsSource):
                 d[field_key] = field_value
 
         return d
+
+
+class AsyncAWSSettingsSource(AWSSettingsSource):
+    """Async counterpart of :class:`AWSSettingsSource`.
+
+    Await :meth:`aload` to fetch every SSM batch and secret concurrently on the
+    event loop. The source then behaves like its sync counterpart without
+    making any AWS call.
+    """
+
+    async def aload(self) -> dict[str, Any]:
+        """Fetch the value of every field annotated with an AWS service.
+
+        Returns:
+            dict[str, Any]: The value of each AWS field, by field name.
+        """
+        self._field_values = await snapshot.aload_field_values(
+            self.settings_cls, "aws", self._afetch_field_values
+        )
+
+        return self._field_values
+
+    async def _afetch_field_values(self) -> dict[str, Any]:
+        aws_fields = self._get_aws_fields()
+        clients: dict[str, Any] = {
+            service: await aio.get_client(self.settings_cls, service)
+            for service in dict.fromkeys(
+                route.service for route in aws_fields if not route.client
+            )
+        }
+
+        fetches, field_fetches = self._get_fetches(
+            lambda service, client: client or clients[service],
+            aio.get_ssm_contents,
+            aio.get_secrets_content,
+        )
+        contents = await _gather_fetches(fetches, field_fetches)
+
+        return {
+            field_name: contents[fetch_key].get(key)
+            for field_name, fetch_key, key in field_fetches
+        }
+
+
+class AsyncParameterStoreSettingsSource(ParameterStoreSettingsSource):
+    """Async counterpart of :class:`ParameterStoreSettingsSource`.
+
+    Await :meth:`aload` to fetch every parameter batch concurrently on the
+    event loop. The source then behaves like its sync counterpart without
+    making any AWS call.
+    """
+
+    async def aload(self) -> dict[str, Any]:
+        """Fetch the parameters of every field.
+
+        Returns:
+            dict[str, Any]: The value of each field, by field name.
+        """
+        self._field_values = await snapshot.aload_field_values(
+            self.settings_cls, "ssm", self._afetch_field_values
+        )
+
+        return self._field_values
+
+    async def _afetch_field_values(self) -> dict[str, Any]:
+        ssm_path, recursive = self._get_ssm_path()
+        if not self._get_path_fields():
+            ssm_path = None
+
+        ssm_client = None
+        if ssm_path or any(not route.client for route in self._get_ssm_fields()):
+            ssm_client = await aio.get_client(self.settings_cls, "ssm")
+
+        batches = self._get_batches(lambda client: client or ssm_client)
+        fetches: dict[FetchKey, Callable[[], Awaitable[Any]]] = {
+            ("ssm", client_id): functools.partial(
+                aio.get_ssm_contents,
+                self.settings_cls,
+                client,
+                [ssm_name for _, ssm_name in fields],
+            )
+            for client_id, (client, fields) in batches.items()
+        }
+        if ssm_path:
+            fetches[("ssm_path",)] = functools.partial(
+                aio.get_ssm_path_contents,
+                self.settings_cls,
+                ssm_client,
+                ssm_path,
+                recursive,
+            )
+
+        contents = await _gather_fetches(fetches)
+
+        field_values: dict[str, Any] = {}
+        if ssm_path:
+            field_values.update(
+                self._read_path_values(ssm_path, contents[("ssm_path",)])
+            )
+        field_values.update(
+            {
+                field_name: contents[("ssm", client_id)].get(ssm_name)
+                for client_id, (_, fields) in batches.items()
+                for field_name, ssm_name in fields
+            }
+        )
+
+        return field_values
+
+
+class AsyncSecretsManagerSettingsSource(SecretsManagerSettingsSource):
+    """Async counterpart of :class:`SecretsManagerSettingsSource`.
+
+    Await :meth:`aload` to fetch the secrets on the event loop. The source
+    then behaves like its sync counterpart without making any AWS call.
+
+    Secrets are read with concurrent ``GetSecretValue`` calls rather than
+    ``BatchGetSecretValue``.
+    """
+
+    async def aload(self) -> dict[str, Any]:
+        """Fetch the secret and read the value of every field from it.
+
+        Returns:
+            dict[str, Any]: The value of each field, by field name.
+        """
+        self._field_values = await snapshot.aload_field_values(
+            self.settings_cls, "secrets", self._afetch_field_values
+        )
+
+        return self._field_values
+
+    async def _afetch_field_values(self) -> dict[str, Any]:
+        secret_keys = self._get_secret_keys()
+        secret_names = list(secret_keys)
+        client = await aio.get_client(self.settings_cls, "secrets")
+        fetches: dict[FetchKey, Callable[[], Awaitable[Any]]] = {
+            (secret_name,): functools.partial(
+                aio.get_secrets_content, self.settings_cls, client, secret_name, keys
+            )
+            for secret_name, keys in secret_keys.items()
+        }
+        contents = await _gather_fetches(fetches)
+
+        return self._read_field_values(
+            {secret_name: contents[(secret_name,)] for secret_name in secret_names}
+        )
+
+
+async def _gather_fetches(
+    fetches: dict[FetchKey, Callable[[], Awaitable[Any]]],
+    field_fetches: list[tuple[str, FetchKey, str]] | None = None,
+) -> dict[FetchKey, Any]:
+    """Run ``fetches`` concurrently and raise the error of the first failing one.
+
+    With ``field_fetches``, the error of the first failing field is raised
+    instead, as in :meth:`AWSSettingsSource._run_fetches`.
+    """
+    results = await asyncio.gather(
+        *(fetch() for fetch in fetches.values()), return_exceptions=True
+    )
+
+    if field_fetches is None:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+    else:
+        _raise_first_error(
+            {
+                fetch_key: result
+                for fetch_key, result in zip(fetches, results)
+                if isinstance(result, BaseException)
+            },
+            field_fetches,
+        )
+
+    return dict(zip(fetches, results))
+
+
+def _get_failing_field(
+    field_fetches: list[tuple[str, FetchKey, str]],
+    fetch_key: FetchKey,
+    error: BaseException,
+) -> int:
+    """Return the index of the first field of ``fetch_key`` failing with ``error``.
+
+    A ``ParameterNotFoundError`` fails on the field of its parameter. Any
+    other error fails on every field of the fetch.
+    """
+    indexes = [
+        (i, key)
+        for i, (_, key_of, key) in enumerate(field_fetches)
+        if key_of == fetch_key
+    ]
+    if isinstance(error, ParameterNotFoundError):
+        for i, key in indexes:
+            if key == error.ssm_name:
+                return i
+
+    return indexes[0][0]
+
+
+def _raise_first_error(
+    errors: dict[FetchKey, BaseException],
+    field_fetches: list[tuple[str, FetchKey, str]],
+) -> None:
+    """Raise the error of the first failing field, in field order, if any."""
+    if errors:
+        raise min(
+            errors.items(),
+            key=lambda item: _get_failing_field(field_fetches, *item),
+        )[1]
@@ -0,0 +1,306 @@
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+from pydantic_settings import BaseSettings
+
+from . import boto, utils
+from .logger import logger
+
+if TYPE_CHECKING:
+    from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+
+T = TypeVar("T")
+
+ThrottleKey = tuple[str, str]
+
+DEFAULT_MAX_ATTEMPTS = 1
+
+DEFAULT_BACKOFF_BASE = 0.1
+
+DEFAULT_BACKOFF_CAP = 20.0
+
+THROTTLING_ERROR_CODES = {
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+}
+
+
+class ThrottleConfig(NamedTuple):
+    """The throttling options of a settings class."""
+
+    rate: float | None
+    """Requests per second allowed per session and service, or ``None`` for no limit."""
+
+    burst: float
+    """Requests that can be sent at once before ``rate`` applies."""
+
+    max_attempts: int
+    """Attempts of each request on throttling errors, including the first one."""
+
+    backoff_base: float
+    """Seconds the first retry waits at most."""
+
+    backoff_cap: float
+    """Seconds any retry waits at most."""
+
+    startup_jitter: float
+    """Seconds the first requests of the process are randomly delayed by at most."""
+
+
+class ThrottleStats(NamedTuple):
+    """Counters of a :class:`Throttler`."""
+
+    delayed: int
+    """Requests delayed by the rate limit or the startup jitter."""
+
+    retried: int
+    """Requests sent again after a throttling error."""
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second, up to ``burst`` tokens.
+
+    Not thread-safe: :class:`Throttler` holds its lock while using buckets.
+    """
+
+    def __init__(self, rate: float, burst: float, now: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = now
+
+    def reserve(self, now: float) -> float:
+        """Take a token and return the seconds to wait before using it.
+
+        Tokens can be taken ahead of time, so that concurrent callers are
+        spread over time instead of all retrying when a token is refilled.
+        """
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+        self._tokens -= 1
+
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class Throttler:
+    """Process-wide client-side throttling of the AWS requests of the library.
+
+    Requests are rate limited by a token bucket per session and service, the
+    session identifying the account and region, retried with exponential
+    backoff and full jitter on throttling errors, and delayed by a random
+    startup jitter so that processes started together spread their first
+    requests. A single instance, :data:`throttler`, is shared by the whole
+    process.
+
+    Args:
+        clock (Callable[[], float]): Returns a monotonic time.
+        sleep (Callable[[float], None]): Blocks for the given seconds.
+        asleep (Callable[[float], Awaitable[None]]): Sleeps for the given
+            seconds on the event loop.
+        rng (random.Random | None): The random generator of the jitter.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        asleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._asleep = asleep
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._buckets: dict[ThrottleKey, TokenBucket] = {}
+        self._startup_until: float | None = None
+        self._delayed = 0
+        self._retried = 0
+
+    def call(
+        self, key: ThrottleKey, config: ThrottleConfig, request: Callable[[], T]
+    ) -> T:
+        """Send ``request`` once the rate limit allows it, retrying it on throttling errors.
+
+        Args:
+            key (ThrottleKey): The session key and service of the request.
+            config (ThrottleConfig): The throttling options.
+            request (Callable[[], T]): Sends the request.
+        """
+        attempt = 0
+        while True:
+            delay = self.get_delay(key, config)
+            if delay > 0:
+                self._sleep(delay)
+
+            try:
+                return request()
+            except boto.client_errors() as e:
+                attempt += 1
+                if not self._should_retry(e, config, attempt):
+                    raise
+
+            self._sleep(self.get_backoff(config, attempt))
+
+    async def acall(
+        self,
+        key: ThrottleKey,
+        config: ThrottleConfig,
+        request: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Async counterpart of :meth:`call`, sleeping without blocking the event loop."""
+        attempt = 0
+        while True:
+            delay = self.get_delay(key, config)
+            if delay > 0:
+                await self._asleep(delay)
+
+            try:
+                return await request()
+            except boto.client_errors() as e:
+                attempt += 1
+                if not self._should_retry(e, config, attempt):
+                    raise
+
+            await self._asleep(self.get_backoff(config, attempt))
+
+    def get_delay(self, key: ThrottleKey, config: ThrottleConfig) -> float:
+        """Return the seconds to wait before sending a request, reserving its token."""
+        with self._lock:
+            now = self._clock()
+            delay = 0.0
+
+            if config.startup_jitter > 0:
+                if self._startup_until is None:
+                    self._startup_until = now + self._rng.uniform(
+                        0, config.startup_jitter
+                    )
+                delay = max(delay, self._startup_until - now)
+
+            if config.rate:
+                bucket = self._buckets.get(key)
+                if bucket is None or (bucket.rate, bucket.burst) != (
+                    config.rate,
+                    config.burst,
+                ):
+                    bucket = self._buckets[key] = TokenBucket(
+                        config.rate, config.burst, now
+                    )
+                delay = max(delay, bucket.reserve(now))
+
+            if delay > 0:
+                self._delayed += 1
+
+        return delay
+
+    def get_backoff(self, config: ThrottleConfig, attempt: int) -> float:
+        """Return the full jitter backoff after ``attempt`` failed attempts."""
+        with self._lock:
+            return self._rng.uniform(
+                0, min(config.backoff_cap, config.backoff_base * 2 ** (attempt - 1))
+            )
+
+    def stats(self) -> ThrottleStats:
+        """Return the delayed and retried request counters."""
+        with self._lock:
+            return ThrottleStats(self._delayed, self._retried)
+
+    def clear(self) -> None:
+        """Drop every token bucket, reset the startup jitter and the counters."""
+        with self._lock:
+            self._buckets.clear()
+            self._startup_until = None
+            self._delayed = self._retried = 0
+
+    def _after_fork_in_child(self) -> None:
+        # every child draws its own startup jitter, from a reseeded generator
+        # so that children forked together don't draw the same one
+        self._lock = threading.Lock()
+        self._rng.seed()
+        self._buckets.clear()
+        self._startup_until = None
+        self._delayed = self._retried = 0
+
+    def _should_retry(
+        self, error: "ClientError", config: ThrottleConfig, attempt: int
+    ) -> bool:
+        if not is_throttling_error(error) or attempt >= config.max_attempts:
+            return False
+
+        with self._lock:
+            self._retried += 1
+
+        logger.debug(
+            "Request throttled, retrying (attempt %d of %d)",
+            attempt + 1,
+            config.max_attempts,
+        )
+        return True
+
+
+throttler = Throttler()
+
+
+def is_throttling_error(error: "ClientError") -> bool:
+    """Return whether ``error`` means the request was throttled by AWS."""
+    return error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+def get_throttle_config(settings: type[BaseSettings]) -> ThrottleConfig | None:
+    """Return the throttling options of ``settings``, or ``None`` when none is set."""
+    rate = utils.get_config_value(settings, "throttle_rate")
+    burst = utils.get_config_value(settings, "throttle_burst")
+    max_attempts = utils.get_config_value(settings, "throttle_max_attempts")
+    backoff_base = utils.get_config_value(settings, "throttle_backoff_base")
+    backoff_cap = utils.get_config_value(settings, "throttle_backoff_cap")
+    startup_jitter = utils.get_config_value(settings, "throttle_startup_jitter")
+
+    if not rate and not max_attempts and not startup_jitter:
+        return None
+
+    return ThrottleConfig(
+        rate=rate,
+        burst=max(1.0, rate or 1.0) if burst is None else burst,
+        max_attempts=DEFAULT_MAX_ATTEMPTS if max_attempts is None else max_attempts,
+        backoff_base=DEFAULT_BACKOFF_BASE if backoff_base is None else backoff_base,
+        backoff_cap=DEFAULT_BACKOFF_CAP if backoff_cap is None else backoff_cap,
+        startup_jitter=startup_jitter or 0.0,
+    )
+
+
+def call(
+    settings: type[BaseSettings],
+    key: Callable[[], ThrottleKey],
+    request: Callable[[], T],
+) -> T:
+    """Send ``request`` with the throttling options of ``settings``.
+
+    ``key`` is only called when throttling is enabled.
+    """
+    config = get_throttle_config(settings)
+    if config is None:
+        return request()
+
+    return throttler.call(key(), config, request)
+
+
+async def acall(
+    settings: type[BaseSettings],
+    key: Callable[[], ThrottleKey],
+    request: Callable[[], Awaitable[T]],
+) -> T:
+    """Async counterpart of :func:`call`."""
+    config = get_throttle_config(settings)
+    if config is None:
+        return await request()
+
+    return await throttler.acall(key(), config, request)
@@ -1,8 +1,15 @@
 from typing import Any
 
+from pydantic_settings import BaseSettings
+
 from .fields import SSM, Secrets
 
 
+def get_config_value(settings: type[BaseSettings], key: str) -> Any:
+    """Return the ``model_config`` value of ``key``, or ``None`` when not set."""
+    return settings.model_config.get(key)
+
+
 def get_annotated_service_metadata(
     metadata: list[Any],
 ) -> dict[str, Any] | None:
@@ -37,6 +44,97 @@ def get_secrets_field_name(metadata: list[Any], default: str) -> str:
     return default
 
 
+def get_secret_name_from_annotated_field(metadata: list[Any]) -> str | None:
+    """Return the secret of a :class:`Secrets` descriptor, if any.
+
+    When ``None``, the field is read from the ``secrets_name`` of the config.
+    """
+    for m in metadata:
+        if isinstance(m, Secrets) and m.secret is not None:
+            return m.secret
+
+    return None
+
+
+def get_secrets_client_from_annotated_field(metadata: list[Any]) -> Any | None:
+    """Return the per-field client of a :class:`Secrets` descriptor, if any."""
+    for m in metadata:
+        if isinstance(m, Secrets) and m.client is not None:
+            return m.client
+
+    return None
+
+
+def get_field_group(metadata: list[Any]) -> str | None:
+    """Return the lazy resolution group of a field, if any.
+
+    The group is read from an :class:`SSM` or :class:`Secrets` descriptor, or
+    from the ``"group"`` key of a dict annotation.
+    """
+    for m in metadata:
+        if isinstance(m, (SSM, Secrets)) and m.group is not None:
+            return m.group
+
+        if isinstance(m, dict) and m.get("group") is not None:
+            return str(m["group"])
+
+    return None
+
+
+def is_ssm_path_field(ssm_info: str | dict[str, Any] | SSM | None) -> bool:
+    """Return whether a field is read from ``ssm_path`` rather than by name.
+
+    Fields without SSM metadata, or with an :class:`SSM` descriptor that
+    specifies neither a name nor a client, are read from the path.
+    """
+    if ssm_info is None:
+        return True
+
+    return isinstance(ssm_info, SSM) and not ssm_info.name and not ssm_info.client
+
+
+def get_prefixed_ssm_name(ssm_prefix: str | None, ssm_name: str) -> str:
+    """Prepend ``ssm_prefix`` to a parameter name, unless it is an ARN.
+
+    Example:
+        ``get_prefixed_ssm_name("/tenants/acme", "/db/host")`` returns
+        ``"/tenants/acme/db/host"``.
+    """
+    if not ssm_prefix or ssm_name.startswith("arn:"):
+        return ssm_name
+
+    return f"{ssm_prefix.rstrip('/')}/{ssm_name.lstrip('/')}"
+
+
+def get_ssm_path_tree(
+    ssm_path: str, contents: dict[str, str | None]
+) -> dict[str, Any]:
+    """Nest the parameters under ``ssm_path`` by path segment.
+
+    ``/myapp/prod/db/host`` under ``/myapp/prod`` becomes
+    ``{"db": {"host": ...}}``, so that nested models can be validated from it.
+    When a parameter and a hierarchy share the same name, the hierarchy wins.
+    """
+    tree: dict[str, Any] = {}
+    prefix = ssm_path.rstrip("/") + "/"
+
+    for name, value in sorted(contents.items()):
+        if not name.startswith(prefix):
+            continue
+
+        *parents, leaf = name[len(prefix) :].split("/")
+        node = tree
+        for parent in parents:
+            if not isinstance(node.get(parent), dict):
+                node[parent] = {}
+            node = node[parent]
+
+        if not isinstance(node.get(leaf), dict):
+            node[leaf] = value
+
+    return tree
+
+
 def _get_ssm_info_from_metadata(metadata: Any) -> Any | None:
     if isinstance(metadata, str):
         return metadata
@@ -0,0 +1,232 @@
+import asyncio
+import json
+import sys
+import types
+from typing import Annotated, Any, ClassVar
+
+import pytest
+
+from pydantic_settings_aws import (
+    SSM,
+    AWSBaseSettings,
+    AWSClientError,
+    AWSSettingsConfigDict,
+    ParameterStoreBaseSettings,
+    SecretNotFoundError,
+    Secrets,
+    SecretsManagerBaseSettings,
+    aio,
+)
+
+from .boto3_mocks import AsyncClientMock, ClientMock, InFlightTracker, PathClientMock
+from .settings_mocks import (
+    AWSWithInterleavedErrors,
+    dict_secrets_with_username_and_password,
+    make_parameter_settings,
+    secrets_with_username_and_password,
+)
+
+
+def test_parameter_store_aload_must_fetch_chunks_concurrently() -> None:
+    client = AsyncClientMock(delay=0.01, ssm_value="value")
+
+    settings_cls = make_parameter_settings(
+        {f"param_{i}": Annotated[str, f"/my/param/{i}"] for i in range(25)},
+        ssm_client=client,
+    )
+
+    my_config = asyncio.run(settings_cls.aload())
+
+    assert my_config.param_24 == "value"  # type: ignore[attr-defined]
+    assert [len(call) for call in client.sync_client.get_parameters_calls] == [10, 10, 5]
+    assert client.tracker.max_in_flight == 3
+
+
+def test_secrets_manager_aload_must_read_every_field_from_the_secret() -> None:
+    client = AsyncClientMock(secret_string=secrets_with_username_and_password)
+
+    class Settings(SecretsManagerBaseSettings):
+        model_config = AWSSettingsConfigDict(secrets_name="my/secret", secrets_client=client)
+
+        username: str
+        pwd: Annotated[str, Secrets(field="password")]
+
+    my_config = asyncio.run(Settings.aload())
+
+    assert my_config.username == dict_secrets_with_username_and_password["username"]
+    assert my_config.pwd == dict_secrets_with_username_and_password["password"]
+    assert client.sync_client.get_secret_value_calls == 1
+
+
+def test_aws_aload_must_fetch_distinct_sources_concurrently() -> None:
+    tracker = InFlightTracker()
+    secrets_client = AsyncClientMock(
+        delay=0.01, tracker=tracker, secret_string=secrets_with_username_and_password
+    )
+    ssm_client = AsyncClientMock(delay=0.01, tracker=tracker, ssm_value="value")
+    other_ssm_client = AsyncClientMock(delay=0.01, tracker=tracker, ssm_value="other")
+
+    class Settings(AWSBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            secrets_name="my/secret",
+            secrets_client=secrets_client,
+            ssm_client=ssm_client,
+        )
+
+        username: Annotated[str, Secrets()]
+        password: Annotated[str, {"service": "secrets"}]
+        host: Annotated[str, SSM(name="/my/host")]
+        other_host: Annotated[str, SSM(name="/other/host", client=other_ssm_client)]
+        server_name: str = "default"
+
+    my_config = asyncio.run(Settings.aload())
+
+    assert my_config.username == dict_secrets_with_username_and_password["username"]
+    assert my_config.host == "value"
+    assert my_config.other_host == "other"
+    assert my_config.server_name == "default"
+    assert tracker.max_in_flight == 3
+    assert secrets_client.sync_client.get_secret_value_calls == 1
+
+
+def test_aws_aload_errors_must_follow_field_order() -> None:
+    class Settings(AWSBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            secrets_name="my/secret",
+            secrets_client=AsyncClientMock(delay=0.05, error_code="ResourceNotFoundException"),
+            ssm_client=AsyncClientMock(error_code="ThrottlingException"),
+        )
+
+        username: Annotated[str, Secrets()]
+        host: Annotated[str, SSM(name="/my/host")]
+
+    with pytest.raises(SecretNotFoundError):
+        asyncio.run(Settings.aload())
+
+
+def test_aws_aload_errors_must_follow_the_first_failing_field() -> None:
+    with pytest.raises(SecretNotFoundError):
+        asyncio.run(AWSWithInterleavedErrors.aload())
+
+
+def test_aload_must_give_priority_to_init_values() -> None:
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=AsyncClientMock(ssm_value="value"))
+
+        host: Annotated[str, "/my/host"]
+        port: Annotated[str, "/my/port"]
+
+    my_config = asyncio.run(Settings.aload(port="8080"))
+
+    assert my_config.host == "value"
+    assert my_config.port == "8080"
+
+
+def test_aload_must_run_sync_clients_on_a_thread() -> None:
+    client = ClientMock(ssm_value="value")
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=client)
+
+        host: Annotated[str, "/my/host"]
+
+    my_config = asyncio.run(Settings.aload())
+
+    assert my_config.host == "value"
+    assert client.get_parameters_calls == [["/my/host"]]
+
+
+def test_parameter_store_aload_must_read_the_ssm_path() -> None:
+    client = PathClientMock(
+        {"/my/app/host": "localhost", "/my/app/db/name": "db"}, ssm_value="named"
+    )
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            ssm_client=client, ssm_path="/my/app", ssm_path_recursive=True
+        )
+
+        host: str
+        db: dict[str, str]
+        region: Annotated[str, "/shared/region"]
+
+    my_config = asyncio.run(Settings.aload())
+
+    assert my_config.host == "localhost"
+    assert my_config.db == {"name": "db"}
+    assert my_config.region == "named"
+    assert len(client.get_parameters_by_path_calls) == 1
+
+
+class FakeAioSession:
+    created: ClassVar[list[str]] = []
+    closed: ClassVar[list[str]] = []
+    configs: ClassVar[list[Any]] = []
+
+    def __init__(self, profile: str | None = None) -> None:
+        self.profile = profile
+
+    def create_client(self, service: str, config: Any = None, **kwargs: Any) -> Any:
+        session = self
+        session.configs.append(config)
+
+        class ClientContext:
+            async def __aenter__(self) -> AsyncClientMock:
+                session.created.append(service)
+                return AsyncClientMock(
+                    ssm_value="pooled",
+                    secret_string=json.dumps({"username": "pooled"}),
+                )
+
+            async def __aexit__(self, *args: object) -> None:
+                session.closed.append(service)
+
+        return ClientContext()
+
+
+def test_aload_must_share_pooled_aiobotocore_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    aiobotocore = types.ModuleType("aiobotocore")
+    aiobotocore_session = types.ModuleType("aiobotocore.session")
+    aiobotocore_session.AioSession = FakeAioSession  # type: ignore[attr-defined]
+    aiobotocore_config = types.ModuleType("aiobotocore.config")
+    aiobotocore_config.AioConfig = dict  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "aiobotocore", aiobotocore)
+    monkeypatch.setitem(sys.modules, "aiobotocore.session", aiobotocore_session)
+    monkeypatch.setitem(sys.modules, "aiobotocore.config", aiobotocore_config)
+    FakeAioSession.created = []
+    FakeAioSession.closed = []
+    FakeAioSession.configs = []
+
+    class Settings(AWSBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            secrets_name="my/secret", aws_region="us-east-1", client_read_timeout=5
+        )
+
+        username: Annotated[str, Secrets()]
+        host: Annotated[str, SSM(name="/my/host")]
+
+    async def load_twice() -> tuple[AWSBaseSettings, int]:
+        await Settings.aload()
+        my_config = await Settings.aload()
+        pool_size = len(aio.get_client_pool())
+        await aio.close_client_pool()
+        return my_config, pool_size
+
+    my_config, pool_size = asyncio.run(load_twice())
+
+    assert my_config.username == "pooled"  # type: ignore[attr-defined]
+    assert my_config.host == "pooled"  # type: ignore[attr-defined]
+    assert pool_size == 2
+    assert sorted(FakeAioSession.created) == ["secretsmanager", "ssm"]
+    assert sorted(FakeAioSession.closed) == ["secretsmanager", "ssm"]
+    assert FakeAioSession.configs == [{"read_timeout": 5}, {"read_timeout": 5}]
+
+
+def test_aload_must_raise_aws_client_error_without_aiobotocore(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "aiobotocore.session", None)
+
+    class Settings(ParameterStoreBaseSettings):
+        host: Annotated[str, "/my/host"]
+
+    with pytest.raises(AWSClientError):
+        asyncio.run(Settings.aload())
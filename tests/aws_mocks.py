@@ -4,7 +4,7 @@ from pydantic_settings_aws import AWSSettingsConfigDict
 
 from .boto3_mocks import ClientErrorMock, ClientMock
 
-TARGET_SESSION = "pydantic_settings_aws.aws.boto3.Session"
+TARGET_SESSION = "boto3.Session"
 
 TARGET_CREATE_CLIENT_FROM_SETTINGS = (
     "pydantic_settings_aws.aws._create_client_from_settings"
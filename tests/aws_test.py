@@ -11,6 +11,7 @@ from pydantic_settings_aws.errors import (
     SecretContentError,
     SecretDecodeError,
     SecretNotFoundError,
+    SecretsManagerError,
 )
 
 from .aws_mocks import (
@@ -27,12 +28,20 @@ from .aws_mocks import (
     mock_unknown_secrets_client_error,
     mock_unknown_ssm_client_error,
 )
-from .boto3_mocks import BrokenSessionMock, SessionMock
+from .boto3_mocks import (
+    BrokenSessionMock,
+    ClientErrorMock,
+    ClientMock,
+    CountingSessionMock,
+    PathClientMock,
+    SecretsClientMock,
+    SessionMock,
+)
 
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_ssm)
 def test_get_ssm_content_must_return_parameter_content_if_annotated_with_parameter_name(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region", "aws_profile": "profile"}
     parameter_value = aws.get_ssm_content(settings, "field", "my/parameter/name")  # type: ignore[arg-type]
@@ -43,7 +52,7 @@ def test_get_ssm_content_must_return_parameter_content_if_annotated_with_paramet
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_ssm)
 def test_get_ssm_content_must_return_parameter_content_if_annotated_with_dict_args(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region", "aws_profile": "profile"}
     parameter_value = aws.get_ssm_content(settings, "field", {"ssm": "my/parameter/name"})  # type: ignore[arg-type]
@@ -54,7 +63,7 @@ def test_get_ssm_content_must_return_parameter_content_if_annotated_with_dict_ar
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_ssm)
 def test_get_ssm_content_must_use_client_if_present_in_metadata(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region", "aws_profile": "profile"}
     ssm_info: dict[str, object] = {"ssm": "my/parameter/name", "ssm_client": mock_ssm()}
@@ -66,7 +75,7 @@ def test_get_ssm_content_must_use_client_if_present_in_metadata(*args: object) -
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_ssm)
 def test_get_ssm_content_must_use_field_name_if_ssm_name_not_in_metadata(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region", "aws_profile": "profile"}
     parameter_value = aws.get_ssm_content(settings, "field", None)  # type: ignore[arg-type]
@@ -77,7 +86,7 @@ def test_get_ssm_content_must_use_field_name_if_ssm_name_not_in_metadata(*args:
 
 @mock.patch(TARGET_SESSION, SessionMock)
 def test_create_ssm_client(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region", "aws_profile": "profile"}
     client = aws._create_client_from_settings(settings, "ssm", "ssm_client")  # type: ignore[arg-type]
@@ -87,7 +96,7 @@ def test_create_ssm_client(*args: object) -> None:
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_create_client)
 def test_get_ssm_boto3_client_must_create_a_client_if_its_not_given(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {}
     client = aws._create_client_from_settings(settings, "ssm", "ssm_client")  # type: ignore[arg-type]
@@ -97,7 +106,7 @@ def test_get_ssm_boto3_client_must_create_a_client_if_its_not_given(*args: objec
 
 @mock.patch(TARGET_SESSION, SessionMock)
 def test_create_secrets_client(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region", "aws_profile": "profile"}
     client = aws._create_client_from_settings(settings, "secretsmanager", "secrets_client")  # type: ignore[arg-type]
@@ -107,7 +116,7 @@ def test_create_secrets_client(*args: object) -> None:
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_create_client)
 def test_get_secrets_boto3_client_must_create_a_client_if_its_not_given(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {}
     client = aws._create_client_from_settings(settings, "secretsmanager", "secrets_client")  # type: ignore[arg-type]
@@ -120,7 +129,7 @@ def test_get_secrets_boto3_client_must_create_a_client_if_its_not_given(*args: o
 def test_get_secrets_content_must_raise_value_error_if_secrets_content_is_none(
     *args: object,
 ) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {
         "secrets_name": "secrets/name",
@@ -134,7 +143,7 @@ def test_get_secrets_content_must_raise_value_error_if_secrets_content_is_none(
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_secrets_content_invalid_json)
 def test_should_not_obfuscate_json_error_in_case_of_invalid_secrets(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {
         "secrets_name": "secrets/name",
@@ -147,7 +156,7 @@ def test_should_not_obfuscate_json_error_in_case_of_invalid_secrets(*args: objec
 
 
 def test_get_secrets_content_must_get_binary_content_if_string_is_not_set(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     content = {
         "SecretBinary": json.dumps({"username": "admin"}).encode("utf-8")
     }
@@ -157,7 +166,7 @@ def test_get_secrets_content_must_get_binary_content_if_string_is_not_set(*args:
 
 
 def test_get_secrets_content_must_not_hide_decode_error_if_not_binary_in_secret_binary(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     content = {
         "SecretBinary": json.dumps({"username": "admin"})
     }
@@ -167,14 +176,14 @@ def test_get_secrets_content_must_not_hide_decode_error_if_not_binary_in_secret_
 
 
 def test_get_secrets_content_must_return_none_if_neither_string_nor_binary_are_present(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     secret_content = aws._get_secrets_content({})
 
     assert secret_content is None
 
 
 def test_get_secrets_content_must_return_none_if_binary_is_present_but_none(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     content = {
         "SecretBinary": None
     }
@@ -184,17 +193,17 @@ def test_get_secrets_content_must_return_none_if_binary_is_present_but_none(*arg
 
 
 def test_get_secrets_args_must_not_shadow_pydantic_validation_if_required_args_are_not_present(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {}
 
     with pytest.raises(AWSSettingsConfigError):
-        aws._get_secrets_args(settings)  # type: ignore[arg-type]
+        aws.get_secrets_args(settings)  # type: ignore[arg-type]
 
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_ssm)
 def test_get_ssm_content_with_ssm_descriptor_name(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region"}
     value = aws.get_ssm_content(settings, "field", SSM(name="my/parameter/name"))  # type: ignore[arg-type]
@@ -205,7 +214,7 @@ def test_get_ssm_content_with_ssm_descriptor_name(*args: object) -> None:
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_ssm)
 def test_get_ssm_content_with_ssm_descriptor_no_name_uses_field_name(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region"}
     value = aws.get_ssm_content(settings, "field", SSM())  # type: ignore[arg-type]
@@ -216,7 +225,7 @@ def test_get_ssm_content_with_ssm_descriptor_no_name_uses_field_name(*args: obje
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_secret_not_found)
 def test_get_secrets_content_must_raise_secret_not_found_error(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {
         "secrets_name": "secrets/name",
@@ -229,7 +238,7 @@ def test_get_secrets_content_must_raise_secret_not_found_error(*args: object) ->
 
 @mock.patch(TARGET_CREATE_CLIENT_FROM_SETTINGS, mock_parameter_not_found)
 def test_get_ssm_content_must_raise_parameter_not_found_error(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region"}
 
@@ -239,7 +248,7 @@ def test_get_ssm_content_must_raise_parameter_not_found_error(*args: object) ->
 
 @mock.patch(TARGET_SESSION, BrokenSessionMock)
 def test_create_boto3_client_must_raise_aws_client_error_on_failure(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region"}
 
@@ -251,7 +260,7 @@ def test_create_boto3_client_must_raise_aws_client_error_on_failure(*args: objec
 def test_get_ssm_content_must_reraise_unknown_client_errors(*args: object) -> None:
     from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region"}
 
@@ -263,7 +272,7 @@ def test_get_ssm_content_must_reraise_unknown_client_errors(*args: object) -> No
 def test_get_secrets_content_must_reraise_unknown_client_errors(*args: object) -> None:
     from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 
-    aws._client_cache = {}
+    aws.client_pool.clear()
     settings = BaseSettingsMock()
     settings.model_config = {
         "secrets_name": "secrets/name",
@@ -276,7 +285,7 @@ def test_get_secrets_content_must_reraise_unknown_client_errors(*args: object) -
 
 @mock.patch(TARGET_SESSION, mock_ssm)
 def test_must_cache_boto3_clients_for_the_same_service_region_and_account(*args: object) -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
 
     settings = BaseSettingsMock()
     settings.model_config = {"aws_region": "region", "aws_profile": "profile"}
@@ -284,4 +293,184 @@ def test_must_cache_boto3_clients_for_the_same_service_region_and_account(*args:
     aws._create_client_from_settings(settings, "secretsmanager", "secrets_client")  # type: ignore[arg-type]
     aws._create_client_from_settings(settings, "ssm", "ssm_client")  # type: ignore[arg-type]
 
-    assert len(aws._client_cache) == 2
+    assert len(aws.client_pool) == 2
+
+
+def test_get_ssm_contents_must_batch_names_in_chunks_of_ten(*args: object) -> None:
+    client = ClientMock(ssm_value="value")
+    names = [f"/my/parameter/{i}" for i in range(25)]
+
+    values = aws.get_ssm_contents(BaseSettingsMock, client, names)
+
+    assert [len(call) for call in client.get_parameters_calls] == [10, 10, 5]
+    assert values == {name: "value" for name in names}
+
+
+def test_get_ssm_contents_must_request_duplicated_names_once(*args: object) -> None:
+    client = ClientMock(ssm_value="value")
+
+    values = aws.get_ssm_contents(BaseSettingsMock, client, ["/my/parameter", "/my/parameter"])
+
+    assert client.get_parameters_calls == [["/my/parameter"]]
+    assert values == {"/my/parameter": "value"}
+
+
+def test_get_ssm_contents_must_raise_parameter_not_found_for_invalid_parameters(*args: object) -> None:
+    client = ClientMock(ssm_value="value", invalid_parameters=["/my/missing"])
+
+    with pytest.raises(ParameterNotFoundError, match="/my/missing"):
+        aws.get_ssm_contents(BaseSettingsMock, client, ["/my/parameter", "/my/missing"])
+
+
+def test_get_ssm_contents_must_reraise_unknown_client_errors(*args: object) -> None:
+    from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+
+    with pytest.raises(ClientError):
+        aws.get_ssm_contents(BaseSettingsMock, ClientErrorMock("ThrottlingException"), ["/my/parameter"])
+
+
+def test_get_ssm_path_contents_must_follow_next_token(*args: object) -> None:
+    parameters = {f"/my/path/{i:02}": str(i) for i in range(25)}
+    client = PathClientMock(parameters)
+
+    values = aws.get_ssm_path_contents(BaseSettingsMock, client, "/my/path", recursive=True)
+
+    assert values == parameters
+    assert [call["NextToken"] for call in client.get_parameters_by_path_calls] == [None, "10", "20"]
+
+
+def test_get_batch_secrets_contents_must_request_ids_in_chunks_of_twenty(*args: object) -> None:
+    secrets = {f"my/secret/{i}": json.dumps({"id": i}) for i in range(45)}
+    client = SecretsClientMock(secrets)
+
+    contents = aws.get_batch_secrets_contents(BaseSettingsMock, list(secrets), client)  # type: ignore[arg-type]
+
+    assert [len(call["SecretIdList"]) for call in client.batch_get_secret_value_calls] == [20, 20, 5]
+    assert contents == {name: {"id": i} for i, name in enumerate(secrets)}
+
+
+def test_get_batch_secrets_contents_must_follow_next_token(*args: object) -> None:
+    secrets = {f"my/secret/{i}": json.dumps({"id": i}) for i in range(5)}
+    client = SecretsClientMock(secrets, page_size=2)
+
+    contents = aws.get_batch_secrets_contents(BaseSettingsMock, list(secrets), client)  # type: ignore[arg-type]
+
+    assert [call["NextToken"] for call in client.batch_get_secret_value_calls] == [None, "2", "4"]
+    assert len(contents) == 5
+
+
+def test_get_secrets_content_must_keep_only_the_requested_keys(*args: object) -> None:
+    client = ClientMock(
+        secret_bytes=json.dumps({"username": "admin", "password": "secret"}).encode()
+    )
+    settings = BaseSettingsMock()
+    settings.model_config = {"secrets_name": "my/secret", "value_cache_ttl": 60}
+    aws.value_cache.clear()
+
+    username = aws.get_secrets_content(settings, client, keys=["username"])  # type: ignore[arg-type]
+    content = aws.get_secrets_content(settings, client)  # type: ignore[arg-type]
+
+    # contents decoded with other keys are cached apart
+    assert username == {"username": "admin"}
+    assert content == {"username": "admin", "password": "secret"}
+    assert client.get_secret_value_calls == 2
+
+
+def test_get_secrets_content_must_raise_content_error_if_secret_binary_is_not_utf8(*args: object) -> None:
+    client = ClientMock(secret_bytes=b'{"username": "\xff"}')
+    settings = BaseSettingsMock()
+    settings.model_config = {"secrets_name": "my/secret"}
+
+    with pytest.raises(SecretContentError, match="UTF-8"):
+        aws.get_secrets_content(settings, client)  # type: ignore[arg-type]
+
+
+def test_get_batch_secrets_contents_must_keep_only_the_requested_keys(*args: object) -> None:
+    client = SecretsClientMock(
+        {"my/secret": json.dumps({"id": 1, "key": "a"}), "my/other": json.dumps({"id": 2})}
+    )
+
+    contents = aws.get_batch_secrets_contents(
+        BaseSettingsMock, ["my/secret", "my/other"], client, keys={"my/secret": ["key"]}  # type: ignore[arg-type]
+    )
+
+    assert contents == {"my/secret": {"key": "a"}, "my/other": {"id": 2}}
+
+
+def test_get_batch_secrets_contents_must_map_errors_to_each_secret(*args: object) -> None:
+    client = SecretsClientMock(
+        {"my/secret": "{}", "my/invalid": "not json", "my/denied": "{}"},
+        errors={"my/denied": "AccessDeniedException"},
+    )
+
+    with pytest.raises(SecretNotFoundError, match="my/missing"):
+        aws.get_batch_secrets_contents(BaseSettingsMock, ["my/secret", "my/missing"], client)  # type: ignore[arg-type]
+
+    with pytest.raises(SecretDecodeError, match="my/invalid"):
+        aws.get_batch_secrets_contents(BaseSettingsMock, ["my/secret", "my/invalid"], client)  # type: ignore[arg-type]
+
+    with pytest.raises(SecretsManagerError, match="my/denied.*AccessDeniedException"):
+        aws.get_batch_secrets_contents(BaseSettingsMock, ["my/denied"], client)  # type: ignore[arg-type]
+
+
+@mock.patch(TARGET_SESSION, CountingSessionMock)
+def test_clients_of_every_service_must_share_the_boto3_session(*args: object) -> None:
+    aws.client_pool.clear()
+    CountingSessionMock.sessions = []
+    settings = BaseSettingsMock()
+    settings.model_config = {"aws_region": "us-east-1"}
+
+    aws._create_client_from_settings(settings, "ssm", "ssm_client")  # type: ignore[arg-type]
+    aws._create_client_from_settings(settings, "secretsmanager", "secrets_client")  # type: ignore[arg-type]
+
+    assert len(CountingSessionMock.sessions) == 1
+    assert [name for name, _ in CountingSessionMock.sessions[0].clients] == ["ssm", "secretsmanager"]
+
+
+@mock.patch(TARGET_SESSION, CountingSessionMock)
+def test_clients_must_be_created_with_the_client_options(*args: object) -> None:
+    aws.client_pool.clear()
+    CountingSessionMock.sessions = []
+    settings = BaseSettingsMock()
+    settings.model_config = {
+        "aws_region": "us-east-1",
+        "client_max_pool_connections": 50,
+        "client_connect_timeout": 1,
+        "client_read_timeout": 2,
+        "client_retry_mode": "adaptive",
+        "client_max_attempts": 5,
+    }
+
+    aws._create_client_from_settings(settings, "ssm", "ssm_client")  # type: ignore[arg-type]
+
+    _, config = CountingSessionMock.sessions[0].clients[0]
+    assert config.max_pool_connections == 50
+    assert config.connect_timeout == 1
+    assert config.read_timeout == 2
+    assert config.retries == {"mode": "adaptive", "max_attempts": 5}
+
+
+def test_clients_with_different_client_options_must_not_share_a_pool_key() -> None:
+    session_args = aws.get_session_args(BaseSettingsMock)  # type: ignore[arg-type]
+
+    assert aws.get_client_key(session_args, "ssm") != aws.get_client_key(
+        session_args, "ssm", {"read_timeout": 2}
+    )
+
+
+def test_injected_clients_must_keep_their_key_while_alive() -> None:
+    client = ClientMock()
+
+    assert aws.get_injected_client_key(client) == aws.get_injected_client_key(client)
+    assert aws.get_injected_client_key(client) != aws.get_injected_client_key(
+        ClientMock()
+    )
+
+
+def test_injected_client_keys_must_not_be_reused_after_garbage_collection() -> None:
+    keys = set()
+    for _ in range(100):
+        # the clients are collected right away, so their ids are reused
+        keys.add(aws.get_injected_client_key(ClientMock()))
+
+    assert len(keys) == 100
@@ -1,5 +1,9 @@
+import asyncio
 import datetime
-from typing import Any
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 
@@ -12,16 +16,51 @@ class SessionMock:
         return self
 
 
+class CountingSessionMock:
+    """Mock boto3 Session that records the sessions and clients created."""
+
+    sessions: ClassVar[list["CountingSessionMock"]] = []
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.clients: list[tuple[str, Any]] = []
+        self.sessions.append(self)
+
+    def client(self, name: str, config: Any = None) -> object:
+        self.clients.append((name, config))
+        return object()
+
+
+class RegionSessionMock:
+    """Mock boto3 Session returning the client of its region from ``clients``."""
+
+    clients: ClassVar[dict[str, Any]] = {}
+
+    def __init__(self, *args: Any, region_name: str | None = None, **kwargs: Any) -> None:
+        self.region_name = region_name
+
+    def client(self, name: str, config: Any = None) -> Any:
+        return self.clients[self.region_name or ""]
+
+
 class ClientMock:
     def __init__(
         self,
         secret_string: str | None = None,
         secret_bytes: bytes | None = None,
         ssm_value: str | None = None,
+        invalid_parameters: list[str] | None = None,
+        ssm_version: int | None = None,
+        secret_version_id: str = "string",
     ) -> None:
         self.secret_string = secret_string
         self.secret_bytes = secret_bytes
         self.ssm_value = ssm_value
+        self.ssm_version = ssm_version
+        self.secret_version_id = secret_version_id
+        self.invalid_parameters = invalid_parameters or []
+        self.get_parameter_calls: list[str | None] = []
+        self.get_parameters_calls: list[list[str]] = []
+        self.get_secret_value_calls = 0
 
     def client(self, *args: Any) -> "ClientMock":
         return self
@@ -29,18 +68,35 @@ class ClientMock:
     def get_parameter(
         self, Name: str | None = None, WithDecryption: bool | None = None
     ) -> dict[str, Any]:
+        self.get_parameter_calls.append(Name)
         return {"Parameter": {"Value": self.ssm_value}}
 
+    def get_parameters(
+        self, Names: list[str], WithDecryption: bool | None = None
+    ) -> dict[str, Any]:
+        self.get_parameters_calls.append(Names)
+        return {
+            "Parameters": [
+                {"Name": name, "Value": self.ssm_value, "Version": self.ssm_version}
+                for name in Names
+                if name not in self.invalid_parameters
+            ],
+            "InvalidParameters": [
+                name for name in Names if name in self.invalid_parameters
+            ],
+        }
+
     def get_secret_value(
         self,
         SecretId: str | None = None,
         VersionId: str | None = None,
         VersionStage: str | None = None,
     ) -> dict[str, Any]:
+        self.get_secret_value_calls += 1
         return {
             "ARN": "string",
             "Name": "string",
-            "VersionId": "string",
+            "VersionId": self.secret_version_id,
             "SecretBinary": self.secret_bytes,
             "SecretString": self.secret_string,
             "VersionStages": [
@@ -65,6 +121,12 @@ class ClientErrorMock:
             "GetParameter",
         )
 
+    def get_parameters(self, **kwargs: Any) -> None:
+        raise ClientError(
+            {"Error": {"Code": self.error_code, "Message": "mocked error"}},
+            "GetParameters",
+        )
+
     def get_secret_value(self, **kwargs: Any) -> None:
         raise ClientError(
             {"Error": {"Code": self.error_code, "Message": "mocked error"}},
@@ -80,3 +142,281 @@ class BrokenSessionMock:
 
     def client(self, name: str) -> None:
         raise Exception("cannot create client")
+
+
+class BarrierClientMock(ClientMock):
+    """Mock boto3 client whose calls only return once ``barrier`` is full.
+
+    Used to prove that fetches run concurrently: sequential calls would time out.
+    """
+
+    def __init__(self, barrier: threading.Barrier, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.barrier = barrier
+
+    def get_parameters(self, Names: list[str], WithDecryption: bool | None = None) -> dict[str, Any]:
+        self.barrier.wait(timeout=5)
+        return super().get_parameters(Names, WithDecryption)
+
+    def get_secret_value(self, **kwargs: Any) -> dict[str, Any]:
+        self.barrier.wait(timeout=5)
+        return super().get_secret_value(**kwargs)
+
+
+class WaitingClientMock(ClientMock):
+    """Mock boto3 client whose calls only return once ``ready()`` is true.
+
+    Calls are counted under a lock, so that concurrent calls are all counted.
+    An ``error_code`` makes the calls raise a ClientError instead.
+    """
+
+    def __init__(
+        self,
+        ready: Callable[[], bool],
+        error_code: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.ready = ready
+        self.error_code = error_code
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_parameters(self, Names: list[str], WithDecryption: bool | None = None) -> dict[str, Any]:
+        self._wait("GetParameters")
+        return super().get_parameters(Names, WithDecryption)
+
+    def get_secret_value(self, **kwargs: Any) -> dict[str, Any]:
+        self._wait("GetSecretValue")
+        return super().get_secret_value(**kwargs)
+
+    def _wait(self, operation: str) -> None:
+        with self._lock:
+            self.calls += 1
+
+        deadline = time.monotonic() + 5
+        while not self.ready() and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        if self.error_code:
+            raise ClientError(
+                {"Error": {"Code": self.error_code, "Message": "mocked error"}},
+                operation,
+            )
+
+
+class PathClientMock(ClientMock):
+    """Mock boto3 client that pages ``parameters`` through GetParametersByPath."""
+
+    def __init__(self, parameters: dict[str, str], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.parameters = parameters
+        self.get_parameters_by_path_calls: list[dict[str, Any]] = []
+
+    def get_parameters_by_path(
+        self,
+        Path: str,
+        Recursive: bool = False,
+        WithDecryption: bool | None = None,
+        MaxResults: int = 10,
+        NextToken: str | None = None,
+    ) -> dict[str, Any]:
+        self.get_parameters_by_path_calls.append(
+            {"Path": Path, "Recursive": Recursive, "NextToken": NextToken}
+        )
+        prefix = Path.rstrip("/") + "/"
+        names = [
+            name
+            for name in self.parameters
+            if name.startswith(prefix)
+            and (Recursive or "/" not in name[len(prefix) :])
+        ]
+
+        start = int(NextToken or 0)
+        page = names[start : start + MaxResults]
+        response: dict[str, Any] = {
+            "Parameters": [
+                {"Name": name, "Value": self.parameters[name]} for name in page
+            ]
+        }
+        if start + MaxResults < len(names):
+            response["NextToken"] = str(start + MaxResults)
+
+        return response
+
+
+class SecretsClientMock(ClientMock):
+    """Mock boto3 client serving ``secrets`` by name, paging BatchGetSecretValue.
+
+    Secrets in ``errors`` are reported with that error code instead.
+    """
+
+    def __init__(
+        self,
+        secrets: dict[str, str],
+        page_size: int = 20,
+        errors: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.secrets = secrets
+        self.page_size = page_size
+        self.errors = errors or {}
+        self.batch_get_secret_value_calls: list[dict[str, Any]] = []
+
+    def get_secret_value(
+        self,
+        SecretId: str | None = None,
+        VersionId: str | None = None,
+        VersionStage: str | None = None,
+    ) -> dict[str, Any]:
+        self.get_secret_value_calls += 1
+        if SecretId not in self.secrets:
+            raise ClientError(
+                {"Error": {"Code": "ResourceNotFoundException", "Message": "mocked"}},
+                "GetSecretValue",
+            )
+
+        return self._get_secret(SecretId)
+
+    def batch_get_secret_value(
+        self, SecretIdList: list[str], NextToken: str | None = None
+    ) -> dict[str, Any]:
+        self.batch_get_secret_value_calls.append(
+            {"SecretIdList": SecretIdList, "NextToken": NextToken}
+        )
+        assert len(SecretIdList) <= 20
+
+        start = int(NextToken or 0)
+        page = SecretIdList[start : start + self.page_size]
+        response: dict[str, Any] = {
+            "SecretValues": [
+                self._get_secret(name)
+                for name in page
+                if name in self.secrets and name not in self.errors
+            ],
+            "Errors": [
+                {
+                    "SecretId": name,
+                    "ErrorCode": self.errors.get(name, "ResourceNotFoundException"),
+                    "Message": "mocked error",
+                }
+                for name in page
+                if name not in self.secrets or name in self.errors
+            ],
+        }
+        if start + self.page_size < len(SecretIdList):
+            response["NextToken"] = str(start + self.page_size)
+
+        return response
+
+    def _get_secret(self, name: str) -> dict[str, Any]:
+        return {
+            "ARN": f"arn:aws:secretsmanager:us-east-1:123456789012:secret:{name}",
+            "Name": name,
+            "VersionId": self.secret_version_id,
+            "SecretString": self.secrets[name],
+        }
+
+
+class DelayedClientErrorMock(ClientErrorMock):
+    """Mock boto3 client that raises a ClientError after ``delay`` seconds."""
+
+    def __init__(self, error_code: str, delay: float = 0) -> None:
+        super().__init__(error_code)
+        self.delay = delay
+
+    def get_parameters(self, **kwargs: Any) -> None:
+        time.sleep(self.delay)
+        super().get_parameters(**kwargs)
+
+    def get_secret_value(self, **kwargs: Any) -> None:
+        time.sleep(self.delay)
+        super().get_secret_value(**kwargs)
+
+
+class InFlightTracker:
+    """Counts how many mocked async calls run at the same time."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+class AsyncClientMock:
+    """Mock aiobotocore client, answering like :class:`ClientMock` after ``delay`` seconds."""
+
+    def __init__(
+        self,
+        delay: float = 0,
+        error_code: str | None = None,
+        tracker: InFlightTracker | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.sync_client = ClientMock(**kwargs)
+        self.delay = delay
+        self.error_code = error_code
+        self.tracker = tracker or InFlightTracker()
+
+    async def get_parameters(self, **kwargs: Any) -> dict[str, Any]:
+        return await self._call(self.sync_client.get_parameters, "GetParameters", **kwargs)
+
+    async def get_secret_value(self, **kwargs: Any) -> dict[str, Any]:
+        return await self._call(self.sync_client.get_secret_value, "GetSecretValue", **kwargs)
+
+    async def _call(self, method: Any, operation: str, **kwargs: Any) -> dict[str, Any]:
+        self.tracker.in_flight += 1
+        self.tracker.max_in_flight = max(self.tracker.max_in_flight, self.tracker.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.tracker.in_flight -= 1
+
+        if self.error_code:
+            raise ClientError(
+                {"Error": {"Code": self.error_code, "Message": "mocked error"}},
+                operation,
+            )
+
+        return method(**kwargs)  # type: ignore[no-any-return]
+
+
+class SQSClientMock:
+    """Mock boto3 SQS client backed by an in-memory queue.
+
+    Received messages stay in the queue until they are deleted, like
+    messages whose visibility timeout expires.
+    """
+
+    def __init__(self) -> None:
+        self.messages: dict[str, str] = {}
+        self.receive_calls = 0
+        self.failing_deletes: set[str] = set()
+        self._next_id = 0
+
+    def send(self, body: str) -> None:
+        self._next_id += 1
+        self.messages[f"receipt-{self._next_id}"] = body
+
+    def receive_message(
+        self, QueueUrl: str, MaxNumberOfMessages: int = 1, WaitTimeSeconds: int = 0
+    ) -> dict[str, Any]:
+        self.receive_calls += 1
+        received = list(self.messages.items())[:MaxNumberOfMessages]
+        return {
+            "Messages": [
+                {"ReceiptHandle": receipt, "Body": body} for receipt, body in received
+            ]
+        }
+
+    def delete_message_batch(
+        self, QueueUrl: str, Entries: list[dict[str, str]]
+    ) -> dict[str, Any]:
+        successful, failed = [], []
+        for entry in Entries:
+            if entry["ReceiptHandle"] in self.failing_deletes:
+                failed.append({"Id": entry["Id"], "Code": "ReceiptHandleIsInvalid"})
+            else:
+                self.messages.pop(entry["ReceiptHandle"], None)
+                successful.append({"Id": entry["Id"]})
+        return {"Successful": successful, "Failed": failed}
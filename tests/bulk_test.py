@@ -0,0 +1,109 @@
+import json
+import threading
+from typing import Annotated
+
+from pydantic_settings_aws import (
+    SSM,
+    AWSBaseSettings,
+    SecretNotFoundError,
+    Secrets,
+    load_many,
+)
+from pydantic_settings_aws.bulk import get_overridden_cls
+
+from .boto3_mocks import BarrierClientMock, ClientMock, SecretsClientMock
+from .settings_mocks import make_settings
+
+TENANTS = ["acme", "globex", "initech", "umbrella", "hooli"]
+
+
+class TenantSettings(AWSBaseSettings):
+    host: Annotated[str, SSM(name="/db/host")]
+    port: Annotated[int, SSM(name="/db/port")]
+    password: Annotated[str, Secrets()]
+
+
+def tenant_overrides(tenant: str) -> dict[str, str]:
+    return {"secrets_name": f"{tenant}/db", "ssm_prefix": f"/tenants/{tenant}"}
+
+
+def test_load_many_must_batch_parameters_across_tenants() -> None:
+    client = SecretsClientMock(
+        {f"{tenant}/db": json.dumps({"password": tenant}) for tenant in TENANTS},
+        ssm_value="5432",
+    )
+    settings_cls = make_settings(
+        TenantSettings, ssm_client=client, secrets_client=client
+    )
+
+    results = list(load_many(settings_cls, map(tenant_overrides, TENANTS)))
+
+    assert [r.settings.password for r in results if r.settings] == TENANTS
+    assert all(isinstance(r.settings, settings_cls) for r in results)
+    assert [len(names) for names in client.get_parameters_calls] == [10]
+    assert client.get_parameters_calls[0][:2] == ["/tenants/acme/db/host", "/tenants/acme/db/port"]
+    assert client.get_secret_value_calls == len(TENANTS)
+
+
+def test_load_many_must_yield_errors_per_tenant() -> None:
+    client = SecretsClientMock({"acme/db": json.dumps({"password": "acme"})}, ssm_value="5432")
+
+    settings_cls = make_settings(
+        TenantSettings, ssm_client=client, secrets_client=client
+    )
+
+    results = list(load_many(settings_cls, map(tenant_overrides, ["acme", "globex"])))
+
+    assert results[0].settings is not None and results[0].error is None
+    assert results[1].settings is None
+    assert isinstance(results[1].error, SecretNotFoundError)
+    assert results[1].overrides == tenant_overrides("globex")
+
+
+def test_load_many_must_fetch_secrets_concurrently() -> None:
+    # sequential fetches would wait for the barrier until it times out
+    secrets_client = BarrierClientMock(
+        threading.Barrier(3), secret_string=json.dumps({"password": "pwd"})
+    )
+    settings_cls = make_settings(
+        TenantSettings,
+        ssm_client=ClientMock(ssm_value="5432"),
+        secrets_client=secrets_client,
+    )
+
+    results = list(load_many(settings_cls, map(tenant_overrides, TENANTS[:3])))
+
+    assert [r.error for r in results] == [None, None, None]
+    assert secrets_client.get_secret_value_calls == 3
+
+
+def test_load_many_must_plan_overrides_by_chunk() -> None:
+    client = SecretsClientMock(
+        {f"{tenant}/db": json.dumps({"password": tenant}) for tenant in TENANTS},
+        ssm_value="5432",
+    )
+    settings_cls = make_settings(
+        TenantSettings, ssm_client=client, secrets_client=client
+    )
+    results = load_many(settings_cls, map(tenant_overrides, TENANTS), chunk_size=2)
+
+    next(results)
+
+    assert [len(names) for names in client.get_parameters_calls] == [4]
+
+    assert len(list(results)) == 4
+    assert [len(names) for names in client.get_parameters_calls] == [4, 4, 2]
+
+
+def test_overridden_classes_must_not_share_snapshot_names() -> None:
+    client = object()
+    settings_cls = make_settings(
+        TenantSettings, ssm_client=client, secrets_client=client
+    )
+
+    acme = get_overridden_cls(settings_cls, tenant_overrides("acme"))
+    globex = get_overridden_cls(settings_cls, tenant_overrides("globex"))
+
+    assert acme.__name__ == globex.__name__ == settings_cls.__name__
+    assert acme.__qualname__ != globex.__qualname__
+    assert acme.model_config["secrets_name"] == "acme/db"
@@ -0,0 +1,125 @@
+import threading
+
+from pydantic_settings_aws import ValueCache
+from pydantic_settings_aws.cache import ValueCacheKey
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_value_cache_must_return_fresh_entries() -> None:
+    cache = ValueCache(clock=FakeClock())
+    key = ValueCacheKey("ssm", "default", "/my/parameter")
+    cache.set(key, "value", ttl=10)
+
+    assert cache.get(key) == (True, "value")
+
+
+def test_value_cache_must_miss_unknown_entries() -> None:
+    cache = ValueCache()
+
+    assert cache.get(ValueCacheKey("ssm", "default", "/my/parameter")) == (False, None)
+
+
+def test_value_cache_must_expire_entries_after_ttl() -> None:
+    clock = FakeClock()
+    cache = ValueCache(clock=clock)
+    key = ValueCacheKey("ssm", "default", "/my/parameter")
+    cache.set(key, "value", ttl=10)
+
+    clock.now = 10
+
+    assert cache.get(key) == (False, None)
+    assert len(cache) == 0
+
+
+def test_value_cache_must_evict_least_recently_used_entry() -> None:
+    cache = ValueCache(max_entries=2)
+    first = ValueCacheKey("ssm", "default", "/first")
+    second = ValueCacheKey("ssm", "default", "/second")
+    third = ValueCacheKey("ssm", "default", "/third")
+
+    cache.set(first, "1", ttl=10)
+    cache.set(second, "2", ttl=10)
+    cache.get(first)
+    cache.set(third, "3", ttl=10)
+
+    assert cache.get(first) == (True, "1")
+    assert cache.get(second) == (False, None)
+    assert cache.get(third) == (True, "3")
+
+
+def test_value_cache_must_evict_when_max_entries_shrinks() -> None:
+    cache = ValueCache()
+    for i in range(5):
+        cache.set(ValueCacheKey("ssm", "default", f"/{i}"), i, ttl=10)
+
+    cache.max_entries = 2
+
+    assert len(cache) == 2
+    assert cache.get(ValueCacheKey("ssm", "default", "/4")) == (True, 4)
+
+
+def test_value_cache_invalidate_must_remove_every_session_and_version() -> None:
+    cache = ValueCache()
+    cache.set(ValueCacheKey("secretsmanager", "default", "my/secret"), {}, ttl=10)
+    cache.set(ValueCacheKey("secretsmanager", "prod", "my/secret", "AWSPREVIOUS"), {}, ttl=10)
+    cache.set(ValueCacheKey("ssm", "default", "my/secret"), "value", ttl=10)
+    cache.set(ValueCacheKey("ssm", "default", "/other"), "value", ttl=10)
+
+    removed = cache.invalidate(name="my/secret", service="secretsmanager")
+
+    assert removed == 2
+    assert len(cache) == 2
+    assert cache.invalidate(name="my/secret") == 1
+
+
+def test_value_cache_invalidate_matching_must_remove_the_matching_keys() -> None:
+    cache = ValueCache()
+    cache.set(ValueCacheKey("ssm", "default", "/app/db/host"), "value", ttl=10)
+    cache.set(ValueCacheKey("ssm", "default", "/app/db/*"), {}, ttl=10)
+    cache.set(ValueCacheKey("ssm", "default", "/other"), "value", ttl=10)
+
+    removed = cache.invalidate_matching(lambda key: key.name.startswith("/app/db/"))
+
+    assert removed == 2
+    assert cache.get(ValueCacheKey("ssm", "default", "/other")) == (True, "value")
+
+
+def test_value_cache_clear_must_remove_every_entry() -> None:
+    cache = ValueCache()
+    cache.set(ValueCacheKey("ssm", "default", "/my/parameter"), "value", ttl=10)
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_value_cache_concurrent_access() -> None:
+    cache = ValueCache(max_entries=10)
+    errors: list[Exception] = []
+
+    def use_cache(i: int) -> None:
+        try:
+            for j in range(100):
+                key = ValueCacheKey("ssm", "default", f"/{(i + j) % 20}")
+                cache.set(key, j, ttl=10)
+                cache.get(key)
+                cache.invalidate(name=f"/{j % 20}")
+        # any error is reported by the main thread
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=use_cache, args=(i,)) for i in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert len(cache) <= 10
@@ -0,0 +1,138 @@
+import threading
+from unittest import mock
+
+from pydantic_settings_aws import ClientPool, aws
+from pydantic_settings_aws.clients import ClientPoolStats
+
+from .aws_mocks import TARGET_SESSION, BaseSettingsMock
+from .boto3_mocks import SessionMock
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ClosableClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_client_pool_must_reuse_clients_and_count_lookups() -> None:
+    pool = ClientPool()
+
+    first = pool.get_or_create("ssm_default", object)
+    second = pool.get_or_create("ssm_default", object)
+
+    assert first is second
+    assert pool.stats() == ClientPoolStats(hits=1, misses=1, evictions=0)
+
+
+def test_client_pool_must_not_block_other_keys_while_creating_a_client() -> None:
+    pool = ClientPool()
+    creating = threading.Event()
+    release = threading.Event()
+
+    def slow_factory() -> object:
+        creating.set()
+        release.wait(5)
+        return object()
+
+    thread = threading.Thread(
+        target=pool.get_or_create, args=("ssm_slow", slow_factory)
+    )
+    thread.start()
+    creating.wait(5)
+
+    client = pool.get_or_create("ssm_fast", object)
+    release.set()
+    thread.join(5)
+
+    assert client is pool.peek("ssm_fast")
+    assert pool.stats() == ClientPoolStats(hits=0, misses=2, evictions=0)
+
+
+def test_client_pool_must_create_a_single_client_per_key() -> None:
+    pool = ClientPool()
+    created = []
+
+    def factory() -> object:
+        created.append(object())
+        return created[-1]
+
+    threads = [
+        threading.Thread(target=pool.get_or_create, args=("ssm_default", factory))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(created) == 1
+    assert pool.stats() == ClientPoolStats(hits=7, misses=1, evictions=0)
+
+
+def test_client_pool_must_evict_the_least_recently_used_client() -> None:
+    pool = ClientPool(max_size=2)
+    ssm = pool.get_or_create("ssm", object)
+    pool.get_or_create("secretsmanager", object)
+    pool.get_or_create("ssm", object)
+
+    pool.get_or_create("sts", object)
+
+    assert pool.peek("secretsmanager") is None
+    assert pool.peek("ssm") is ssm
+    assert pool.stats().evictions == 1
+
+
+def test_client_pool_must_evict_idle_clients() -> None:
+    clock = FakeClock()
+    pool = ClientPool(idle_ttl=60, clock=clock)
+    first = pool.get_or_create("ssm", object)
+
+    clock.now = 60
+
+    assert pool.get_or_create("ssm", object) is not first
+    assert pool.stats() == ClientPoolStats(hits=0, misses=2, evictions=1)
+
+
+def test_client_pool_must_shrink_when_max_size_is_lowered() -> None:
+    pool = ClientPool()
+    for key in ("a", "b", "c"):
+        pool.get_or_create(key, object)
+
+    pool.max_size = 1
+
+    assert len(pool) == 1
+    assert pool.peek("c") is not None
+
+
+def test_client_pool_close_must_close_every_client() -> None:
+    pool = ClientPool()
+    client = pool.get_or_create("ssm", ClosableClient)
+    pool.get_or_create("other", object)
+
+    pool.close()
+
+    assert client.closed
+    assert len(pool) == 0
+
+
+@mock.patch(TARGET_SESSION, SessionMock)
+def test_clients_must_not_be_shared_across_session_tokens() -> None:
+    aws.client_pool.clear()
+    settings = BaseSettingsMock()
+    settings.model_config = {"aws_region": "us-east-1", "aws_session_token": "token-1"}
+    aws._create_client_from_settings(settings, "ssm", "ssm_client")  # type: ignore[arg-type]
+
+    settings.model_config = {"aws_region": "us-east-1", "aws_session_token": "token-2"}
+    aws._create_client_from_settings(settings, "ssm", "ssm_client")  # type: ignore[arg-type]
+
+    assert len(aws.client_pool) == 2
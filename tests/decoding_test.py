@@ -0,0 +1,77 @@
+import importlib.util
+import json
+
+import pytest
+
+from pydantic_settings_aws import decoding
+
+BACKENDS = [
+    pytest.param(
+        name,
+        marks=pytest.mark.skipif(
+            name != "json" and importlib.util.find_spec(name) is None,
+            reason=f"{name} is not installed",
+        ),
+    )
+    for name in decoding.JSON_BACKENDS
+]
+
+CONTENT = json.dumps({"username": "admin", "password": "secret", "port": 5432})
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_decode_json_object_must_keep_only_the_requested_keys(name: str) -> None:
+    backend = decoding.get_json_backend(name)  # type: ignore[arg-type]
+
+    content = decoding.decode_json_object(CONTENT, ["username", "port", "missing"], backend)
+
+    assert content == {"username": "admin", "port": 5432}
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_decode_json_object_must_decode_utf8_bytes(name: str) -> None:
+    backend = decoding.get_json_backend(name)  # type: ignore[arg-type]
+
+    content = decoding.decode_json_object('{"name": "café"}'.encode(), backend=backend)
+
+    assert content == {"name": "café"}
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+@pytest.mark.parametrize("document", ["{invalid", b'{"name": "\xff"}'])
+def test_decode_json_object_must_raise_value_error_for_invalid_documents(
+    name: str, document: str | bytes
+) -> None:
+    backend = decoding.get_json_backend(name)  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError):
+        decoding.decode_json_object(document, ["name"], backend)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_decode_json_object_must_read_what_the_standard_library_reads(
+    name: str,
+) -> None:
+    backend = decoding.get_json_backend(name)  # type: ignore[arg-type]
+
+    content = decoding.decode_json_object(
+        '{"ratio": NaN, "id": 123456789012345678901234567890}', backend=backend
+    )
+
+    assert content["ratio"] != content["ratio"]
+    assert content["id"] == 123456789012345678901234567890
+
+
+def test_decode_json_object_must_return_non_objects_whole() -> None:
+    assert decoding.decode_json_object("[1, 2]", ["name"]) == [1, 2]
+
+
+def test_get_json_backend_must_prefer_installed_fast_backends() -> None:
+    installed = [
+        name
+        for name in decoding.JSON_BACKENDS
+        if name == "json" or importlib.util.find_spec(name) is not None
+    ]
+
+    assert decoding.get_json_backend().name == installed[0]
+    assert decoding.get_json_backend("json").name == "json"
@@ -0,0 +1,72 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from typing_extensions import Self
+
+
+class ExtensionServer:
+    """Local stand-in for the AWS Parameters and Secrets Lambda Extension."""
+
+    def __init__(
+        self,
+        parameters: dict[str, str] | None = None,
+        secrets: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        self.parameters = parameters or {}
+        self.secrets = secrets or {}
+        self.requests: list[tuple[str, dict[str, str], str | None]] = []
+        self.connections: set[int] = set()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                server.requests.append(
+                    (url.path, query, self.headers.get("X-Aws-Parameters-Secrets-Token"))
+                )
+                server.connections.add(self.client_address[1])
+                status, body = server.respond(url.path, query)
+                content = json.dumps(body).encode()
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.endpoint = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        )
+
+    def respond(self, path: str, query: dict[str, str]) -> tuple[int, Any]:
+        if path == "/systemsmanager/parameters/get" and query["name"] in self.parameters:
+            name = query["name"]
+            return 200, {
+                "Parameter": {"Name": name, "Value": self.parameters[name], "Version": 1}
+            }
+
+        if path == "/secretsmanager/get" and query["secretId"] in self.secrets:
+            return 200, self.secrets[query["secretId"]]
+
+        return 400, {"message": "not found"}
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,162 @@
+import base64
+import json
+import socket
+from typing import Annotated, Any
+from unittest import mock
+
+import pytest
+
+from pydantic_settings_aws import (
+    AWSSettingsConfigDict,
+    LambdaExtensionClient,
+    ParameterNotFoundError,
+    ParameterStoreBaseSettings,
+    SecretsManagerBaseSettings,
+    aws,
+)
+
+from .aws_mocks import TARGET_SESSION, mock_ssm
+from .boto3_mocks import BrokenSessionMock, ClientMock, SecretsClientMock
+from .extension_mocks import ExtensionServer
+from .settings_mocks import make_parameter_settings
+
+HOST_AND_PORT_FIELDS = {
+    "host": Annotated[str, "/my/host"],
+    "port": Annotated[int, "/my/port"],
+}
+
+
+@pytest.fixture(autouse=True)
+def session_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "session-token")
+    aws.client_pool.close()
+
+
+def get_free_endpoint() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+@mock.patch(TARGET_SESSION, BrokenSessionMock)
+def test_parameters_must_be_read_through_the_extension() -> None:
+    with ExtensionServer(parameters={"/my/host": "localhost", "/my/port": "5432"}) as server:
+        settings_cls = make_parameter_settings(
+            HOST_AND_PORT_FIELDS,
+            aws_region="us-east-1",
+            transport="lambda_extension",
+            lambda_extension_endpoint=server.endpoint,
+        )
+
+        settings = settings_cls()
+        settings_cls()
+
+    assert settings.host == "localhost"  # type: ignore[attr-defined]
+    assert settings.port == 5432  # type: ignore[attr-defined]
+    assert [token for _, _, token in server.requests] == ["session-token"] * 4
+    assert server.requests[0][1] == {"name": "/my/host", "withDecryption": "true"}
+    assert len(server.connections) == 1
+
+
+@mock.patch(TARGET_SESSION, lambda **kwargs: ClientMock(ssm_value="5432"))
+def test_extension_misses_must_fall_back_to_boto3() -> None:
+    with ExtensionServer(parameters={"/my/host": "localhost"}) as server:
+        settings = make_parameter_settings(
+            HOST_AND_PORT_FIELDS,
+            aws_region="us-east-1",
+            transport="lambda_extension",
+            lambda_extension_endpoint=server.endpoint,
+        )()
+
+    assert settings.host == "localhost"  # type: ignore[attr-defined]
+    assert settings.port == 5432  # type: ignore[attr-defined]
+    assert server.requests[1][1]["name"] == "/my/port"
+
+
+@mock.patch(TARGET_SESSION, mock_ssm)
+def test_unreachable_extension_must_fall_back_to_boto3() -> None:
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            transport="lambda_extension",
+            lambda_extension_endpoint=get_free_endpoint(),
+        )
+
+        host: Annotated[str, "/my/host"]
+
+    assert Settings().host == "value"  # type: ignore[call-arg]
+
+
+def test_fallback_errors_must_be_the_boto3_ones() -> None:
+    fallback = ClientMock(invalid_parameters=["/missing"])
+
+    with ExtensionServer() as server:
+        client = LambdaExtensionClient("ssm", lambda: fallback, server.endpoint)
+        response = client.get_parameters(Names=["/missing"], WithDecryption=True)
+
+    assert response["InvalidParameters"] == ["/missing"]
+    with pytest.raises(ParameterNotFoundError):
+        aws.read_ssm_contents(
+            ParameterStoreBaseSettings, {"/missing": None}, {}, [response]
+        )
+
+
+def test_batch_secrets_misses_must_fall_back_to_boto3() -> None:
+    fallback = SecretsClientMock({"my/db": json.dumps({"password": "db"})}, page_size=1)
+    secrets = {"my/api": {"Name": "my/api", "SecretString": json.dumps({"key": "api"})}}
+
+    with ExtensionServer(secrets=secrets) as server:
+        client = LambdaExtensionClient("secretsmanager", lambda: fallback, server.endpoint)
+        response = client.batch_get_secret_value(SecretIdList=["my/api", "my/db", "my/missing"])
+
+    assert [secret["Name"] for secret in response["SecretValues"]] == ["my/api", "my/db"]
+    assert [error["SecretId"] for error in response["Errors"]] == ["my/missing"]
+    assert "NextToken" not in response
+    assert [call["SecretIdList"] for call in fallback.batch_get_secret_value_calls] == [
+        ["my/db", "my/missing"],
+        ["my/db", "my/missing"],
+    ]
+
+
+@mock.patch(TARGET_SESSION, BrokenSessionMock)
+def test_secrets_must_be_read_through_the_extension() -> None:
+    secret = {"username": "admin", "password": "secret"}
+    secrets = {
+        "my/secret": {
+            "Name": "my/secret",
+            "VersionId": "v1",
+            "SecretBinary": base64.b64encode(json.dumps(secret).encode()).decode(),
+        }
+    }
+
+    class Settings(SecretsManagerBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            secrets_name="my/secret",
+            secrets_stage="AWSCURRENT",
+            transport="lambda_extension",
+        )
+
+        username: str
+        password: str
+
+    with ExtensionServer(secrets=secrets) as server, mock.patch.dict(
+        "os.environ",
+        {"PARAMETERS_SECRETS_EXTENSION_HTTP_PORT": server.endpoint.rsplit(":", 1)[1]},
+    ):
+        settings = Settings()  # type: ignore[call-arg]
+
+    assert settings.password == "secret"
+    assert server.requests[0][1] == {"secretId": "my/secret", "versionStage": "AWSCURRENT"}
+
+
+def test_extension_client_must_reconnect_closed_connections() -> None:
+    fallback: Any = None
+
+    with ExtensionServer(parameters={"/my/host": "localhost"}) as server:
+        client = LambdaExtensionClient("ssm", lambda: fallback, server.endpoint)
+        client.get_parameter(Name="/my/host")
+        client._local.connection.sock.close()
+
+        assert client.get_parameter(Name="/my/host")["Parameter"]["Value"] == "localhost"
+
+    client.close()
+    assert len(server.connections) == 2
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+
+# modules boto3 pulls in, none of which the package import may need
+DEFERRED_MODULES = ("boto3", "botocore", "s3transfer", "urllib3", "aiobotocore")
+
+# the package, without pydantic-settings, may cost at most this fraction of
+# pydantic-settings' own import. It is about 0.3, and above 1 when boto3 is
+# imported eagerly
+MAX_IMPORT_COST_RATIO = 0.6
+
+
+def import_times() -> dict[str, int]:
+    """Return the cumulative import time of every module, in microseconds."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import pydantic_settings; import pydantic_settings_aws",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+
+    return times
+
+
+def test_import_must_not_import_boto3() -> None:
+    imported = [
+        module
+        for module in import_times()
+        if module.split(".")[0] in DEFERRED_MODULES
+    ]
+
+    assert imported == []
+
+
+def test_import_cost_must_not_regress() -> None:
+    # the fastest of a few runs, so that a slow run doesn't fail the test
+    ratio = min(
+        times["pydantic_settings_aws"] / times["pydantic_settings"]
+        for times in (import_times() for _ in range(3))
+    )
+
+    assert ratio < MAX_IMPORT_COST_RATIO
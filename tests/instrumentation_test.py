@@ -0,0 +1,197 @@
+import json
+import sys
+import types
+from collections.abc import Iterator
+from typing import Annotated, Any
+from unittest import mock
+
+import pytest
+
+from pydantic_settings_aws import (
+    AWSSettingsConfigDict,
+    OpenTelemetrySpanHook,
+    ParameterStoreBaseSettings,
+    SecretDecodeError,
+    Span,
+    SpanHook,
+    add_span_hook,
+    aws,
+    instrumentation,
+    remove_span_hook,
+    value_cache,
+)
+
+from .aws_mocks import TARGET_SESSION, mock_ssm
+from .boto3_mocks import ClientMock
+from .settings_mocks import make_secrets_settings
+
+
+@pytest.fixture
+def spans() -> Iterator[list[Span]]:
+    ended: list[Span] = []
+    hook = add_span_hook(ended.append)
+    yield ended
+    remove_span_hook(hook)
+
+
+def test_span_must_be_a_shared_noop_without_hooks() -> None:
+    first = instrumentation.span(instrumentation.GET_PARAMETER, name="/a")
+    second = instrumentation.span(instrumentation.GET_SECRET_VALUE, name="b")
+
+    assert first is second
+    with first as span:
+        span.set_attribute("cache_hit", True)
+
+
+def test_spans_must_cover_fetch_decode_and_build(spans: list[Span]) -> None:
+    content = json.dumps({"username": "admin"})
+    make_secrets_settings(
+        secrets_name="my/secret", secrets_client=ClientMock(secret_string=content)
+    )()  # type: ignore[call-arg]
+
+    assert [span.name for span in spans] == [
+        instrumentation.GET_SECRET_VALUE,
+        instrumentation.DECODE_SECRET,
+        instrumentation.BUILD_SETTINGS,
+    ]
+    assert spans[0].attributes == {"service": "secretsmanager", "name": "my/secret"}
+    assert spans[1].attributes["bytes"] == len(content)
+    assert spans[2].attributes == {"settings": "Settings"}
+    assert all(span.duration is not None and span.error is None for span in spans)
+
+
+def test_spans_must_record_cache_hits(spans: list[Span]) -> None:
+    value_cache.clear()
+    client = ClientMock(ssm_value="value")
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=client, value_cache_ttl=60)
+
+        host: Annotated[str, "/my/host"]
+        port: Annotated[str, "/my/port"]
+
+    Settings()
+    Settings()
+
+    get_parameters = [s for s in spans if s.name == instrumentation.GET_PARAMETERS]
+    assert [s.attributes for s in get_parameters] == [
+        {"service": "ssm", "count": 2, "cache_hits": 0, "requests": 1},
+        {"service": "ssm", "count": 2, "cache_hits": 2, "requests": 0},
+    ]
+
+
+@mock.patch(TARGET_SESSION, mock_ssm)
+def test_spans_must_cover_client_creation(spans: list[Span]) -> None:
+    aws.client_pool.clear()
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(aws_region="us-east-1")
+
+        host: Annotated[str, "/my/host"]
+
+    Settings()
+    Settings()
+
+    created = [s for s in spans if s.name == instrumentation.CREATE_CLIENT]
+    assert [s.attributes for s in created] == [{"service": "ssm"}]
+
+
+def test_spans_must_record_errors(spans: list[Span]) -> None:
+    settings_cls = make_secrets_settings(
+        secrets_name="my/secret", secrets_client=ClientMock(secret_string="{invalid")
+    )
+
+    with pytest.raises(SecretDecodeError):
+        settings_cls()
+
+    decode = next(s for s in spans if s.name == instrumentation.DECODE_SECRET)
+    assert isinstance(decode.error, SecretDecodeError)
+
+
+def test_hook_errors_must_not_break_settings(spans: list[Span]) -> None:
+    class FailingHook(SpanHook):
+        def on_start(self, span: Span) -> None:
+            raise RuntimeError("hook error")
+
+    hook = add_span_hook(FailingHook())
+    try:
+        settings = make_secrets_settings(
+            secrets_name="my/secret",
+            secrets_client=ClientMock(secret_string=json.dumps({"username": "admin"})),
+        )()  # type: ignore[call-arg]
+    finally:
+        remove_span_hook(hook)
+
+    assert settings.username == "admin"
+    assert len(spans) == 3
+
+
+class FakeOtelSpan:
+    def __init__(self, name: str, attributes: dict[str, Any]) -> None:
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent: Any = None
+        self.ended = False
+        self.status: Any = None
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+    def record_exception(self, error: BaseException) -> None:
+        pass
+
+    def set_status(self, status: Any) -> None:
+        self.status = status
+
+    def end(self) -> None:
+        self.ended = True
+
+
+def make_fake_opentelemetry() -> tuple[types.ModuleType, list[FakeOtelSpan]]:
+    started: list[FakeOtelSpan] = []
+    current: list[FakeOtelSpan] = []
+
+    class Tracer:
+        def start_span(self, name: str, attributes: dict[str, Any]) -> FakeOtelSpan:
+            otel_span = FakeOtelSpan(name, attributes)
+            otel_span.parent = current[-1] if current else None
+            started.append(otel_span)
+            return otel_span
+
+    context = types.SimpleNamespace(
+        attach=lambda otel_span: current.append(otel_span) or len(current),
+        detach=lambda token: current.pop(),
+    )
+    trace = types.SimpleNamespace(
+        get_tracer=lambda name: Tracer(),
+        set_span_in_context=lambda otel_span: otel_span,
+        Status=lambda code, description: (code, description),
+        StatusCode=types.SimpleNamespace(ERROR="ERROR"),
+    )
+    module = types.ModuleType("opentelemetry")
+    module.context = context  # type: ignore[attr-defined]
+    module.trace = trace  # type: ignore[attr-defined]
+
+    return module, started
+
+
+def test_opentelemetry_hook_must_emit_nested_spans(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module, started = make_fake_opentelemetry()
+    monkeypatch.setitem(sys.modules, "opentelemetry", module)
+    hook = add_span_hook(OpenTelemetrySpanHook())
+
+    try:
+        make_secrets_settings(
+            secrets_name="my/secret",
+            secrets_client=ClientMock(secret_string=json.dumps({"username": "admin"})),
+        )()  # type: ignore[call-arg]
+    finally:
+        remove_span_hook(hook)
+
+    build, get_secret_value, decode = started
+    assert build.name == instrumentation.BUILD_SETTINGS
+    assert get_secret_value.parent is build
+    assert decode.parent is build
+    assert all(otel_span.ended for otel_span in started)
@@ -0,0 +1,218 @@
+import json
+from typing import Annotated, Any
+
+import pytest
+
+from pydantic_settings_aws import (
+    ChangeEvent,
+    ChangeInvalidator,
+    RefreshingSettings,
+    SQSEventFeed,
+    parse_change_event,
+    value_cache,
+)
+
+from .boto3_mocks import ClientMock, SQSClientMock
+from .settings_mocks import make_parameter_settings, make_secrets_settings
+
+SECRET_ARN = "arn:aws:secretsmanager:eu-west-1:123456789012:secret:app/db-AbCdEf"
+
+HOST_FIELDS = {"host": Annotated[str, "/app/db/host"]}
+
+PASSWORD_FIELDS = {"password": str}
+
+
+@pytest.fixture(autouse=True)
+def clear_value_cache() -> None:
+    value_cache.clear()
+
+
+def parameter_event(name: str) -> dict[str, Any]:
+    return {
+        "source": "aws.ssm",
+        "detail-type": "Parameter Store Change",
+        "resources": [f"arn:aws:ssm:eu-west-1:123456789012:parameter{name}"],
+        "detail": {"name": name, "operation": "Update", "type": "String"},
+    }
+
+
+def rotation_event(secret_id: str = SECRET_ARN) -> dict[str, Any]:
+    return {
+        "source": "aws.secretsmanager",
+        "detail-type": "AWS Service Event via CloudTrail",
+        "detail": {
+            "eventName": "RotationSucceeded",
+            "additionalEventData": {"SecretId": secret_id},
+        },
+    }
+
+
+def test_parse_change_event_must_read_parameter_and_secret_changes() -> None:
+    put_secret = {
+        "source": "aws.secretsmanager",
+        "detail-type": "AWS API Call via CloudTrail",
+        "detail": {
+            "eventName": "PutSecretValue",
+            "requestParameters": {"secretId": "app/db"},
+            "responseElements": {"arn": SECRET_ARN},
+        },
+    }
+    get_secret = {
+        "source": "aws.secretsmanager",
+        "detail": {"eventName": "GetSecretValue"},
+    }
+
+    assert parse_change_event(parameter_event("/app/db/host")) == ChangeEvent(
+        "ssm",
+        "/app/db/host",
+        "arn:aws:ssm:eu-west-1:123456789012:parameter/app/db/host",
+    )
+    assert parse_change_event(put_secret) == ChangeEvent(
+        "secretsmanager", "app/db", SECRET_ARN
+    )
+    assert parse_change_event(get_secret) is None
+    assert parse_change_event({"source": "aws.ec2"}) is None
+
+
+def test_change_event_must_affect_names_paths_and_secret_arns() -> None:
+    parameter = ChangeEvent("ssm", "/app/db/host")
+    secret = ChangeEvent("secretsmanager", SECRET_ARN, SECRET_ARN)
+
+    assert parameter.affects("ssm", "/app/db/host")
+    assert parameter.affects("ssm", "/app/db/*")
+    assert parameter.affects("ssm", "/app/**")
+    assert not parameter.affects("ssm", "/app/*")
+    assert not parameter.affects("secretsmanager", "/app/db/host")
+    assert secret.affects("secretsmanager", "app/db")
+    assert secret.affects("secretsmanager", "arn:aws:secretsmanager:eu-west-1:123456789012:secret:app/db")
+    assert not secret.affects("secretsmanager", "app/db-2")
+
+
+def test_changes_must_invalidate_only_the_affected_values() -> None:
+    client = ClientMock(ssm_value="db.internal", secret_string=json.dumps({"password": "pwd"}))
+    parameter_cls = make_parameter_settings(
+        HOST_FIELDS, ssm_client=client, value_cache_ttl=300
+    )
+    secrets_cls = make_secrets_settings(
+        PASSWORD_FIELDS, secrets_name="app/db", secrets_client=client, value_cache_ttl=300
+    )
+    parameter_cls()
+    secrets_cls()  # type: ignore[call-arg]
+
+    changes = ChangeInvalidator().handle([rotation_event(), {"source": "aws.ec2"}])
+
+    assert changes == [ChangeEvent("secretsmanager", SECRET_ARN, SECRET_ARN)]
+    parameter_cls()
+    secrets_cls()  # type: ignore[call-arg]
+    assert client.get_parameters_calls == [["/app/db/host"]]
+    assert client.get_secret_value_calls == 2
+
+
+def test_changes_must_refresh_only_the_settings_reading_them() -> None:
+    parameter_client = ClientMock(ssm_value="old.internal")
+    secrets_client = ClientMock(secret_string=json.dumps({"password": "pwd"}))
+    parameter_cls = make_parameter_settings(
+        HOST_FIELDS, ssm_client=parameter_client, value_cache_ttl=300
+    )
+    secrets_cls = make_secrets_settings(
+        PASSWORD_FIELDS,
+        secrets_name="app/db",
+        secrets_client=secrets_client,
+        value_cache_ttl=300,
+    )
+    parameters = RefreshingSettings(parameter_cls, 3600, start=False)
+    secrets = RefreshingSettings(secrets_cls, 3600, start=False)
+    invalidator = ChangeInvalidator()
+    invalidator.watch(parameters)
+    invalidator.watch(secrets)
+
+    parameter_client.ssm_value = "new.internal"
+    invalidator.handle([parameter_event("/app/db/host")])
+
+    assert parameters.current.host == "new.internal"  # type: ignore[attr-defined]
+    assert len(parameter_client.get_parameters_calls) == 2
+    assert secrets_client.get_secret_value_calls == 1
+
+    invalidator.unwatch(parameters)
+    parameter_client.ssm_value = "newer.internal"
+    invalidator.handle([parameter_event("/app/db/host")])
+
+    assert parameters.current.host == "new.internal"  # type: ignore[attr-defined]
+
+
+def test_sqs_feed_must_delete_messages_once_handled() -> None:
+    sqs = SQSClientMock()
+    sqs.send(json.dumps(parameter_event("/app/db/host")))
+    sqs.send(json.dumps({"Type": "Notification", "Message": json.dumps(rotation_event())}))
+    sqs.send("not json")
+    client = ClientMock(ssm_value="old.internal")
+    settings_cls = make_parameter_settings(
+        HOST_FIELDS, ssm_client=client, value_cache_ttl=300
+    )
+    settings = RefreshingSettings(settings_cls, 3600, start=False)
+    invalidator = ChangeInvalidator(SQSEventFeed("https://sqs.local/queue", client=sqs))
+    invalidator.watch(settings)
+
+    client.ssm_value = "new.internal"
+    changes = invalidator.poll()
+
+    assert [change.service for change in changes] == ["ssm", "secretsmanager"]
+    assert settings.current.host == "new.internal"  # type: ignore[attr-defined]
+    assert sqs.messages == {}
+
+
+def test_sqs_feed_must_keep_messages_when_handling_fails() -> None:
+    sqs = SQSClientMock()
+    sqs.send(json.dumps(parameter_event("/app/db/host")))
+
+    class BrokenCache:
+        def invalidate_matching(self, predicate: Any) -> int:
+            raise RuntimeError("cache unavailable")
+
+    invalidator = ChangeInvalidator(
+        SQSEventFeed("https://sqs.local/queue", client=sqs),
+        cache=BrokenCache(),  # type: ignore[arg-type]
+    )
+
+    with pytest.raises(RuntimeError):
+        invalidator.poll()
+
+    assert len(sqs.messages) == 1
+
+
+def test_sqs_feed_must_keep_messages_when_a_refresh_fails() -> None:
+    sqs = SQSClientMock()
+    sqs.send(json.dumps(parameter_event("/app/db/host")))
+    client = ClientMock(ssm_value="old.internal")
+    settings_cls = make_parameter_settings(HOST_FIELDS, ssm_client=client)
+    settings = RefreshingSettings(settings_cls, 3600, start=False)
+    invalidator = ChangeInvalidator(SQSEventFeed("https://sqs.local/queue", client=sqs))
+    invalidator.watch(settings)
+
+    client.invalid_parameters = ["/app/db/host"]
+    invalidator.poll()
+
+    assert settings.current.host == "old.internal"  # type: ignore[attr-defined]
+    assert len(sqs.messages) == 1
+
+    client.invalid_parameters = []
+    client.ssm_value = "new.internal"
+    invalidator.poll()
+
+    assert settings.current.host == "new.internal"  # type: ignore[attr-defined]
+    assert sqs.messages == {}
+
+
+def test_sqs_feed_must_log_messages_that_could_not_be_deleted(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    sqs = SQSClientMock()
+    sqs.send(json.dumps(parameter_event("/app/db/host")))
+    sqs.send(json.dumps(parameter_event("/app/db/port")))
+    sqs.failing_deletes = {"receipt-2"}
+    invalidator = ChangeInvalidator(SQSEventFeed("https://sqs.local/queue", client=sqs))
+
+    invalidator.poll()
+
+    assert list(sqs.messages) == ["receipt-2"]
+    assert "ReceiptHandleIsInvalid" in caplog.text
@@ -0,0 +1,263 @@
+import asyncio
+import json
+import threading
+from typing import Annotated
+
+import pytest
+from pydantic import (
+    Field,
+    PrivateAttr,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+
+from pydantic_settings_aws import (
+    SSM,
+    AWSSettingsConfigDict,
+    AWSSettingsConfigError,
+    LazyAWSBaseSettings,
+    LazyParameterStoreBaseSettings,
+    ParameterStoreBaseSettings,
+    Secrets,
+)
+
+from .boto3_mocks import ClientMock
+from .settings_mocks import make_settings
+
+
+class LazySettings(LazyParameterStoreBaseSettings):
+    host: Annotated[str, SSM(name="/db/host", group="db")]
+    port: Annotated[int, SSM(name="/db/port", group="db")]
+    timeout: Annotated[int, "/app/timeout"]
+    region: Annotated[str, "/app/region"] = "us-east-1"
+
+
+def test_instantiation_must_not_fetch_deferred_fields() -> None:
+    client = ClientMock(ssm_value="10")
+
+    settings_cls = make_settings(LazySettings, ssm_client=client)
+    settings = settings_cls()  # type: ignore[call-arg]
+
+    assert client.get_parameters_calls == []
+    assert settings.timeout == 10
+    assert client.get_parameters_calls == [["/app/timeout"]]
+
+
+def test_fields_of_a_group_must_be_fetched_together() -> None:
+    client = ClientMock(ssm_value="10")
+    settings_cls = make_settings(LazySettings, ssm_client=client)
+    settings = settings_cls()  # type: ignore[call-arg]
+
+    assert settings.port == 10
+    assert settings.host == "10"
+    assert client.get_parameters_calls == [["/db/host", "/db/port"]]
+
+
+def test_init_values_must_not_be_deferred() -> None:
+    client = ClientMock(ssm_value="10")
+    settings_cls = make_settings(LazySettings, ssm_client=client)
+    settings = settings_cls(timeout=5)  # type: ignore[call-arg]
+
+    assert settings.timeout == 5
+    assert client.get_parameters_calls == []
+
+
+def test_missing_values_must_fall_back_to_env_then_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TIMEOUT", "30")
+    settings_cls = make_settings(LazySettings, ssm_client=ClientMock(ssm_value=None))
+    settings = settings_cls()  # type: ignore[call-arg]
+
+    assert settings.timeout == 30
+    assert settings.region == "us-east-1"
+    assert settings.model_fields_set == {"timeout"}
+
+
+def test_missing_required_fields_must_raise_on_access() -> None:
+    settings_cls = make_settings(LazySettings, ssm_client=ClientMock(ssm_value=None))
+    settings = settings_cls()  # type: ignore[call-arg]
+
+    with pytest.raises(ValidationError, match="timeout\n  Field required"):
+        _ = settings.timeout
+
+    with pytest.raises(ValidationError) as e:
+        settings.resolve_all()
+
+    assert {error["loc"] for error in e.value.errors()} == {
+        ("host",),
+        ("port",),
+        ("timeout",),
+    }
+
+
+def test_resolve_all_must_fetch_every_field_in_one_batch() -> None:
+    client = ClientMock(ssm_value="10")
+    settings_cls = make_settings(LazySettings, ssm_client=client)
+    settings = settings_cls()  # type: ignore[call-arg]
+
+    settings.resolve_all()
+
+    assert client.get_parameters_calls == [
+        ["/db/host", "/db/port", "/app/timeout", "/app/region"]
+    ]
+    assert settings.model_dump() == {
+        "host": "10",
+        "port": 10,
+        "timeout": 10,
+        "region": "10",
+    }
+
+
+def test_model_dump_must_resolve_deferred_fields() -> None:
+    settings_cls = make_settings(LazySettings, ssm_client=ClientMock(ssm_value="10"))
+    settings = settings_cls()  # type: ignore[call-arg]
+
+    assert json.loads(settings.model_dump_json())["port"] == 10
+
+
+def test_field_validators_must_run_on_access() -> None:
+    class Settings(LazyParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=ClientMock(ssm_value="-1"))
+
+        port: Annotated[int, "/db/port"]
+
+        @field_validator("port")
+        @classmethod
+        def check_port(cls, port: int) -> int:
+            if port < 0:
+                raise ValueError("port must be positive")
+            return port
+
+    settings = Settings()  # type: ignore[call-arg]
+
+    with pytest.raises(ValidationError, match="port must be positive"):
+        _ = settings.port
+
+
+def test_init_values_must_keep_aliases_private_attributes_and_validators() -> None:
+    class Settings(LazyParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=ClientMock(ssm_value="10"))
+
+        port: Annotated[int, "/db/port"]
+        app_name: str = Field(alias="application")
+        _started: bool = PrivateAttr(default=False)
+
+        @field_validator("app_name")
+        @classmethod
+        def check_app_name(cls, app_name: str) -> str:
+            return f"{cls.__name__}:{app_name}"
+
+    settings = Settings(application="api")  # type: ignore[call-arg]
+
+    assert settings.__dict__ == {"app_name": "Settings:api"}
+    assert settings._started is False
+    assert settings.port == 10
+    assert settings.model_fields_set == {"app_name", "port"}
+
+
+def test_fields_of_a_secret_must_be_fetched_together() -> None:
+    ssm_client = ClientMock(ssm_value="value")
+    secrets_client = ClientMock(
+        secret_string=json.dumps({"username": "admin", "password": "secret"})
+    )
+
+    class Settings(LazyAWSBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            secrets_name="my/secret",
+            secrets_client=secrets_client,
+            ssm_client=ssm_client,
+        )
+
+        username: Annotated[str, Secrets()]
+        password: Annotated[str, Secrets()]
+        host: Annotated[str, SSM(name="/db/host")]
+        debug: bool = False
+
+    settings = Settings()  # type: ignore[call-arg]
+
+    assert settings.debug is False
+    assert settings.username == "admin"
+    assert settings.password == "secret"
+    assert secrets_client.get_secret_value_calls == 1
+    assert ssm_client.get_parameters_calls == []
+
+
+def test_concurrent_accesses_must_fetch_once() -> None:
+    client = ClientMock(ssm_value="10")
+    settings_cls = make_settings(LazySettings, ssm_client=client)
+    settings = settings_cls()  # type: ignore[call-arg]
+    barrier = threading.Barrier(16)
+    ports: list[int] = []
+
+    def read_port() -> None:
+        barrier.wait(timeout=5)
+        ports.append(settings.port)
+
+    threads = [threading.Thread(target=read_port) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert ports == [10] * 16
+    assert client.get_parameters_calls == [["/db/host", "/db/port"]]
+
+
+def test_aload_must_resolve_every_field() -> None:
+    client = ClientMock(ssm_value="10")
+    settings = asyncio.run(make_settings(LazySettings, ssm_client=client).aload())
+
+    assert settings.__dict__["timeout"] == 10
+    assert settings.__dict__["host"] == "10"
+
+
+def test_resolved_instances_must_compare_by_value() -> None:
+    settings_cls = make_settings(LazySettings, ssm_client=ClientMock(ssm_value="10"))
+    first = settings_cls()  # type: ignore[call-arg]
+    second = settings_cls()  # type: ignore[call-arg]
+
+    assert first.port == 10
+    assert first == second
+    assert first != settings_cls(timeout=5)  # type: ignore[call-arg]
+
+
+def test_repr_must_show_resolved_and_unresolved_fields() -> None:
+    settings_cls = make_settings(LazySettings, ssm_client=ClientMock(ssm_value="10"))
+    settings = settings_cls()  # type: ignore[call-arg]
+
+    assert settings.timeout == 10
+    assert "timeout=10" in repr(settings)
+    assert "host=<unresolved>" in repr(settings)
+    assert "_deferred" not in repr(settings)
+
+
+def test_resolve_lazily_must_require_a_lazy_base() -> None:
+    with pytest.raises(AWSSettingsConfigError, match="LazyParameterStoreBaseSettings"):
+
+        class Settings(ParameterStoreBaseSettings):
+            model_config = AWSSettingsConfigDict(resolve_lazily=True)
+
+            port: Annotated[int, "/db/port"]
+
+
+def test_model_validators_must_be_rejected_on_definition() -> None:
+    with pytest.raises(AWSSettingsConfigError, match="model validators"):
+
+        class Settings(LazyParameterStoreBaseSettings):
+            port: Annotated[int, "/db/port"]
+
+            @model_validator(mode="after")
+            def check_port(self) -> "Settings":
+                return self
+
+
+def test_eager_settings_must_not_be_lazy() -> None:
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=ClientMock(ssm_value="10"))
+
+        port: Annotated[int, "/db/port"]
+
+    assert not hasattr(Settings(), "_deferred")  # type: ignore[call-arg]
+    assert not hasattr(Settings, "resolve_all")
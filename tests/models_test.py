@@ -4,3 +4,19 @@ from pydantic_settings_aws.models import AwsSession
 def test_aws_session_key_must_be_default_if_all_values_are_none() -> None:
     session = AwsSession()  # type: ignore[call-arg]
     assert session.session_key() == "default"
+
+
+def test_aws_session_key_must_tell_session_tokens_apart() -> None:
+    first = AwsSession(aws_region="us-east-1", aws_session_token="token-1")  # type: ignore[call-arg]
+    second = AwsSession(aws_region="us-east-1", aws_session_token="token-2")  # type: ignore[call-arg]
+
+    assert first.session_key() != second.session_key()
+    assert "token-1" not in first.session_key()
+
+
+def test_aws_session_key_must_not_contain_the_secret_access_key() -> None:
+    first = AwsSession(aws_access_key_id="id", aws_secret_access_key="secret-1")  # type: ignore[call-arg]
+    second = AwsSession(aws_access_key_id="id", aws_secret_access_key="secret-2")  # type: ignore[call-arg]
+
+    assert first.session_key() != second.session_key()
+    assert "secret-1" not in first.session_key()
@@ -0,0 +1,115 @@
+import gc
+import weakref
+from typing import Annotated
+from unittest import mock
+
+from pydantic import BaseModel
+
+from pydantic_settings_aws import (
+    SSM,
+    AWSBaseSettings,
+    AWSSettingsConfigDict,
+    ParameterStoreBaseSettings,
+    Secrets,
+    SecretsManagerBaseSettings,
+    plan,
+    utils,
+)
+from pydantic_settings_aws.plan import FieldRoute
+
+from .boto3_mocks import ClientMock
+
+field_client = ClientMock(ssm_value="other")
+
+
+class AWSPlanSettings(AWSBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=ClientMock(ssm_value="value"),
+        secrets_client=ClientMock(secret_string='{"user": "me"}'),
+        secrets_name="my/secret",
+    )
+
+    username: Annotated[str, Secrets(field="user")]
+    host: Annotated[str, SSM(name="/my/host", client=field_client)]
+    port: int = 8080
+
+
+def test_aws_plan_must_record_service_key_and_client() -> None:
+    aws_plan = plan.get_plan(AWSPlanSettings, "aws")
+
+    assert aws_plan.routes == (
+        FieldRoute("username", "secrets", "user", None),
+        FieldRoute("host", "ssm", "/my/host", field_client),
+    )
+
+
+def test_plan_must_be_compiled_once_per_class() -> None:
+    plan.get_plan(AWSPlanSettings, "aws")
+
+    with mock.patch.object(
+        utils,
+        "get_annotated_service_metadata",
+        wraps=utils.get_annotated_service_metadata,
+    ) as get_metadata:
+        AWSPlanSettings()  # type: ignore[call-arg]
+        AWSPlanSettings()  # type: ignore[call-arg]
+
+    get_metadata.assert_not_called()
+
+
+def test_ssm_plan_must_split_path_fields() -> None:
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_path="/my/app")
+
+        name: str
+        region: Annotated[str, "/shared/region"]
+
+    ssm_plan = plan.get_plan(Settings, "ssm")
+
+    assert ssm_plan.routes == (FieldRoute("region", "ssm", "/shared/region"),)
+    assert ssm_plan.path_fields == ("name",)
+
+
+def test_secrets_plan_must_record_json_keys() -> None:
+    class Settings(SecretsManagerBaseSettings):
+        username: str
+        pwd: Annotated[str, Secrets(field="password")]
+
+    assert [route.key for route in plan.get_plan(Settings, "secrets").routes] == [
+        "username",
+        "password",
+    ]
+
+
+def test_plans_must_not_outlive_redefined_classes() -> None:
+    def define() -> type[SecretsManagerBaseSettings]:
+        class Settings(SecretsManagerBaseSettings):
+            username: str
+
+        return Settings
+
+    first = define()
+    plan.get_plan(first, "secrets")
+    first_ref = weakref.ref(first)
+
+    second = define()
+    plan.get_plan(second, "secrets")
+    del first
+    gc.collect()
+
+    assert first_ref() is None
+    assert second in plan._plans
+
+
+def test_plan_must_be_recompiled_when_fields_are_rebuilt() -> None:
+    class Settings(SecretsManagerBaseSettings):
+        nested: "Nested"
+
+    compiled = plan.get_plan(Settings, "secrets")
+
+    class Nested(BaseModel):
+        roles: list[str]
+
+    Settings.model_rebuild(_types_namespace={"Nested": Nested})
+
+    assert plan.get_plan(Settings, "secrets") is not compiled
@@ -0,0 +1,116 @@
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Iterator
+from typing import Annotated, Any
+
+import pytest
+
+from pydantic_settings_aws import (
+    AWSSettingsConfigDict,
+    ParameterStoreBaseSettings,
+    after_fork_in_child,
+    clear_prewarmed,
+    client_pool,
+    instrumentation,
+    lazy,
+    plan,
+    prewarm,
+    single_flight,
+)
+
+from .boto3_mocks import ClientMock
+
+requires_fork = pytest.mark.skipif(
+    not hasattr(os, "register_at_fork")
+    or "fork" not in multiprocessing.get_all_start_methods(),
+    reason="requires the fork start method",
+)
+
+prewarm_client = ClientMock(ssm_value="10")
+
+
+class PrewarmSettings(ParameterStoreBaseSettings):
+    model_config = AWSSettingsConfigDict(ssm_client=prewarm_client)
+
+    host: Annotated[str, "/db/host"]
+    port: Annotated[int, "/db/port"]
+
+
+@pytest.fixture(autouse=True)
+def prewarmed() -> Iterator[None]:
+    prewarm_client.get_parameters_calls.clear()
+    yield
+    clear_prewarmed()
+    client_pool.clear()
+
+
+def build_in_child(_: int) -> tuple[str, int, list[list[str]], int]:
+    settings = PrewarmSettings()  # type: ignore[call-arg]
+
+    return settings.host, settings.port, prewarm_client.get_parameters_calls, len(client_pool)
+
+
+def test_prewarmed_classes_must_be_built_without_aws_calls() -> None:
+    prewarm(PrewarmSettings)
+
+    settings = PrewarmSettings()  # type: ignore[call-arg]
+    async_settings = asyncio.run(PrewarmSettings.aload())
+
+    assert settings.port == async_settings.port == 10
+    assert prewarm_client.get_parameters_calls == [["/db/host", "/db/port"]]
+
+
+def test_init_values_must_override_prewarmed_values() -> None:
+    prewarm(PrewarmSettings)
+
+    assert PrewarmSettings(port=20).port == 20  # type: ignore[call-arg]
+
+
+def test_cleared_classes_must_fetch_again() -> None:
+    prewarm(PrewarmSettings)
+    clear_prewarmed(PrewarmSettings)
+
+    PrewarmSettings()  # type: ignore[call-arg]
+
+    assert len(prewarm_client.get_parameters_calls) == 2
+
+
+def test_after_fork_in_child_must_drop_pooled_clients() -> None:
+    client_pool.get_or_create("ssm_default", object)
+    single_flight._calls["in flight"] = object()  # type: ignore[assignment]
+
+    after_fork_in_child()
+
+    assert len(client_pool) == 0
+    assert single_flight._calls == {}
+
+
+def test_after_fork_in_child_must_replace_the_module_locks() -> None:
+    locks = [plan._plans_lock, lazy._models_lock, instrumentation._hooks_lock]
+    for lock in locks:
+        lock.acquire()
+
+    try:
+        after_fork_in_child()
+
+        assert not plan._plans_lock.locked()
+        assert not lazy._models_lock.locked()
+        assert not instrumentation._hooks_lock.locked()
+    finally:
+        for lock in locks:
+            lock.release()
+
+
+@requires_fork
+def test_forked_children_must_reuse_prewarmed_values() -> None:
+    client_pool.get_or_create("ssm_default", object)
+    prewarm(PrewarmSettings)
+
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        results: list[Any] = pool.map(build_in_child, range(4))
+
+    # no call in the children: their copy of the client only has the
+    # parent's prewarm call, and the parent's pooled client was dropped
+    assert results == [("10", 10, [["/db/host", "/db/port"]], 0)] * 4
+    assert len(client_pool) == 1
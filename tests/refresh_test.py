@@ -0,0 +1,179 @@
+import json
+import threading
+from typing import Annotated, Any
+
+import pytest
+from pydantic import ValidationError, field_validator
+from pydantic_settings import BaseSettings
+
+from pydantic_settings_aws import (
+    SSM,
+    AWSBaseSettings,
+    AWSSettingsConfigDict,
+    AWSSettingsConfigError,
+    ParameterStoreBaseSettings,
+    RefreshingSettings,
+    Secrets,
+    SecretsManagerBaseSettings,
+    value_cache,
+)
+
+from .boto3_mocks import ClientMock
+from .settings_mocks import make_settings
+
+validations: list[str] = []
+
+
+class RotatedSettings(SecretsManagerBaseSettings):
+    model_config = AWSSettingsConfigDict(secrets_name="my/rotated/secret")
+
+    password: str
+
+    @field_validator("password")
+    @classmethod
+    def count_validations(cls, password: str) -> str:
+        validations.append(password)
+        return password
+
+
+def rotate(client: ClientMock, password: str, version_id: str) -> None:
+    client.secret_string = json.dumps({"password": password})
+    client.secret_version_id = version_id
+
+
+def test_refresh_must_swap_the_instance_when_the_secret_rotates() -> None:
+    client = ClientMock(secret_version_id="v1")
+    rotate(client, "old", "v1")
+    settings_cls = make_settings(RotatedSettings, secrets_client=client)
+    settings = RefreshingSettings(settings_cls, 60, start=False)
+    changes: list[tuple[Any, Any]] = []
+    settings.add_listener(lambda old, new: changes.append((old, new)))
+    previous = settings.current
+
+    rotate(client, "new", "v2")
+
+    assert settings.refresh()
+    assert settings.current.password == "new"  # type: ignore[attr-defined]
+    assert changes == [(previous, settings.current)]
+
+
+def test_refresh_must_not_validate_unchanged_versions() -> None:
+    client = ClientMock()
+    rotate(client, "same", "v1")
+    settings_cls = make_settings(RotatedSettings, secrets_client=client)
+    settings = RefreshingSettings(settings_cls, 60, start=False)
+    previous = settings.current
+    validations.clear()
+
+    assert not settings.refresh()
+    assert settings.current is previous
+    assert validations == []
+    assert client.get_secret_value_calls == 2
+
+
+def test_refresh_must_compare_values_without_versions() -> None:
+    client = ClientMock(ssm_value="host-1")
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=client)
+
+        host: Annotated[str, "/my/host"]
+
+    settings = RefreshingSettings(Settings, 60, start=False)
+
+    assert not settings.refresh()
+
+    client.ssm_value = "host-2"
+
+    assert settings.refresh()
+    assert settings.current.host == "host-2"
+
+
+def test_refresh_must_bypass_the_value_cache() -> None:
+    value_cache.clear()
+    ssm_client = ClientMock(ssm_value="value", ssm_version=1)
+    secrets_client = ClientMock(secret_string=json.dumps({"username": "me"}))
+
+    class Settings(AWSBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            ssm_client=ssm_client,
+            secrets_client=secrets_client,
+            secrets_name="my/secret",
+            value_cache_ttl=60,
+        )
+
+        username: Annotated[str, Secrets()]
+        host: Annotated[str, SSM(name="/my/host")]
+
+    settings = RefreshingSettings(Settings, 60, start=False)
+    ssm_client.ssm_value, ssm_client.ssm_version = "new", 2
+
+    assert settings.refresh()
+    assert settings.current.host == "new"
+    assert Settings().host == "new"  # type: ignore[call-arg]
+    assert len(ssm_client.get_parameters_calls) == 2
+
+
+def test_refresh_must_keep_the_current_instance_on_invalid_values() -> None:
+    client = ClientMock()
+    rotate(client, "old", "v1")
+    settings_cls = make_settings(RotatedSettings, secrets_client=client)
+    settings = RefreshingSettings(settings_cls, 60, start=False)
+    client.secret_string = json.dumps({"password": None})
+    client.secret_version_id = "v2"
+
+    with pytest.raises(ValidationError):
+        settings.refresh()
+
+    assert settings.current.password == "old"  # type: ignore[attr-defined]
+
+
+def test_refresh_must_run_in_the_background() -> None:
+    client = ClientMock()
+    rotate(client, "old", "v1")
+    refreshed = threading.Event()
+
+    with RefreshingSettings(
+        make_settings(RotatedSettings, secrets_client=client), 0.01, jitter=0.5
+    ) as settings:
+        settings.add_listener(lambda old, new: refreshed.set())
+        rotate(client, "new", "v2")
+
+        assert refreshed.wait(timeout=5)
+        assert settings.current.password == "new"  # type: ignore[attr-defined]
+
+
+def test_listener_errors_must_not_stop_other_listeners() -> None:
+    client = ClientMock()
+    rotate(client, "old", "v1")
+    settings_cls = make_settings(RotatedSettings, secrets_client=client)
+    settings = RefreshingSettings(settings_cls, 60, start=False)
+    calls: list[str] = []
+
+    def failing_listener(old: Any, new: Any) -> None:
+        raise RuntimeError("listener error")
+
+    settings.add_listener(failing_listener)
+    settings.add_listener(lambda old, new: calls.append(new.password))
+    rotate(client, "new", "v2")
+
+    assert settings.refresh()
+    assert calls == ["new"]
+
+    settings.remove_listener(failing_listener)
+    assert len(settings._listeners) == 1
+
+
+def test_refreshing_settings_must_reject_other_settings_classes() -> None:
+    class Settings(BaseSettings):
+        name: str = "name"
+
+    with pytest.raises(AWSSettingsConfigError):
+        RefreshingSettings(Settings, 60)
+
+
+def test_refreshing_settings_must_reject_invalid_jitter() -> None:
+    with pytest.raises(AWSSettingsConfigError):
+        RefreshingSettings(
+            make_settings(RotatedSettings, secrets_client=ClientMock()), 60, jitter=2
+        )
@@ -0,0 +1,141 @@
+import threading
+import time
+from typing import Annotated
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+
+from pydantic_settings_aws import (
+    MultiRegionClient,
+    ParameterNotFoundError,
+    RegionLatencies,
+    aws,
+    region_latencies,
+)
+
+from .aws_mocks import TARGET_SESSION
+from .boto3_mocks import (
+    ClientErrorMock,
+    ClientMock,
+    RegionSessionMock,
+    WaitingClientMock,
+)
+from .settings_mocks import make_parameter_settings
+
+REGIONS = ["eu-west-1", "eu-central-1"]
+
+PORT_FIELDS = {"port": Annotated[str, "/db/port"]}
+
+
+@pytest.fixture(autouse=True)
+def clean_regions() -> None:
+    aws.client_pool.close()
+    region_latencies.clear()
+
+
+@mock.patch(TARGET_SESSION, RegionSessionMock)
+def test_unreachable_region_must_fail_over_to_the_next_one() -> None:
+    secondary = ClientMock(ssm_value="5432")
+    RegionSessionMock.clients = {
+        "eu-west-1": ClientErrorMock("ThrottlingException"),
+        "eu-central-1": secondary,
+    }
+
+    settings = make_parameter_settings(PORT_FIELDS, aws_regions=REGIONS)()
+
+    assert settings.port == "5432"  # type: ignore[attr-defined]
+    assert secondary.get_parameters_calls == [["/db/port"]]
+    assert region_latencies.stats()[("ssm", "eu-west-1")].failures == 1
+
+
+@mock.patch(TARGET_SESSION, RegionSessionMock)
+def test_missing_parameters_must_not_fail_over() -> None:
+    secondary = ClientMock(ssm_value="5432")
+    RegionSessionMock.clients = {
+        "eu-west-1": ClientMock(ssm_value="5432", invalid_parameters=["/db/port"]),
+        "eu-central-1": secondary,
+    }
+
+    with pytest.raises(ParameterNotFoundError):
+        make_parameter_settings(PORT_FIELDS, aws_regions=REGIONS)()
+
+    assert secondary.get_parameters_calls == []
+
+
+@mock.patch(TARGET_SESSION, RegionSessionMock)
+def test_slow_region_must_be_hedged_with_the_next_one() -> None:
+    answered = threading.Event()
+    primary = WaitingClientMock(answered.is_set, ssm_value="primary")
+    RegionSessionMock.clients = {
+        "eu-west-1": primary,
+        "eu-central-1": ClientMock(ssm_value="secondary"),
+    }
+
+    settings = make_parameter_settings(
+        PORT_FIELDS, aws_regions=REGIONS, region_hedge_delay=0.01
+    )()
+    answered.set()
+
+    assert settings.port == "secondary"  # type: ignore[attr-defined]
+    assert primary.calls == 1
+
+
+@mock.patch(TARGET_SESSION, RegionSessionMock)
+def test_late_primary_answer_must_win_over_a_fast_secondary_error() -> None:
+    answer_at = time.monotonic() + 0.1
+    primary = WaitingClientMock(
+        lambda: time.monotonic() >= answer_at, ssm_value="primary"
+    )
+    RegionSessionMock.clients = {
+        "eu-west-1": primary,
+        "eu-central-1": ClientErrorMock("ParameterNotFound"),
+    }
+
+    settings = make_parameter_settings(
+        PORT_FIELDS, aws_regions=REGIONS, region_hedge_delay=0.01
+    )()
+
+    assert settings.port == "primary"  # type: ignore[attr-defined]
+
+
+@mock.patch(TARGET_SESSION, RegionSessionMock)
+def test_secondary_error_must_be_raised_when_no_region_answers() -> None:
+    RegionSessionMock.clients = {
+        "eu-west-1": ClientErrorMock("ThrottlingException"),
+        "eu-central-1": ClientErrorMock("ParameterNotFound"),
+    }
+    settings_cls = make_parameter_settings(
+        PORT_FIELDS, aws_regions=REGIONS, region_hedge_delay=0.01
+    )
+
+    with pytest.raises(ClientError, match="ParameterNotFound"):
+        settings_cls()
+
+
+@mock.patch(TARGET_SESSION, RegionSessionMock)
+def test_region_clients_must_be_pooled() -> None:
+    RegionSessionMock.clients = {"eu-west-1": ClientMock(ssm_value="5432")}
+    settings_cls = make_parameter_settings(PORT_FIELDS, aws_regions=REGIONS)
+
+    client = aws.get_ssm_client(settings_cls)
+
+    assert isinstance(client, MultiRegionClient)
+    assert aws.get_ssm_client(settings_cls) is client
+    assert client.regions == ("eu-west-1", "eu-central-1")
+
+
+def test_latency_order_must_try_the_fastest_region_first() -> None:
+    latencies = RegionLatencies()
+    regions = ("us-east-1", "us-west-2", "eu-west-1")
+    client = MultiRegionClient(
+        "ssm", regions, lambda region: None, order="latency", latencies=latencies
+    )
+    latencies.record("ssm", "us-east-1", 0.3)
+    latencies.record("ssm", "us-west-2", 0.1)
+
+    assert client.get_regions() == ["eu-west-1", "us-west-2", "us-east-1"]
+
+    latencies.record("ssm", "eu-west-1", 0.2, failed=True)
+
+    assert client.get_regions() == ["us-west-2", "us-east-1", "eu-west-1"]
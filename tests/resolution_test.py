@@ -0,0 +1,117 @@
+import json
+from typing import Annotated
+
+import pytest
+
+from pydantic_settings_aws import (
+    SSM,
+    AWSBaseSettings,
+    AWSSettingsConfigDict,
+    ParameterNotFoundError,
+    ParameterStoreBaseSettings,
+    ResolutionContext,
+    ResolutionStats,
+    Secrets,
+    SecretsManagerBaseSettings,
+)
+from pydantic_settings_aws.resolution import get_resolution_context
+
+from .boto3_mocks import ClientMock
+from .settings_mocks import make_settings
+
+
+def make_client(**kwargs: object) -> ClientMock:
+    return ClientMock(
+        ssm_value="10",
+        secret_string=json.dumps({"username": "admin", "password": "secret"}),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class DatabaseSettings(AWSBaseSettings):
+    model_config = AWSSettingsConfigDict(secrets_name="app/secret")
+
+    host: Annotated[str, SSM(name="/db/host")]
+    port: Annotated[int, SSM(name="/db/port")]
+    username: Annotated[str, Secrets()]
+
+
+class CacheSettings(ParameterStoreBaseSettings):
+    host: Annotated[str, "/cache/host"]
+    port: Annotated[int, "/db/port"]
+
+
+class CredentialsSettings(SecretsManagerBaseSettings):
+    model_config = AWSSettingsConfigDict(secrets_name="app/secret")
+
+    username: str
+    password: str
+
+
+def test_classes_must_share_their_fetches() -> None:
+    client = make_client()
+    database_cls = make_settings(
+        DatabaseSettings, ssm_client=client, secrets_client=client
+    )
+    cache_cls = make_settings(CacheSettings, ssm_client=client)
+    credentials_cls = make_settings(CredentialsSettings, secrets_client=client)
+
+    with ResolutionContext(database_cls, cache_cls, credentials_cls) as context:
+        database = database_cls()
+        cache = cache_cls()
+        credentials = credentials_cls()  # type: ignore[call-arg]
+
+    assert client.get_parameters_calls == [["/db/host", "/db/port", "/cache/host"]]
+    assert client.get_secret_value_calls == 1
+    assert (database.port, cache.port, credentials.password) == (10, 10, "secret")
+    assert context.stats() == ResolutionStats(fetched=4, shared=3)
+
+
+def test_undeclared_classes_must_share_fetched_values() -> None:
+    client = make_client()
+    database_cls = make_settings(
+        DatabaseSettings, ssm_client=client, secrets_client=client
+    )
+    cache_cls = make_settings(CacheSettings, ssm_client=client)
+
+    with ResolutionContext():
+        database_cls()
+        cache_cls()
+
+    assert client.get_parameters_calls == [["/db/host", "/db/port"], ["/cache/host"]]
+
+
+def test_missing_parameters_of_other_classes_must_not_fail_a_class() -> None:
+    client = make_client(invalid_parameters=["/cache/host"])
+    database_cls = make_settings(
+        DatabaseSettings, ssm_client=client, secrets_client=client
+    )
+    cache_cls = make_settings(CacheSettings, ssm_client=client)
+
+    with ResolutionContext(database_cls, cache_cls):
+        assert database_cls().port == 10
+
+        with pytest.raises(ParameterNotFoundError, match="/cache/host"):
+            cache_cls()
+
+    assert client.get_parameters_calls == [
+        ["/db/host", "/db/port", "/cache/host"],
+        ["/cache/host"],
+    ]
+
+
+def test_values_must_not_be_shared_outside_the_context() -> None:
+    client = make_client()
+    database_cls = make_settings(
+        DatabaseSettings, ssm_client=client, secrets_client=client
+    )
+
+    with ResolutionContext(database_cls):
+        database_cls()
+        assert get_resolution_context() is not None
+
+    database_cls()
+
+    assert get_resolution_context() is None
+    assert len(client.get_parameters_calls) == 2
+    assert client.get_secret_value_calls == 2
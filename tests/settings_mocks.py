@@ -1,7 +1,10 @@
 import json
-from typing import Annotated
+import threading
+from collections.abc import Mapping
+from typing import Annotated, Any, TypeVar, cast
 
 from pydantic import BaseModel
+from pydantic_settings import BaseSettings
 
 from pydantic_settings_aws import (
     AWSBaseSettings,
@@ -12,7 +15,14 @@ from pydantic_settings_aws import (
     SecretsManagerBaseSettings,
 )
 
-from .boto3_mocks import ClientMock
+from .boto3_mocks import (
+    BarrierClientMock,
+    ClientErrorMock,
+    ClientMock,
+    DelayedClientErrorMock,
+    PathClientMock,
+    SecretsClientMock,
+)
 
 dict_secrets_with_username_and_password = {
     "username": "myusername",
@@ -158,6 +168,47 @@ class SecretsWithFieldDescriptor(SecretsManagerBaseSettings):
     password: Annotated[str, Secrets(field="db_password")]
 
 
+many_secrets_client = SecretsClientMock(
+    {
+        "myapp/prod": json.dumps({"username": "admin"}),
+        "myapp/prod/db": json.dumps({"password": "db1234"}),
+        "myapp/prod/api": json.dumps({"key": "api1234"}),
+        "myapp/prod/queue": json.dumps({"url": "https://queue"}),
+    }
+)
+
+
+class SecretsWithManySecrets(SecretsManagerBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        secrets_name="myapp/prod",
+        secrets_client=many_secrets_client,
+    )
+
+    username: str
+    db_password: Annotated[str, Secrets(secret="myapp/prod/db", field="password")]
+    api_key: Annotated[str, Secrets(secret="myapp/prod/api", field="key")]
+    queue_url: Annotated[str, Secrets(secret="myapp/prod/queue", field="url")]
+
+
+class SecretsWithManySecretsAndVersion(SecretsWithManySecrets):
+    model_config = AWSSettingsConfigDict(
+        secrets_name="myapp/prod",
+        secrets_stage="AWSPREVIOUS",
+        secrets_client=many_secrets_client,
+    )
+
+
+class AWSWithManySecrets(AWSBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        secrets_name="myapp/prod",
+        secrets_client=many_secrets_client,
+    )
+
+    username: Annotated[str, Secrets()]
+    db_password: Annotated[str, Secrets(secret="myapp/prod/db", field="password")]
+    api_key: Annotated[str, Secrets(secret="myapp/prod/api", field="key")]
+
+
 # --- AWSBaseSettings with typed descriptors ---
 
 class AWSWithTypedDescriptors(AWSBaseSettings):
@@ -169,3 +220,278 @@ class AWSWithTypedDescriptors(AWSBaseSettings):
 
     username: Annotated[str, Secrets(field="username")]
     host: Annotated[str, SSM(name="my/host/parameter")]
+
+
+# --- Batched Parameter Store mocks ---
+
+batched_ssm_client = ClientMock(ssm_value="value")
+batched_ssm_field_client = ClientMock(ssm_value="field-value")
+
+
+class ParameterWithManyFieldsSettings(ParameterStoreBaseSettings):
+    model_config = AWSSettingsConfigDict(ssm_client=batched_ssm_client)
+
+    param_0: Annotated[str, "/my/param/0"]
+    param_1: Annotated[str, "/my/param/1"]
+    param_2: Annotated[str, "/my/param/2"]
+    param_3: Annotated[str, "/my/param/3"]
+    param_4: Annotated[str, "/my/param/4"]
+    param_5: Annotated[str, "/my/param/5"]
+    param_6: Annotated[str, "/my/param/6"]
+    param_7: Annotated[str, "/my/param/7"]
+    param_8: Annotated[str, "/my/param/8"]
+    param_9: Annotated[str, "/my/param/9"]
+    param_10: Annotated[str, SSM(name="/my/param/10")]
+    param_11: Annotated[
+        str, SSM(name="/my/param/11", client=batched_ssm_field_client)
+    ]
+
+
+class ParameterWithInvalidParameterSettings(ParameterStoreBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=ClientMock(ssm_value="value", invalid_parameters=["/my/missing"])
+    )
+
+    my_ssm: Annotated[str, "/my/missing"]
+
+
+# --- Secrets fetched once per source mocks ---
+
+counting_secrets_client = ClientMock(secret_string=secrets_with_username_and_password)
+counting_secrets_field_client = ClientMock(
+    secret_string=json.dumps({"username": "fieldusername"})
+)
+
+
+class AWSWithManySecretsFields(AWSBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=ClientMock(ssm_value="value"),
+        secrets_client=counting_secrets_client,
+        secrets_name="my/secret",
+    )
+
+    username: Annotated[str, {"service": "secrets"}]
+    password: Annotated[str, {"service": "secrets"}]
+    user: Annotated[str, Secrets(field="username")]
+    pwd: Annotated[str, Secrets(field="password")]
+    name: Annotated[str | None, Secrets()] = None
+    host: Annotated[str, {"service": "ssm"}]
+
+
+class AWSWithSecretsFieldClient(AWSBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        secrets_client=counting_secrets_client,
+        secrets_name="my/secret",
+    )
+
+    username: Annotated[str, {"service": "secrets"}]
+    password: Annotated[str, {"service": "secrets"}]
+    field_username: Annotated[
+        str, Secrets(field="username", client=counting_secrets_field_client)
+    ]
+
+
+class AWSWithoutSecretsFields(AWSBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=ClientMock(ssm_value="value"),
+        secrets_client=counting_secrets_client,
+        secrets_name="my/secret",
+    )
+
+    host: Annotated[str, {"service": "ssm"}]
+
+
+# --- Value cache mocks ---
+
+cached_ssm_client = ClientMock(ssm_value="value")
+cached_secrets_client = ClientMock(secret_string=secrets_with_username_and_password)
+
+
+class ParameterWithValueCacheSettings(ParameterStoreBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=cached_ssm_client,
+        value_cache_ttl=60,
+    )
+
+    my_ssm: Annotated[str, "/my/cached/parameter"]
+
+
+class ParameterWithoutValueCacheSettings(ParameterStoreBaseSettings):
+    model_config = AWSSettingsConfigDict(ssm_client=cached_ssm_client)
+
+    my_ssm: Annotated[str, "/my/cached/parameter"]
+
+
+class SecretsWithValueCacheSettings(SecretsManagerBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        secrets_name="my/cached/secret",
+        secrets_client=cached_secrets_client,
+        value_cache_ttl=60,
+    )
+
+    username: str
+    password: str
+
+
+class AWSWithValueCacheSettings(AWSBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=cached_ssm_client,
+        secrets_client=cached_secrets_client,
+        secrets_name="my/cached/secret",
+        value_cache_ttl=60,
+    )
+
+    username: Annotated[str, Secrets()]
+    host: Annotated[str, SSM(name="/my/cached/host")]
+
+
+# --- Concurrent resolution mocks ---
+
+resolve_barrier = threading.Barrier(3)
+
+
+class AWSWithConcurrentResolution(AWSBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=BarrierClientMock(resolve_barrier, ssm_value="value"),
+        secrets_client=BarrierClientMock(
+            resolve_barrier, secret_string=secrets_with_username_and_password
+        ),
+        secrets_name="my/secret",
+        resolve_max_workers=4,
+    )
+
+    username: Annotated[str, Secrets()]
+    host: Annotated[str, SSM(name="/my/host")]
+    other_host: Annotated[
+        str,
+        SSM(
+            name="/other/host",
+            client=BarrierClientMock(resolve_barrier, ssm_value="other"),
+        ),
+    ]
+    password: Annotated[str, {"service": "secrets"}]
+    port: Annotated[str, SSM(name="/my/port")]
+
+
+class AWSWithConcurrentErrors(AWSBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=DelayedClientErrorMock("ThrottlingException"),
+        secrets_client=DelayedClientErrorMock("ResourceNotFoundException", delay=0.2),
+        secrets_name="my/secret",
+        resolve_max_workers=4,
+    )
+
+    username: Annotated[str, Secrets()]
+    host: Annotated[str, SSM(name="/my/host")]
+
+
+class AWSWithSequentialErrors(AWSBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=DelayedClientErrorMock("ThrottlingException"),
+        secrets_client=DelayedClientErrorMock("ResourceNotFoundException"),
+        secrets_name="my/secret",
+    )
+
+    username: Annotated[str, Secrets()]
+    host: Annotated[str, SSM(name="/my/host")]
+
+
+class AWSWithInterleavedErrors(AWSBaseSettings):
+    """The SSM batch fails on ``port``, after the secret failing on ``username``."""
+
+    model_config = AWSSettingsConfigDict(
+        ssm_client=ClientMock(ssm_value="value", invalid_parameters=["/my/port"]),
+        secrets_client=ClientErrorMock("ResourceNotFoundException"),
+        secrets_name="my/secret",
+    )
+
+    host: Annotated[str, SSM(name="/my/host")]
+    username: Annotated[str, Secrets()]
+    port: Annotated[str, SSM(name="/my/port")]
+
+
+class AWSWithConcurrentInterleavedErrors(AWSWithInterleavedErrors):
+    model_config = AWSSettingsConfigDict(resolve_max_workers=4)
+
+
+# --- Parameter hierarchy mocks ---
+
+path_ssm_client = PathClientMock(
+    {
+        "/myapp/prod/app_name": "my-app",
+        "/myapp/prod/db/host": "db.example.com",
+        "/myapp/prod/db/port": "5432",
+        **{f"/myapp/prod/flags/flag_{i:02}": "on" for i in range(25)},
+    },
+    ssm_value="named",
+)
+
+
+class DatabaseParameters(BaseModel):
+    host: str
+    port: int
+
+
+class ParameterWithPathSettings(ParameterStoreBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=path_ssm_client,
+        ssm_path="/myapp/prod",
+        ssm_path_recursive=True,
+    )
+
+    app_name: str
+    db: DatabaseParameters
+    flags: dict[str, str]
+    region: Annotated[str, "/shared/region"]
+
+
+class ParameterWithNonRecursivePathSettings(ParameterStoreBaseSettings):
+    model_config = AWSSettingsConfigDict(
+        ssm_client=path_ssm_client,
+        ssm_path="/myapp/prod/",
+    )
+
+    app_name: str
+    db: DatabaseParameters | None = None
+
+
+# --- Settings class builders ---
+
+SettingsT = TypeVar("SettingsT", bound=BaseSettings)
+
+
+def make_settings(
+    base: type[SettingsT], fields: Mapping[str, Any] | None = None, **config: Any
+) -> type[SettingsT]:
+    """Define a subclass of ``base`` with the ``fields`` annotations and ``config``.
+
+    For tests whose settings use their own clients, or a fresh class per test.
+    """
+    namespace = {
+        "__module__": __name__,
+        "__qualname__": "Settings",
+        "__annotations__": dict(fields or {}),
+        "model_config": AWSSettingsConfigDict(**config),  # type: ignore[typeddict-item]
+    }
+
+    return cast(type[SettingsT], type("Settings", (base,), namespace))
+
+
+def make_parameter_settings(
+    fields: Mapping[str, Any] | None = None, **config: Any
+) -> type[ParameterStoreBaseSettings]:
+    """Define Parameter Store settings, with a ``host`` field by default."""
+    return make_settings(
+        ParameterStoreBaseSettings,
+        fields or {"host": Annotated[str, "/my/host"]},
+        **config,
+    )
+
+
+def make_secrets_settings(
+    fields: Mapping[str, Any] | None = None, **config: Any
+) -> type[SecretsManagerBaseSettings]:
+    """Define Secrets Manager settings, with a ``username`` field by default."""
+    return make_settings(
+        SecretsManagerBaseSettings, fields or {"username": str}, **config
+    )
@@ -1,20 +1,56 @@
 import os
 
+import pytest
+
+from pydantic_settings_aws import (
+    ParameterNotFoundError,
+    SecretNotFoundError,
+    value_cache,
+)
+
 from .settings_mocks import (
+    AWSWithConcurrentErrors,
+    AWSWithConcurrentInterleavedErrors,
+    AWSWithConcurrentResolution,
+    AWSWithInterleavedErrors,
+    AWSWithManySecrets,
+    AWSWithManySecretsFields,
     AWSWithNonDictMetadata,
+    AWSWithoutSecretsFields,
     AWSWithParameterAndSecretsWithDefaultBoto3Client,
     AWSWithParameterSecretsAndEnvironmentWithDefaultBoto3Client,
+    AWSWithSecretsFieldClient,
+    AWSWithSequentialErrors,
     AWSWithTypedDescriptors,
     AWSWithUnknownService,
+    AWSWithValueCacheSettings,
     MySecretsWithClientConfig,
     ParameterSettings,
+    ParameterWithInvalidParameterSettings,
+    ParameterWithManyFieldsSettings,
+    ParameterWithNonRecursivePathSettings,
     ParameterWithOptionalValueSettings,
+    ParameterWithoutValueCacheSettings,
+    ParameterWithPathSettings,
     ParameterWithSSMDescriptor,
     ParameterWithSSMDescriptorNoName,
     ParameterWithTwoSSMClientSettings,
+    ParameterWithValueCacheSettings,
     SecretsWithFieldDescriptor,
+    SecretsWithManySecrets,
+    SecretsWithManySecretsAndVersion,
     SecretsWithNestedContent,
+    SecretsWithValueCacheSettings,
+    batched_ssm_client,
+    batched_ssm_field_client,
+    cached_secrets_client,
+    cached_ssm_client,
+    counting_secrets_client,
+    counting_secrets_field_client,
     dict_secrets_with_username_and_password,
+    many_secrets_client,
+    path_ssm_client,
+    resolve_barrier,
 )
 
 
@@ -123,3 +159,210 @@ def test_aws_settings_with_typed_descriptors() -> None:
     assert my_config is not None
     assert my_config.username == dict_secrets_with_username_and_password["username"]
     assert my_config.host is not None
+
+
+def test_ssm_fields_must_be_fetched_in_batches_per_client() -> None:
+    batched_ssm_client.get_parameters_calls.clear()
+    batched_ssm_field_client.get_parameters_calls.clear()
+
+    my_config = ParameterWithManyFieldsSettings()  # type: ignore[call-arg]
+
+    assert my_config.param_0 == "value"
+    assert my_config.param_10 == "value"
+    assert my_config.param_11 == "field-value"
+    assert [len(call) for call in batched_ssm_client.get_parameters_calls] == [10, 1]
+    assert batched_ssm_field_client.get_parameters_calls == [["/my/param/11"]]
+
+
+def test_ssm_invalid_parameters_must_raise_parameter_not_found_error() -> None:
+    with pytest.raises(ParameterNotFoundError):
+        ParameterWithInvalidParameterSettings()  # type: ignore[call-arg]
+
+
+def test_aws_settings_must_fetch_the_secret_once_per_build() -> None:
+    counting_secrets_client.get_secret_value_calls = 0
+
+    my_config = AWSWithManySecretsFields()  # type: ignore[call-arg]
+
+    assert my_config.username == dict_secrets_with_username_and_password["username"]
+    assert my_config.pwd == dict_secrets_with_username_and_password["password"]
+    assert counting_secrets_client.get_secret_value_calls == 1
+
+    AWSWithManySecretsFields()  # type: ignore[call-arg]
+
+    assert counting_secrets_client.get_secret_value_calls == 2
+
+
+def test_aws_settings_must_fetch_the_secret_once_per_client() -> None:
+    counting_secrets_client.get_secret_value_calls = 0
+    counting_secrets_field_client.get_secret_value_calls = 0
+
+    my_config = AWSWithSecretsFieldClient()  # type: ignore[call-arg]
+
+    assert my_config.username == dict_secrets_with_username_and_password["username"]
+    assert my_config.field_username == "fieldusername"
+    assert counting_secrets_client.get_secret_value_calls == 1
+    assert counting_secrets_field_client.get_secret_value_calls == 1
+
+
+def test_aws_settings_must_not_fetch_secrets_without_secrets_fields() -> None:
+    counting_secrets_client.get_secret_value_calls = 0
+
+    AWSWithoutSecretsFields()  # type: ignore[call-arg]
+
+    assert counting_secrets_client.get_secret_value_calls == 0
+
+
+def test_value_cache_must_reuse_parameters_across_instantiations() -> None:
+    value_cache.clear()
+    cached_ssm_client.get_parameters_calls.clear()
+
+    ParameterWithValueCacheSettings()  # type: ignore[call-arg]
+    my_config = ParameterWithValueCacheSettings()  # type: ignore[call-arg]
+
+    assert my_config.my_ssm == "value"
+    assert cached_ssm_client.get_parameters_calls == [["/my/cached/parameter"]]
+
+
+def test_value_cache_must_be_opt_in() -> None:
+    value_cache.clear()
+    cached_ssm_client.get_parameters_calls.clear()
+
+    ParameterWithoutValueCacheSettings()  # type: ignore[call-arg]
+    ParameterWithoutValueCacheSettings()  # type: ignore[call-arg]
+
+    assert len(cached_ssm_client.get_parameters_calls) == 2
+    assert len(value_cache) == 0
+
+
+def test_value_cache_must_reuse_secrets_across_instantiations() -> None:
+    value_cache.clear()
+    cached_secrets_client.get_secret_value_calls = 0
+
+    SecretsWithValueCacheSettings()  # type: ignore[call-arg]
+    my_config = SecretsWithValueCacheSettings()  # type: ignore[call-arg]
+
+    assert my_config.username == dict_secrets_with_username_and_password["username"]
+    assert cached_secrets_client.get_secret_value_calls == 1
+
+
+def test_value_cache_must_refetch_invalidated_values() -> None:
+    value_cache.clear()
+    cached_secrets_client.get_secret_value_calls = 0
+    cached_ssm_client.get_parameters_calls.clear()
+
+    AWSWithValueCacheSettings()  # type: ignore[call-arg]
+    value_cache.invalidate(name="my/cached/secret")
+    AWSWithValueCacheSettings()  # type: ignore[call-arg]
+
+    assert cached_secrets_client.get_secret_value_calls == 2
+    assert cached_ssm_client.get_parameters_calls == [["/my/cached/host"]]
+
+
+def test_aws_settings_must_fetch_distinct_sources_concurrently() -> None:
+    resolve_barrier.reset()
+
+    my_config = AWSWithConcurrentResolution()  # type: ignore[call-arg]
+
+    assert my_config.username == dict_secrets_with_username_and_password["username"]
+    assert my_config.password == dict_secrets_with_username_and_password["password"]
+    assert my_config.host == "value"
+    assert my_config.port == "value"
+    assert my_config.other_host == "other"
+
+
+def test_aws_settings_concurrent_errors_must_follow_field_order() -> None:
+    with pytest.raises(SecretNotFoundError):
+        AWSWithConcurrentErrors()  # type: ignore[call-arg]
+
+
+def test_aws_settings_sequential_errors_must_follow_field_order() -> None:
+    with pytest.raises(SecretNotFoundError):
+        AWSWithSequentialErrors()  # type: ignore[call-arg]
+
+
+@pytest.mark.parametrize(
+    "settings_cls", [AWSWithInterleavedErrors, AWSWithConcurrentInterleavedErrors]
+)
+def test_aws_settings_errors_must_follow_the_first_failing_field(
+    settings_cls: type[AWSWithInterleavedErrors],
+) -> None:
+    with pytest.raises(SecretNotFoundError):
+        settings_cls()  # type: ignore[call-arg]
+
+
+def test_ssm_path_must_map_the_subtree_to_fields_and_nested_models() -> None:
+    path_ssm_client.get_parameters_by_path_calls.clear()
+    path_ssm_client.get_parameters_calls.clear()
+
+    my_config = ParameterWithPathSettings()  # type: ignore[call-arg]
+
+    assert my_config.app_name == "my-app"
+    assert my_config.db.host == "db.example.com"
+    assert my_config.db.port == 5432
+    assert len(my_config.flags) == 25
+    assert my_config.region == "named"
+    assert len(path_ssm_client.get_parameters_by_path_calls) == 3
+    assert path_ssm_client.get_parameters_calls == [["/shared/region"]]
+
+
+def test_ssm_path_must_only_read_direct_children_when_not_recursive() -> None:
+    path_ssm_client.get_parameters_by_path_calls.clear()
+
+    my_config = ParameterWithNonRecursivePathSettings()  # type: ignore[call-arg]
+
+    assert my_config.app_name == "my-app"
+    assert my_config.db is None
+    assert path_ssm_client.get_parameters_by_path_calls == [
+        {"Path": "/myapp/prod/", "Recursive": False, "NextToken": None}
+    ]
+
+
+def test_secrets_settings_must_read_every_secret_in_one_batch() -> None:
+    many_secrets_client.batch_get_secret_value_calls.clear()
+    many_secrets_client.get_secret_value_calls = 0
+
+    my_config = SecretsWithManySecrets()  # type: ignore[call-arg]
+
+    assert my_config.username == "admin"
+    assert my_config.db_password == "db1234"
+    assert my_config.api_key == "api1234"
+    assert my_config.queue_url == "https://queue"
+    assert many_secrets_client.batch_get_secret_value_calls == [
+        {
+            "SecretIdList": [
+                "myapp/prod",
+                "myapp/prod/db",
+                "myapp/prod/api",
+                "myapp/prod/queue",
+            ],
+            "NextToken": None,
+        }
+    ]
+    assert many_secrets_client.get_secret_value_calls == 0
+
+
+def test_secrets_settings_must_read_a_versioned_secret_outside_the_batch() -> None:
+    many_secrets_client.batch_get_secret_value_calls.clear()
+    many_secrets_client.get_secret_value_calls = 0
+
+    my_config = SecretsWithManySecretsAndVersion()  # type: ignore[call-arg]
+
+    assert my_config.username == "admin"
+    assert many_secrets_client.get_secret_value_calls == 1
+    assert many_secrets_client.batch_get_secret_value_calls[0]["SecretIdList"] == [
+        "myapp/prod/db",
+        "myapp/prod/api",
+        "myapp/prod/queue",
+    ]
+
+
+def test_aws_settings_must_read_fields_of_other_secrets() -> None:
+    many_secrets_client.get_secret_value_calls = 0
+
+    my_config = AWSWithManySecrets()  # type: ignore[call-arg]
+
+    assert my_config.username == "admin"
+    assert my_config.db_password == "db1234"
+    assert my_config.api_key == "api1234"
+    assert many_secrets_client.get_secret_value_calls == 3
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+
+from pydantic_settings_aws import SingleFlight, SingleFlightStats
+
+
+def run_concurrently(flight: SingleFlight, count: int, function: object) -> list[object]:
+    """Call ``flight.do`` from ``count`` threads, returning their results or errors."""
+    results: list[object] = [None] * count
+
+    def run(index: int) -> None:
+        try:
+            results[index] = flight.do("key", function)  # type: ignore[arg-type]
+        # errors are returned to the test as results
+        except Exception as e:  # noqa: BLE001
+            results[index] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    return results
+
+
+def wait_for_followers(flight: SingleFlight, count: int) -> None:
+    while flight.stats().coalesced < count:
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_must_share_the_result() -> None:
+    flight = SingleFlight()
+    calls: list[int] = []
+
+    def function() -> object:
+        calls.append(1)
+        wait_for_followers(flight, 7)
+        return object()
+
+    results = run_concurrently(flight, 8, function)
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == SingleFlightStats(calls=1, coalesced=7)
+
+
+def test_concurrent_calls_must_share_the_error() -> None:
+    flight = SingleFlight()
+    error = ValueError("failed")
+
+    def function() -> object:
+        wait_for_followers(flight, 3)
+        raise error
+
+    assert run_concurrently(flight, 4, function) == [error] * 4
+
+
+def test_results_must_not_be_cached() -> None:
+    flight = SingleFlight()
+    values = iter([1, 2])
+
+    assert flight.do("key", lambda: next(values)) == 1
+    assert flight.do("key", lambda: next(values)) == 2
+    assert flight.stats() == SingleFlightStats(calls=2, coalesced=0)
+
+
+def test_errors_must_not_be_cached() -> None:
+    flight = SingleFlight()
+
+    def fail() -> int:
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_different_keys_must_not_be_coalesced() -> None:
+    flight = SingleFlight()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run(key: str) -> None:
+        flight.do(key, barrier.wait)
+
+    threads = [threading.Thread(target=run, args=(key,)) for key in ("a", "b")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert flight.stats() == SingleFlightStats(calls=2, coalesced=0)
+    flight.reset()
+    assert flight.stats() == SingleFlightStats(calls=0, coalesced=0)
@@ -0,0 +1,269 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from pydantic_settings_aws import (
+    AWSSettingsConfigError,
+    ParameterNotFoundError,
+    ParameterStoreBaseSettings,
+    SnapshotStore,
+    snapshot_metrics,
+)
+from pydantic_settings_aws.snapshot import (
+    SNAPSHOT_KEY_ENV,
+    _revalidation_tasks,
+    get_snapshot_store,
+)
+from pydantic_settings_aws.sources import (
+    AsyncSecretsManagerSettingsSource,
+)
+
+from .boto3_mocks import ClientErrorMock, ClientMock
+from .settings_mocks import make_parameter_settings, make_secrets_settings
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Switch:
+    """Delegates to a client that can be swapped between instantiations."""
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+
+@pytest.fixture(autouse=True)
+def snapshot_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(SNAPSHOT_KEY_ENV, "a very secret snapshot key")
+    snapshot_metrics.reset()
+
+
+def wait_for_revalidations(count: int) -> None:
+    deadline = time.monotonic() + 5
+    while snapshot_metrics.stats().revalidations < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_snapshot_store_must_round_trip_values(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path, b"key", clock=FakeClock())
+    settings_cls = make_parameter_settings(
+        ssm_client=ClientMock(), snapshot_dir=str(tmp_path)
+    )
+    store.write(settings_cls, "ssm", {"host": "localhost"})
+
+    snapshot = store.read(settings_cls, "ssm")
+
+    assert snapshot is not None
+    assert snapshot.values == {"host": "localhost"}
+    assert store.age(snapshot) == 0
+    assert b"localhost" not in store.get_path(settings_cls, "ssm").read_bytes()
+
+
+def test_snapshot_store_must_not_read_snapshots_of_other_keys_or_classes(
+    tmp_path: Path,
+) -> None:
+    store = SnapshotStore(tmp_path, b"key")
+    settings_cls = make_parameter_settings(
+        ssm_client=ClientMock(), snapshot_dir=str(tmp_path)
+    )
+
+    class OtherSettings(ParameterStoreBaseSettings):
+        host: str
+
+    store.write(settings_cls, "ssm", {"host": "localhost"})
+    store.get_path(settings_cls, "ssm").rename(store.get_path(OtherSettings, "ssm"))
+
+    assert store.read(OtherSettings, "ssm") is None
+    assert SnapshotStore(tmp_path, b"other key").read(OtherSettings, "ssm") is None
+    assert snapshot_metrics.stats().errors == 2
+
+
+def test_snapshot_store_must_log_values_that_cannot_be_serialized(
+    tmp_path: Path,
+) -> None:
+    store = SnapshotStore(tmp_path, b"key")
+    settings_cls = make_parameter_settings(
+        ssm_client=ClientMock(), snapshot_dir=str(tmp_path)
+    )
+
+    store.write(settings_cls, "ssm", {"host": object()})
+
+    assert store.read(settings_cls, "ssm") is None
+    assert snapshot_metrics.stats().errors == 1
+
+
+def test_fresh_snapshot_must_be_used_and_revalidated(tmp_path: Path) -> None:
+    client = ClientMock(ssm_value="host-2")
+    settings_cls = make_parameter_settings(
+        ssm_client=client, snapshot_dir=str(tmp_path), snapshot_ttl=60
+    )
+    # left by an earlier process
+    store = get_snapshot_store(settings_cls)
+    assert store is not None
+    store.write(settings_cls, "ssm", {"host": "host-1"})
+
+    assert settings_cls().host == "host-1"  # type: ignore[attr-defined]
+    wait_for_revalidations(1)
+    assert settings_cls().host == "host-2"  # type: ignore[attr-defined]
+    assert snapshot_metrics.stats().misses == 0
+    assert snapshot_metrics.stats().hits == 2
+
+
+def test_fresh_snapshot_must_be_revalidated_once_per_process(
+    tmp_path: Path,
+) -> None:
+    client = ClientMock(ssm_value="host")
+    settings_cls = make_parameter_settings(
+        ssm_client=client, snapshot_dir=str(tmp_path), snapshot_ttl=60
+    )
+    store = get_snapshot_store(settings_cls)
+    assert store is not None
+    store.write(settings_cls, "ssm", {"host": "host"})
+
+    for _ in range(5):
+        settings_cls()
+    wait_for_revalidations(1)
+
+    assert len(client.get_parameters_calls) == 1
+    assert snapshot_metrics.stats().hits == 5
+
+
+def test_snapshot_written_by_the_process_must_not_be_revalidated(
+    tmp_path: Path,
+) -> None:
+    client = ClientMock(ssm_value="host")
+    settings_cls = make_parameter_settings(
+        ssm_client=client, snapshot_dir=str(tmp_path), snapshot_ttl=60
+    )
+
+    for _ in range(5):
+        settings_cls()
+
+    assert len(client.get_parameters_calls) == 1
+    assert snapshot_metrics.stats().misses == 1
+    assert snapshot_metrics.stats().revalidations == 0
+
+
+def test_stale_snapshot_must_be_fetched_again(tmp_path: Path) -> None:
+    client = ClientMock(ssm_value="host-1")
+    settings_cls = make_parameter_settings(
+        ssm_client=client, snapshot_dir=str(tmp_path), snapshot_ttl=0
+    )
+    settings_cls()
+    client.ssm_value = "host-2"
+
+    assert settings_cls().host == "host-2"  # type: ignore[attr-defined]
+    assert len(client.get_parameters_calls) == 2
+    assert snapshot_metrics.stats().misses == 2
+
+
+def test_stale_snapshot_must_be_used_when_aws_is_unreachable(tmp_path: Path) -> None:
+    client = Switch(ClientMock(ssm_value="host-1"))
+    settings_cls = make_parameter_settings(
+        ssm_client=client, snapshot_dir=str(tmp_path), snapshot_ttl=0
+    )
+    settings_cls()
+    client.client = ClientErrorMock("ThrottlingException")
+
+    assert settings_cls().host == "host-1"  # type: ignore[attr-defined]
+    assert snapshot_metrics.stats().fallbacks == 1
+
+
+def test_snapshot_older_than_max_staleness_must_not_be_used(tmp_path: Path) -> None:
+    client = Switch(ClientMock(ssm_value="host-1"))
+    settings_cls = make_parameter_settings(
+        ssm_client=client,
+        snapshot_dir=str(tmp_path),
+        snapshot_ttl=0,
+        snapshot_max_staleness=0,
+    )
+    settings_cls()
+    client.client = ClientErrorMock("ThrottlingException")
+
+    with pytest.raises(Exception, match="ThrottlingException"):
+        settings_cls()
+
+
+def test_snapshot_must_not_hide_missing_parameters(tmp_path: Path) -> None:
+    client = Switch(ClientMock(ssm_value="host-1"))
+    settings_cls = make_parameter_settings(
+        ssm_client=client, snapshot_dir=str(tmp_path), snapshot_ttl=0
+    )
+    settings_cls()
+    client.client = ClientMock(invalid_parameters=["/my/host"])
+
+    with pytest.raises(ParameterNotFoundError):
+        settings_cls()
+
+
+def test_snapshot_key_provider_must_be_called_once(tmp_path: Path) -> None:
+    calls: list[int] = []
+
+    def decrypt_data_key() -> bytes:
+        calls.append(1)
+        return b"decrypted data key"
+
+    settings_cls = make_parameter_settings(
+        ssm_client=ClientMock(ssm_value="host"),
+        snapshot_dir=str(tmp_path),
+        snapshot_key=decrypt_data_key,
+    )
+    settings_cls()
+    settings_cls()
+
+    assert calls == [1]
+
+
+def test_snapshot_dir_without_key_must_raise(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv(SNAPSHOT_KEY_ENV)
+    settings_cls = make_parameter_settings(
+        ssm_client=ClientMock(ssm_value="host"), snapshot_dir=str(tmp_path)
+    )
+
+    with pytest.raises(AWSSettingsConfigError):
+        settings_cls()
+
+
+def test_async_sources_must_use_snapshots(tmp_path: Path) -> None:
+    client = ClientMock(secret_string=json.dumps({"password": "old"}))
+
+    Settings = make_secrets_settings(
+        {"password": str},
+        secrets_name="my/secret",
+        secrets_client=client,
+        snapshot_dir=str(tmp_path),
+        snapshot_ttl=60,
+    )
+
+    store = get_snapshot_store(Settings)
+    assert store is not None
+    store.write(Settings, "secrets", {"password": "old"})
+
+    async def aload() -> dict[str, Any]:
+        values = await AsyncSecretsManagerSettingsSource(Settings).aload()
+        await asyncio.gather(*_revalidation_tasks)
+        return values
+
+    client.secret_string = json.dumps({"password": "new"})
+
+    assert asyncio.run(aload()) == {"password": "old"}
+    assert asyncio.run(aload()) == {"password": "new"}
+    assert asyncio.run(aload()) == {"password": "new"}
+    assert client.get_secret_value_calls == 1
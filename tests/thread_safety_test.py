@@ -1,13 +1,22 @@
+import json
 import sys
 import threading
+from typing import Annotated, Any
 from unittest import mock
 
 import pytest
 
-from pydantic_settings_aws import aws
+from pydantic_settings_aws import (
+    AWSSettingsConfigDict,
+    ParameterStoreBaseSettings,
+    SecretNotFoundError,
+    SecretsManagerBaseSettings,
+    aws,
+    single_flight,
+)
 
 from .aws_mocks import TARGET_SESSION, BaseSettingsMock
-from .boto3_mocks import SessionMock
+from .boto3_mocks import SessionMock, WaitingClientMock
 
 
 def test_is_free_threaded() -> None:
@@ -19,7 +28,7 @@ def test_is_free_threaded() -> None:
 
 @mock.patch(TARGET_SESSION, SessionMock)
 def test_client_cache_concurrent_access() -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     errors: list[Exception] = []
 
     def create_client() -> None:
@@ -37,12 +46,12 @@ def test_client_cache_concurrent_access() -> None:
         t.join()
 
     assert not errors
-    assert len(aws._client_cache) == 1
+    assert len(aws.client_pool) == 1
 
 
 @mock.patch(TARGET_SESSION, SessionMock)
 def test_client_cache_concurrent_access_multiple_services() -> None:
-    aws._client_cache = {}
+    aws.client_pool.clear()
     errors: list[Exception] = []
 
     def create_ssm_client() -> None:
@@ -71,4 +80,80 @@ def test_client_cache_concurrent_access_multiple_services() -> None:
         t.join()
 
     assert not errors
-    assert len(aws._client_cache) == 2
+    assert len(aws.client_pool) == 2
+
+
+def build_concurrently(settings_cls: Any, count: int) -> list[Any]:
+    """Instantiate ``settings_cls`` from ``count`` threads, returning the instances or errors."""
+    barrier = threading.Barrier(count)
+    results: list[Any] = [None] * count
+
+    def build(index: int) -> None:
+        barrier.wait(timeout=5)
+        try:
+            results[index] = settings_cls()
+        # errors are returned to the test as results
+        except Exception as e:  # noqa: BLE001
+            results[index] = e
+
+    threads = [threading.Thread(target=build, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    return results
+
+
+def all_coalesced(count: int) -> bool:
+    return single_flight.stats().coalesced >= count - 1
+
+
+def test_concurrent_secret_fetches_must_be_coalesced() -> None:
+    single_flight.reset()
+    client = WaitingClientMock(
+        lambda: all_coalesced(64), secret_string=json.dumps({"username": "admin"})
+    )
+
+    class Settings(SecretsManagerBaseSettings):
+        model_config = AWSSettingsConfigDict(secrets_name="my/secret", secrets_client=client)
+
+        username: str
+
+    results = build_concurrently(Settings, 64)
+
+    assert client.calls == 1
+    assert [settings.username for settings in results] == ["admin"] * 64
+
+
+def test_concurrent_parameter_fetches_must_be_coalesced() -> None:
+    single_flight.reset()
+    client = WaitingClientMock(lambda: all_coalesced(32), ssm_value="value")
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=client)
+
+        host: Annotated[str, "/my/host"]
+        port: Annotated[str, "/my/port"]
+
+    results = build_concurrently(Settings, 32)
+
+    assert client.calls == 1
+    assert all(settings.host == settings.port == "value" for settings in results)
+
+
+def test_coalesced_fetches_must_share_the_error() -> None:
+    single_flight.reset()
+    client = WaitingClientMock(
+        lambda: all_coalesced(32), error_code="ResourceNotFoundException"
+    )
+
+    class Settings(SecretsManagerBaseSettings):
+        model_config = AWSSettingsConfigDict(secrets_name="my/secret", secrets_client=client)
+
+        username: str
+
+    results = build_concurrently(Settings, 32)
+
+    assert client.calls == 1
+    assert all(isinstance(error, SecretNotFoundError) for error in results)
@@ -0,0 +1,217 @@
+import asyncio
+import json
+import random
+from typing import Annotated, Any
+
+import pytest
+from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+
+from pydantic_settings_aws import (
+    AWSSettingsConfigDict,
+    ParameterNotFoundError,
+    ParameterStoreBaseSettings,
+    Throttler,
+    aws,
+    throttling,
+)
+from pydantic_settings_aws.throttling import ThrottleConfig
+
+from .boto3_mocks import ClientMock
+from .settings_mocks import make_secrets_settings
+
+
+class FakeClock:
+    """Monotonic clock that only moves when slept on."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def asleep(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+class ThrottledClientMock(ClientMock):
+    """ClientMock throttled on the first ``throttled`` calls."""
+
+    def __init__(self, throttled: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.throttled = throttled
+        self.calls = 0
+
+    def get_parameters(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls += 1
+        if self.calls <= self.throttled:
+            raise ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+                "GetParameters",
+            )
+
+        return super().get_parameters(**kwargs)
+
+
+def make_config(**options: Any) -> ThrottleConfig:
+    defaults: dict[str, Any] = {
+        "rate": None,
+        "burst": 1.0,
+        "max_attempts": 1,
+        "backoff_base": 0.1,
+        "backoff_cap": 20.0,
+        "startup_jitter": 0.0,
+    }
+    return ThrottleConfig(**{**defaults, **options})
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(
+        throttling,
+        "throttler",
+        Throttler(clock=clock, sleep=clock.sleep, asleep=clock.asleep, rng=random.Random(0)),
+    )
+    return clock
+
+
+def test_token_bucket_must_spread_requests_over_time(clock: FakeClock) -> None:
+    config = make_config(rate=2.0, burst=2.0)
+    key = ("session", "ssm")
+
+    delays = [throttling.throttler.get_delay(key, config) for _ in range(5)]
+
+    assert delays == [0.0, 0.0, 0.5, 1.0, 1.5]
+
+    clock.now = 10
+
+    assert throttling.throttler.get_delay(key, config) == 0.0
+
+
+def test_token_buckets_must_be_per_session_and_service(clock: FakeClock) -> None:
+    config = make_config(rate=1.0)
+
+    assert throttling.throttler.get_delay(("a", "ssm"), config) == 0.0
+    assert throttling.throttler.get_delay(("a", "secretsmanager"), config) == 0.0
+    assert throttling.throttler.get_delay(("b", "ssm"), config) == 0.0
+    assert throttling.throttler.get_delay(("a", "ssm"), config) == 1.0
+
+
+def test_backoff_must_use_full_jitter_capped_exponential_delays(clock: FakeClock) -> None:
+    config = make_config(backoff_base=1.0, backoff_cap=5.0)
+
+    for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)]:
+        backoffs = [throttling.throttler.get_backoff(config, attempt) for _ in range(50)]
+        assert all(0 <= backoff <= ceiling for backoff in backoffs)
+        assert max(backoffs) > ceiling / 2
+
+
+def test_startup_jitter_must_delay_the_first_requests(clock: FakeClock) -> None:
+    config = make_config(startup_jitter=30.0)
+    key = ("session", "ssm")
+
+    first = throttling.throttler.get_delay(key, config)
+    second = throttling.throttler.get_delay(key, config)
+    clock.now = 30
+
+    assert 0 < first <= 30
+    assert second == first
+    assert throttling.throttler.get_delay(key, config) == 0.0
+
+
+def test_throttled_requests_must_be_retried(clock: FakeClock) -> None:
+    client = ThrottledClientMock(throttled=2, ssm_value="value")
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=client, throttle_max_attempts=3)
+
+        host: Annotated[str, "/my/host"]
+
+    assert Settings().host == "value"  # type: ignore[call-arg]
+    assert client.calls == 3
+    assert len(clock.sleeps) == 2
+    assert throttling.throttler.stats().retried == 2
+
+
+def test_throttling_errors_must_be_raised_after_max_attempts(clock: FakeClock) -> None:
+    client = ThrottledClientMock(throttled=5, ssm_value="value")
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=client, throttle_max_attempts=2)
+
+        host: Annotated[str, "/my/host"]
+
+    with pytest.raises(ClientError, match="ThrottlingException"):
+        Settings()  # type: ignore[call-arg]
+
+    assert client.calls == 2
+
+
+def test_other_errors_must_not_be_retried(clock: FakeClock) -> None:
+    client = ClientMock(invalid_parameters=["/my/host"])
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(ssm_client=client, throttle_max_attempts=3)
+
+        host: Annotated[str, "/my/host"]
+
+    with pytest.raises(ParameterNotFoundError):
+        Settings()  # type: ignore[call-arg]
+
+    assert len(client.get_parameters_calls) == 1
+    assert clock.sleeps == []
+
+
+def test_rate_limit_must_be_shared_by_settings_classes(clock: FakeClock) -> None:
+    client = ClientMock(secret_string=json.dumps({"username": "admin"}))
+
+    for _ in range(3):
+        make_secrets_settings(
+            secrets_name="my/secret", secrets_client=client, throttle_rate=1
+        )()  # type: ignore[call-arg]
+
+    assert clock.sleeps == [1.0, 1.0]
+
+
+def test_async_requests_must_be_throttled(clock: FakeClock) -> None:
+    client = ThrottledClientMock(throttled=1, ssm_value="value")
+
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            ssm_client=client, throttle_max_attempts=2, throttle_startup_jitter=5
+        )
+
+        host: Annotated[str, "/my/host"]
+
+    settings = asyncio.run(Settings.aload())
+
+    assert settings.host == "value"
+    assert client.calls == 2
+    assert len(clock.sleeps) == 2
+
+
+def test_throttling_must_be_disabled_by_default() -> None:
+    class Settings(ParameterStoreBaseSettings):
+        pass
+
+    assert throttling.get_throttle_config(Settings) is None
+
+
+def test_throttling_retries_must_turn_off_botocore_retries() -> None:
+    class Settings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(throttle_max_attempts=5)
+
+    class BotocoreSettings(ParameterStoreBaseSettings):
+        model_config = AWSSettingsConfigDict(
+            throttle_max_attempts=5, client_max_attempts=3
+        )
+
+    assert aws.get_client_config_args(Settings) == {"retries": {"max_attempts": 1}}
+    assert aws.get_client_config_args(BotocoreSettings) == {
+        "retries": {"max_attempts": 3}
+    }
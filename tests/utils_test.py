@@ -64,3 +64,62 @@ def test_get_secrets_field_name_falls_back_to_default() -> None:
     assert utils.get_secrets_field_name([], "password") == "password"
     assert utils.get_secrets_field_name([Secrets()], "password") == "password"
     assert utils.get_secrets_field_name([{"service": "secrets"}], "password") == "password"
+
+
+def test_get_secrets_client_from_annotated_field() -> None:
+    client = object()
+
+    assert utils.get_secrets_client_from_annotated_field([Secrets(client=client)]) is client
+    assert utils.get_secrets_client_from_annotated_field([Secrets()]) is None
+    assert utils.get_secrets_client_from_annotated_field([{"service": "secrets"}]) is None
+
+
+def test_secrets_must_keep_its_positional_field_and_client() -> None:
+    client = object()
+    metadata = [Secrets("db_password", client)]
+
+    assert utils.get_secrets_field_name(metadata, "password") == "db_password"
+    assert utils.get_secrets_client_from_annotated_field(metadata) is client
+    assert utils.get_secret_name_from_annotated_field(metadata) is None
+
+
+def test_get_field_group() -> None:
+    assert utils.get_field_group([SSM(name="/my/param", group="db")]) == "db"
+    assert utils.get_field_group([Secrets(group="db")]) == "db"
+    assert utils.get_field_group([{"ssm": "/my/param", "group": "db"}]) == "db"
+    assert utils.get_field_group([SSM(name="/my/param"), "/my/param"]) is None
+
+
+def test_get_secret_name_from_annotated_field() -> None:
+    assert utils.get_secret_name_from_annotated_field([Secrets(secret="my/db")]) == "my/db"
+    assert utils.get_secret_name_from_annotated_field([Secrets(field="password")]) is None
+    assert utils.get_secret_name_from_annotated_field([{"service": "secrets"}]) is None
+
+
+def test_is_ssm_path_field() -> None:
+    assert utils.is_ssm_path_field(None)
+    assert utils.is_ssm_path_field(SSM())
+    assert not utils.is_ssm_path_field(SSM(name="/my/param"))
+    assert not utils.is_ssm_path_field("/my/param")
+
+
+def test_get_ssm_path_tree_must_nest_parameters_by_segment() -> None:
+    contents: dict[str, str | None] = {
+        "/myapp/prod/name": "my-app",
+        "/myapp/prod/db": "ignored",
+        "/myapp/prod/db/host": "localhost",
+        "/other/name": "other",
+    }
+
+    tree = utils.get_ssm_path_tree("/myapp/prod/", contents)
+
+    assert tree == {"name": "my-app", "db": {"host": "localhost"}}
+
+
+def test_get_prefixed_ssm_name() -> None:
+    arn = "arn:aws:ssm:us-east-1:123456789012:parameter/db/host"
+
+    assert utils.get_prefixed_ssm_name("/tenants/acme/", "/db/host") == "/tenants/acme/db/host"
+    assert utils.get_prefixed_ssm_name("/tenants/acme", "db_host") == "/tenants/acme/db_host"
+    assert utils.get_prefixed_ssm_name("/tenants/acme", arn) == arn
+    assert utils.get_prefixed_ssm_name(None, "/db/host") == "/db/host"